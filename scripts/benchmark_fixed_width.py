@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Benchmark fixed-width engines (line, bytes, numpy) on a generated file.
+
+Usage: python scripts/benchmark_fixed_width.py [rows] [--write]
+
+Without --write the run is a dry run (parsing, casting and validation only).
+Each engine's output CSVs (row counts in a dry run) are compared with those
+of the line engine; the script exits with status 1 on any difference.
+"""
+
+import filecmp
+import json
+import logging
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from multi_format_parser.orchestrator import parse_files
+
+FIELDS = [
+    {"name": "Type", "start": 0, "width": 1},
+    {"name": "StoreID", "start": 1, "width": 6},
+    {"name": "Register", "start": 7, "width": 3, "type": "int"},
+    {"name": "TxnNumber", "start": 10, "width": 10, "type": "int", "nullable": False},
+    {"name": "Item", "start": 20, "width": 20},
+    {"name": "Quantity", "start": 40, "width": 6, "type": "int", "min_value": 0},
+    {"name": "Price", "start": 46, "width": 10, "type": "float", "min_value": 0},
+    {"name": "Amount", "start": 56, "width": 12, "type": "decimal"},
+    {"name": "Cashier", "start": 68, "width": 12},
+]
+
+
+def write_input(path: Path, rows: int) -> None:
+    """Write ``rows`` detail lines of the layout above."""
+    with open(path, "w", encoding="latin-1") as f:
+        for i in range(rows):
+            f.write(f"D{'S%05d' % (i % 977):<6}{i % 40:>3}{i:>10}{'ITEM-%08d' % (i % 50021):<20}"
+                    f"{i % 12:>6}{(i % 5000) / 100:>10.2f}{(i % 99991) / 100:>12.2f}{'CASHIER%02d' % (i % 37):<12}\n")
+
+
+def compare_outputs(expected_dir: Path, actual_dir: Path) -> list:
+    """Return the names of CSV files that differ or exist in only one of two output directories."""
+    expected = {path.name for path in expected_dir.glob("*.csv")}
+    actual = {path.name for path in actual_dir.glob("*.csv")}
+    return sorted((expected ^ actual) | {name for name in expected & actual
+                                         if not filecmp.cmp(expected_dir / name, actual_dir / name, shallow=False)})
+
+
+def main() -> int:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 and sys.argv[1].isdigit() else 1_000_000
+    dry_run = "--write" not in sys.argv
+    logging.disable(logging.INFO)
+
+    tmpdir = Path(tempfile.mkdtemp())
+    try:
+        input_file = tmpdir / "tlog.txt"
+        write_input(input_file, rows)
+        size_mb = input_file.stat().st_size / 1e6
+        print(f"{rows:,} rows, {size_mb:.1f} MB, {'dry run' if dry_run else 'writing CSV'}")
+
+        baseline = None
+        reference = None  # Row counts of the line engine
+        failed = False
+        for engine in ("line", "bytes", "numpy"):
+            config = {
+                "format_type": "fixed_width",
+                "fixed_width_encoding": "latin-1",
+                "fixed_width_engine": engine,
+                "records": [{"name": "Detail", "record_type_field": "Type", "record_type_value": "D",
+                             "fields": FIELDS}]
+            }
+            config_file = tmpdir / f"config_{engine}.json"
+            config_file.write_text(json.dumps(config))
+
+            start = time.perf_counter()
+            _, record_stats, file_errors = parse_files(config_file, [input_file], tmpdir / engine, dry_run=dry_run)
+            elapsed = time.perf_counter() - start
+            if file_errors:
+                print(f"{engine:>6}: failed: {file_errors}")
+                failed = True
+                continue
+            baseline = baseline or elapsed
+            print(f"{engine:>6}: {elapsed:7.2f}s  {rows / elapsed:>12,.0f} rows/s  "
+                  f"x{baseline / elapsed:.1f}  ({record_stats['Detail'].success_rows:,} rows)")
+
+            counts = {name: (s.total_rows, s.success_rows, s.failed_rows, s.skipped_rows, s.validation_errors)
+                      for name, s in record_stats.items()}
+            if engine == "line":
+                reference = counts
+            elif counts != reference:
+                print(f"{engine:>6}: row counts differ from the line engine: {counts} != {reference}")
+                failed = True
+            elif not dry_run:
+                mismatched = compare_outputs(tmpdir / "line", tmpdir / engine)
+                if mismatched:
+                    print(f"{engine:>6}: output differs from the line engine: {', '.join(mismatched)}")
+                    failed = True
+    finally:
+        shutil.rmtree(tmpdir)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
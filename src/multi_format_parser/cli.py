@@ -75,7 +75,10 @@ Examples:
         if stats:
             logger.info("Row Counts:")
             for table in sorted(stats.keys()):
-                logger.info(f"  {table}: {stats[table]:,}")
+                value = stats[table]
+                if isinstance(value, dict):
+                    continue  # Diagnostics are logged by parse_files
+                logger.info(f"  {table}: {value:,}" if isinstance(value, (int, float)) else f"  {table}: {value}")
 
         if record_stats:
             logger.info("Performance Metrics:")
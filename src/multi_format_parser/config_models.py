@@ -5,10 +5,12 @@ This module replaces dict-based config with validated, type-safe models.
 """
 
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from multi_format_parser.json_utils import split_wildcard_selector
+
 
 class FormatType(str, Enum):
     """Supported file format types."""
@@ -31,6 +33,9 @@ class FieldType(str, Enum):
     DATETIME = "datetime"
     COMPUTED = "computed"
     JSON = "json"  # XML/JSON structure serialized as JSON string
+    COMP3 = "comp3"  # Packed decimal (fixed-width only)
+    ZONED = "zoned"  # Zoned decimal with signed overpunch (fixed-width only)
+    BINARY_INT = "binary_int"  # Binary integer (fixed-width only)
 
 
 class CastMode(str, Enum):
@@ -39,19 +44,69 @@ class CastMode(str, Enum):
     STRICT = "strict"  # Raise error on cast failure
 
 
+class CsvEngine(str, Enum):
+    """CSV tokenizer implementations."""
+    PYTHON = "python"  # stdlib csv module
+    ARROW = "arrow"  # pyarrow.csv (optional dependency)
+
+
+class FixedWidthEngine(str, Enum):
+    """Fixed-width line readers."""
+    LINE = "line"  # Decoded text lines
+    BYTES = "bytes"  # Binary lines, only extracted fields decoded (single-byte encodings)
+    NUMPY = "numpy"  # Blocks of equal-length lines as arrays, one column per field (requires numpy)
+
+
+class JsonCodecBackend(str, Enum):
+    """JSON decoders/encoders."""
+    AUTO = "auto"  # orjson when installed, else json
+    ORJSON = "orjson"  # Requires orjson
+    JSON = "json"  # Standard library
+
+
+class JsonSchemaMode(str, Enum):
+    """What a JSON schema validates."""
+    DOCUMENT = "document"  # The whole document, before extraction (an invalid file fails)
+    ELEMENT = "element"  # Each selected element; rows of invalid elements are rejected
+
+
+class JsonDecodeMode(str, Enum):
+    """How much of each JSON value is decoded."""
+    FULL = "full"  # Everything
+    SELECTIVE = "selective"  # Only the object keys configured paths read; the rest is skipped
+
+
+class JsonFieldText(str, Enum):
+    """How json-typed fields are written."""
+    ENCODE = "encode"  # Decode the value and encode it again, as json.dumps does
+    COMPACT = "compact"  # Encode without whitespace or non-ASCII escapes (orjson output)
+    RAW = "raw"  # Source text as is, when the value is not otherwise read
+    MINIFY = "minify"  # Source text without whitespace between tokens
+
+
+class ByteOrder(str, Enum):
+    """Byte order of binary integer fields."""
+    BIG = "big"  # Mainframe (COMP/COMP-4)
+    LITTLE = "little"
+
+
 class ContextConfig(BaseModel):
     """Context field configuration."""
     name: str = Field(..., description="Context variable name")
     from_expr: Optional[str] = Field(None, alias="from", description="XPath/JSONPath expression to extract value")
     value: Optional[Any] = Field(None, description="Static value for context variable")
+    from_record: Optional[str] = Field(
+        None, description="Take the value from the latest row of this record (fixed-width)"
+    )
+    field: Optional[str] = Field(None, description="Field of from_record to copy (default: context name)")
 
     model_config = {"populate_by_name": True}
 
     @model_validator(mode='after')
     def validate_source(self):
-        """Ensure either from_expr or value is provided."""
-        if self.from_expr is None and self.value is None:
-            raise ValueError(f"Context '{self.name}' must have either 'from' or 'value'")
+        """Ensure either from_expr, from_record or value is provided."""
+        if self.from_expr is None and self.value is None and self.from_record is None:
+            raise ValueError(f"Context '{self.name}' must have either 'from', 'from_record' or 'value'")
         return self
 
 
@@ -67,6 +122,10 @@ class FieldConfig(BaseModel):
     start: Optional[int] = Field(None, description="Start position for fixed-width (0-indexed)", ge=0)
     end: Optional[int] = Field(None, description="End position for fixed-width (0-indexed)", ge=0)
     width: Optional[int] = Field(None, description="Field width for fixed-width", gt=0)
+    encoding: Optional[str] = Field(None, description="Encoding of this fixed-width field if not the file's")
+    scale: int = Field(0, description="Implied decimal places for comp3/zoned/binary_int fields", ge=0)
+    signed: bool = Field(True, description="Whether a binary_int field is signed")
+    byteorder: ByteOrder = Field(ByteOrder.BIG, description="Byte order of a binary_int field")
 
     # Validation constraints
     regex: Optional[str] = Field(None, description="Regex pattern for validation")
@@ -101,6 +160,12 @@ class RecordConfig(BaseModel):
     """Record definition configuration."""
     name: str = Field(..., description="Record/table name")
     select: Optional[str] = Field(None, description="XPath/JSONPath selector for records")
+    record_type_field: Optional[str] = Field(
+        None, description="Field (or CSV column) holding the record type discriminator (CSV/fixed-width)"
+    )
+    record_type_value: Optional[Union[str, int]] = Field(
+        None, description="Discriminator value identifying this record type (CSV/fixed-width)"
+    )
     context: List[ContextConfig] = Field(default_factory=list, description="Context variables")
     fields: List[FieldConfig] = Field(..., description="Field definitions")
 
@@ -141,6 +206,15 @@ class OutputConfig(BaseModel):
         description="Flush CSV to disk every N rows (None=every row, 0=on close only)",
         ge=0
     )
+    buffer_size: int = Field(
+        1 << 20,
+        description="Output buffer size in bytes per CSV file",
+        gt=0
+    )
+    async_writer: bool = Field(
+        False,
+        description="Write CSV files in a background thread fed through a bounded queue"
+    )
     include_rejected: bool = Field(True, description="Write rejected rows to separate files")
     csv_encoding: str = Field("utf-8", description="Output CSV encoding")
 
@@ -178,6 +252,25 @@ class ParserConfig(BaseModel):
         description="Log progress every N rows",
         gt=0
     )
+    streaming: bool = Field(
+        False,
+        description="Parse in bounded-memory batches (reader -> batch -> plan -> sink)"
+    )
+    streaming_batch_size: int = Field(
+        10000,
+        description="Raw records per streaming batch",
+        gt=0
+    )
+    parallel_workers: int = Field(
+        1,
+        description="Worker processes for parsing large files in byte ranges (1 = in-process, 0 = all cores)",
+        ge=0
+    )
+    parallel_chunk_bytes: int = Field(
+        64 * 1024 * 1024,
+        description="Target size in bytes of each range handed to a parallel worker",
+        gt=0
+    )
 
     # Namespaces (XML/JSON)
     namespaces: Dict[str, str] = Field(
@@ -203,6 +296,12 @@ class ParserConfig(BaseModel):
         description="Output file configuration"
     )
 
+    # XML-specific options
+    xml_multi_document: bool = Field(
+        False,
+        description="Input is a stream of concatenated XML documents (one per transaction or line)"
+    )
+
     # CSV-specific options
     csv_delimiter: str = Field(",", description="CSV delimiter character")
     csv_quotechar: str = Field('"', description="CSV quote character")
@@ -211,12 +310,46 @@ class ParserConfig(BaseModel):
     csv_has_header: bool = Field(True, description="CSV has header row")
     csv_skip_rows: int = Field(0, description="Number of rows to skip at start", ge=0)
     csv_encoding: str = Field("utf-8", description="Input CSV encoding")
+    csv_engine: CsvEngine = Field(
+        CsvEngine.PYTHON,
+        description="CSV tokenizer: 'python' (stdlib) or 'arrow' (pyarrow.csv, multithreaded)"
+    )
+    csv_fan_out: bool = Field(
+        False,
+        description="Emit each CSV row into every matching record instead of only the first"
+    )
 
     # Fixed-width specific options
     fixed_width_encoding: str = Field("utf-8", description="Fixed-width file encoding")
+    fixed_width_engine: FixedWidthEngine = Field(
+        FixedWidthEngine.LINE,
+        description="Fixed-width reader: 'line' (text), 'bytes' or 'numpy' (single-byte encodings only)"
+    )
+    fixed_width_record_length: Optional[int] = Field(
+        None,
+        description="Bytes per record for files of fixed-length records without line terminators",
+        gt=0
+    )
 
     # JSON-specific options
     json_encoding: str = Field("utf-8", description="JSON file encoding")
+    json_lines: bool = Field(False, description="Read one JSON document per line (JSON Lines / NDJSON)")
+    json_schema_mode: JsonSchemaMode = Field(
+        JsonSchemaMode.DOCUMENT,
+        description="JSON schema validation of the whole 'document' or of each selected 'element'"
+    )
+    json_codec: JsonCodecBackend = Field(
+        JsonCodecBackend.AUTO,
+        description="JSON decoder/encoder: 'auto' (orjson when installed), 'orjson' or 'json' (stdlib)"
+    )
+    json_decode: JsonDecodeMode = Field(
+        JsonDecodeMode.FULL,
+        description="Decode 'full' JSON values, or skip object keys no configured path reads ('selective')"
+    )
+    json_field_text: JsonFieldText = Field(
+        JsonFieldText.ENCODE,
+        description="json-typed fields: 'encode' the decoded value as json.dumps does, encode it 'compact', or copy the source text ('raw' or 'minify')"
+    )
 
     # Legacy parser sub-config support (for backward compatibility)
     parser: Optional[Dict[str, Any]] = Field(
@@ -255,6 +388,11 @@ class ParserConfig(BaseModel):
                         f"Record '{record.name}': {self.format_type.value.upper()} records "
                         f"must have a non-empty 'select' field"
                     )
+                if self.format_type == FormatType.JSON:
+                    try:
+                        split_wildcard_selector(record.select)
+                    except ValueError as e:
+                        raise ValueError(f"Record '{record.name}': {e}") from e
 
         if self.format_type == FormatType.FIXED_WIDTH:
             # Fixed-width requires position/width info
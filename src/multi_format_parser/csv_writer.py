@@ -3,30 +3,55 @@ CSV Writer with resource management and performance optimization.
 """
 
 import csv
+import queue
+import threading
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+
+# Output file buffer size; large buffers mean fewer write system calls
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+# AsyncCSVWriter: rows handed to the writer thread at a time, and batches queued before writes block
+ASYNC_BATCH_ROWS = 1000
+ASYNC_QUEUE_BATCHES = 16
+
+
+class _Table:
+    """An open output file and its bound ``csv.writer``."""
+
+    __slots__ = ("writerow", "fp", "columns", "rows")
+
+    def __init__(self, fp: IO[str], columns: List[str]):
+        self.writerow = csv.writer(fp).writerow
+        self.fp = fp
+        self.columns = columns
+        self.rows = 0
 
 
 class CSVWriter:
     """Manages CSV output files with proper resource management.
 
+    Each table's columns are fixed when its file is opened; rows are written
+    as value sequences in that order through one ``csv.writer`` per file.
+
     Args:
         out_dir: Output directory for CSV files
         flush_every: Flush to disk every N rows (0 = flush on close only, None = flush every row).
                      Default: 1000 for production performance.
+        buffer_size: Output buffer size in bytes per file
     """
 
-    def __init__(self, out_dir: Path, flush_every: Optional[int] = 1000):
+    def __init__(self, out_dir: Path, flush_every: Optional[int] = 1000,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE):
         self.out_dir = out_dir
         self.out_dir.mkdir(parents=True, exist_ok=True)
-        self._writers = {}
-        self._rejected_writers = {}
-        self._row_counts = {}
-        self._write_counts = {}  # Track writes per file for periodic flushing
-        self._rejected_write_counts = {}  # Track writes per rejected file
+        self._tables: Dict[str, _Table] = {}
+        self._rejected_tables: Dict[str, _Table] = {}
         self._closed = False
         self.flush_every = flush_every  # None=every row, 0=on close only, N=every N rows
+        self.buffer_size = buffer_size
 
     def __enter__(self):
         """Context manager entry."""
@@ -37,92 +62,95 @@ class CSVWriter:
         self.close()
         return False  # Don't suppress exceptions
 
-    def write_row(self, table: str, row: Dict[str, Any], columns: List[str]):
-        """Write a row to the CSV file."""
+    def _open(self, tables: Dict[str, _Table], name: str, columns: List[str]) -> _Table:
+        """Create ``name``.csv and write its header."""
+        fp = None
+        try:
+            fp = (self.out_dir / f"{name}.csv").open("w", newline="", encoding="utf-8",
+                                                     buffering=self.buffer_size)
+            table = _Table(fp, columns)
+            table.writerow(columns)
+            fp.flush()
+            tables[name] = table
+            return table
+        except Exception:
+            if fp is not None:
+                try:
+                    fp.close()
+                except Exception:
+                    pass  # Ignore errors during cleanup
+            raise
+
+    def _write(self, table: _Table, values: List[Any]) -> None:
+        """Write one row of values, flushing as ``flush_every`` asks."""
+        if Decimal in map(type, values):
+            values = [format(v, "f") if type(v) is Decimal else v for v in values]
+        table.writerow(values)
+        table.rows += 1
+        flush_every = self.flush_every
+        if flush_every is None or (flush_every and table.rows % flush_every == 0):
+            table.fp.flush()
+
+    def write_values(self, table: str, values: List[Any], columns: List[str]):
+        """Write a row given as values in ``columns`` order (the columns the table was opened with)."""
         if self._closed:
             raise RuntimeError("CSVWriter is closed")
+        self._write_values(table, values, columns)
 
-        if table not in self._writers:
-            fp = None
-            try:
-                fp = (self.out_dir / f"{table}.csv").open("w", newline="", encoding="utf-8")
-                writer = csv.DictWriter(fp, fieldnames=columns, extrasaction="ignore")
-                writer.writeheader()
-                fp.flush()
-                self._writers[table] = (writer, fp, columns)
-                fp = None
-            except Exception:
-                if fp is not None:
-                    try:
-                        fp.close()
-                    except Exception:
-                        pass  # Ignore errors during cleanup
-                raise
-
-        writer, fp, cols = self._writers[table]
-        if cols != columns:
+    def _write_values(self, table: str, values: List[Any], columns: List[str]) -> None:
+        state = self._tables.get(table)
+        if state is None:
+            state = self._open(self._tables, table, columns)
+        elif state.columns is not columns and state.columns != columns:
             raise RuntimeError(f"Schema mismatch for table '{table}'")
+        self._write(state, values)
 
-        clean = {}
-        for col in columns:
-            v = row.get(col)
-            clean[col] = format(v, "f") if isinstance(v, Decimal) else v
-        writer.writerow(clean)
-
-        self._row_counts[table] = self._row_counts.get(table, 0) + 1
-        write_count = self._write_counts.get(table, 0) + 1
-        self._write_counts[table] = write_count
-
-        should_flush = (
-            self.flush_every is None or
-            (self.flush_every > 0 and write_count % self.flush_every == 0)
-        )
-        if should_flush:
-            fp.flush()
+    def write_row(self, table: str, row: Dict[str, Any], columns: List[str]):
+        """Write a row to the CSV file."""
+        self.write_values(table, list(map(row.get, columns)), columns)
 
     def write_rejected_row(self, table: str, row: Dict[str, Any], error: str, columns: List[str]):
         """Write a rejected row to a separate file with error reason."""
         if self._closed:
             raise RuntimeError("CSVWriter is closed")
 
+        values = list(map(row.get, columns))
+        values.append(error)
+        self._write_rejected_values(table, values, columns)
+
+    def _write_rejected_values(self, table: str, values: List[Any], columns: List[str]) -> None:
         reject_table = f"{table}_rejected"
-        reject_cols = columns + ["_error_reason"]
+        state = self._rejected_tables.get(reject_table)
+        if state is None:
+            state = self._open(self._rejected_tables, reject_table, columns + ["_error_reason"])
+        self._write(state, values)
 
-        if reject_table not in self._rejected_writers:
-            fp = None
-            try:
-                fp = (self.out_dir / f"{reject_table}.csv").open("w", newline="", encoding="utf-8")
-                writer = csv.DictWriter(fp, fieldnames=reject_cols, extrasaction="ignore")
-                writer.writeheader()
-                fp.flush()
-                self._rejected_writers[reject_table] = (writer, fp, reject_cols)
-                fp = None
-            except Exception:
-                if fp is not None:
-                    try:
-                        fp.close()
-                    except Exception:
-                        pass  # Ignore errors during cleanup
-                raise
-
-        writer, fp, cols = self._rejected_writers[reject_table]
-
-        clean = {}
-        for col in columns:
-            v = row.get(col)
-            clean[col] = format(v, "f") if isinstance(v, Decimal) else v
-        clean["_error_reason"] = error
-        writer.writerow(clean)
-
-        write_count = self._rejected_write_counts.get(reject_table, 0) + 1
-        self._rejected_write_counts[reject_table] = write_count
-
-        should_flush = (
-            self.flush_every is None or
-            (self.flush_every > 0 and write_count % self.flush_every == 0)
-        )
-        if should_flush:
-            fp.flush()
+    def drain(self):
+        """Wait until every row passed so far is written (rows are written at once here)."""
+
+    def checkpoint(self) -> Tuple[Dict[str, Tuple[int, int]], ...]:
+        """Mark the end of every open file (flushing it), for :meth:`rollback`."""
+        marks = ({}, {})
+        for tables, table_marks in zip((self._tables, self._rejected_tables), marks):
+            for name, table in tables.items():
+                table.fp.flush()
+                table_marks[name] = (table.fp.tell(), table.rows)
+        return marks
+
+    def rollback(self, marks: Tuple[Dict[str, Tuple[int, int]], ...]) -> None:
+        """Drop the rows written since :meth:`checkpoint`; files opened since then are removed."""
+        for tables, table_marks in zip((self._tables, self._rejected_tables), marks):
+            for name in list(tables):
+                table = tables[name]
+                if name in table_marks:
+                    pos, table.rows = table_marks[name]
+                    table.fp.flush()
+                    table.fp.seek(pos)
+                    table.fp.truncate()
+                else:
+                    table.fp.close()
+                    (self.out_dir / f"{name}.csv").unlink()
+                    del tables[name]
 
     def close(self):
         """Close all open files with error handling."""
@@ -131,25 +159,15 @@ class CSVWriter:
 
         errors = []
 
-        for table, (writer, fp, _) in list(self._writers.items()):
-            try:
-                if fp and not fp.closed:
-                    fp.flush()
-                    fp.close()
-            except Exception as e:
-                errors.append(f"Error closing {table}.csv: {e}")
-
-        for table, (writer, fp, _) in list(self._rejected_writers.items()):
+        for name, table in [*self._tables.items(), *self._rejected_tables.items()]:
             try:
-                if fp and not fp.closed:
-                    fp.flush()
-                    fp.close()
+                if not table.fp.closed:
+                    table.fp.flush()
+                    table.fp.close()
             except Exception as e:
-                errors.append(f"Error closing {table}.csv: {e}")
+                errors.append(f"Error closing {name}.csv: {e}")
 
         self._closed = True
-        self._writers.clear()
-        self._rejected_writers.clear()
 
         if errors:
             import logging
@@ -158,4 +176,134 @@ class CSVWriter:
 
     def get_row_count(self, table: str) -> int:
         """Get row count for a table."""
+        state = self._tables.get(table)
+        return state.rows if state is not None else 0
+
+
+class AsyncCSVWriter(CSVWriter):
+    """CSVWriter whose files are written by a background thread.
+
+    Rows are collected into batches of ``batch_rows`` and queued for a
+    dedicated thread, which opens, writes, flushes (per ``flush_every``)
+    and closes all files, so parsing continues while it waits on the
+    disk. Batches are written in order, keeping each table's rows in
+    order. When ``queue_batches`` batches are waiting, writes block until
+    the thread catches up. A failure in the thread is raised by the next
+    write, :meth:`drain` or :meth:`close`.
+
+    Args:
+        out_dir: Output directory for CSV files
+        flush_every: As for :class:`CSVWriter` (None also hands rows over one at a time)
+        buffer_size: Output buffer size in bytes per file
+        batch_rows: Rows per batch (at most ``flush_every``)
+        queue_batches: Batches queued before writes block
+    """
+
+    def __init__(self, out_dir: Path, flush_every: Optional[int] = 1000,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE, batch_rows: int = ASYNC_BATCH_ROWS,
+                 queue_batches: int = ASYNC_QUEUE_BATCHES):
+        super().__init__(out_dir, flush_every, buffer_size)
+        self.batch_rows = 1 if flush_every is None else max(1, min(batch_rows, flush_every or batch_rows))
+        self._columns: Dict[str, List[str]] = {}  # Checked here; the thread owns the files
+        self._row_counts: Dict[str, int] = {}
+        self._batch: List[Tuple[bool, str, List[Any], List[str]]] = []
+        self._queue: "queue.Queue[Optional[list]]" = queue.Queue(queue_batches)
+        self._error: Optional[BaseException] = None
+        self._thread: Optional[threading.Thread] = threading.Thread(
+            target=self._run, name="csv-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Write queued batches until the end marker, then close the files."""
+        try:
+            while True:
+                batch = self._queue.get()
+                try:
+                    if batch is None:
+                        return
+                    if self._error is None:
+                        for rejected, table, values, columns in batch:
+                            if rejected:
+                                self._write_rejected_values(table, values, columns)
+                            else:
+                                self._write_values(table, values, columns)
+                except BaseException as e:
+                    # Later batches are dropped; the parser sees the error on its next write
+                    self._error = e
+                finally:
+                    self._queue.task_done()
+        finally:
+            CSVWriter.close(self)
+
+    def _check(self) -> None:
+        """Raise if the writer is closed or its thread failed."""
+        if self._thread is None:
+            raise RuntimeError("CSVWriter is closed")
+        if self._error is not None:
+            raise RuntimeError(f"CSV writer thread failed: {self._error}") from self._error
+
+    def _submit(self) -> None:
+        """Queue the current batch (waiting while the queue is full)."""
+        if self._batch:
+            batch, self._batch = self._batch, []
+            self._queue.put(batch)
+
+    def write_values(self, table: str, values: List[Any], columns: List[str]):
+        """Queue a row given as values in ``columns`` order."""
+        self._check()
+        cols = self._columns.get(table)
+        if cols is None:
+            self._columns[table] = columns
+        elif cols is not columns and cols != columns:
+            raise RuntimeError(f"Schema mismatch for table '{table}'")
+
+        self._row_counts[table] = self._row_counts.get(table, 0) + 1
+        self._batch.append((False, table, values, columns))
+        if len(self._batch) >= self.batch_rows:
+            self._submit()
+
+    def write_rejected_row(self, table: str, row: Dict[str, Any], error: str, columns: List[str]):
+        """Queue a rejected row for the table's rejected file."""
+        self._check()
+        values = list(map(row.get, columns))
+        values.append(error)
+        self._batch.append((True, table, values, columns))
+        if len(self._batch) >= self.batch_rows:
+            self._submit()
+
+    def drain(self):
+        """Wait until every queued row is written; raises the thread's error, if any."""
+        self._check()
+        self._submit()
+        self._queue.join()
+        self._check()
+
+    def checkpoint(self) -> tuple:
+        """Wait for the queued rows, then mark the end of every file (see :meth:`CSVWriter.checkpoint`)."""
+        self.drain()
+        return super().checkpoint(), dict(self._row_counts)
+
+    def rollback(self, marks: tuple) -> None:
+        """Drop the rows passed since :meth:`checkpoint`, queued or written."""
+        self.drain()
+        file_marks, row_counts = marks
+        self._row_counts = dict(row_counts)
+        super().rollback(file_marks)
+
+    def close(self):
+        """Write the remaining rows, stop the thread (which closes the files) and raise its error, if any."""
+        if self._thread is None:
+            return
+        try:
+            if self._error is None:
+                self._submit()
+            self._queue.put(None)
+            self._thread.join()
+        finally:
+            self._thread = None
+        if self._error is not None:
+            raise RuntimeError(f"CSV writer thread failed: {self._error}") from self._error
+
+    def get_row_count(self, table: str) -> int:
+        """Get the number of rows passed for a table (written or queued)."""
         return self._row_counts.get(table, 0)
@@ -0,0 +1,176 @@
+"""
+JSON codec selection.
+
+Whole JSON documents and JSON Lines are decoded, and JSON-typed fields
+encoded, through a :class:`JsonCodec`. The codec uses orjson when it is
+installed and the standard library otherwise (``json_codec`` in the config
+forces one), and times its calls by the implementation that actually
+handled them, so runs can report where JSON time goes. Encoded text is that
+of ``json.dumps`` unless compact text is asked for.
+"""
+
+import json
+import logging
+import time
+from typing import IO, Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from multi_format_parser.json_utils import decode_json_planned
+
+# Optional fast JSON codec
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+logger = logging.getLogger(__name__)
+
+# Backends in order of preference for "auto"
+BACKENDS = ("orjson", "json")
+
+
+def resolve_backend(name: Optional[str] = None) -> str:
+    """Return the backend for a ``json_codec`` setting ("auto" or None picks the fastest installed).
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if name is None or name == "auto":
+        return "orjson" if HAS_ORJSON else "json"
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown json_codec '{name}' (expected 'auto', {', '.join(repr(b) for b in BACKENDS)})")
+    if name == "orjson" and not HAS_ORJSON:
+        logger.warning("json_codec 'orjson' requires orjson (pip install orjson); using the stdlib codec")
+        return "json"
+    return name
+
+
+class JsonCodec:
+    """Decode and encode JSON with one backend, accumulating the time spent.
+
+    The orjson backend hands values it cannot represent (integers beyond
+    64 bits, NaN/Infinity, non-string keys) to the standard library, which
+    also produces the syntax error messages, so results match ``json``.
+    Values are encoded by ``json.dumps`` by default, since orjson cannot
+    reproduce its separators and ASCII escapes; with ``compact`` they are
+    encoded without whitespace or non-ASCII escapes, by orjson when the
+    backend is orjson.
+    """
+
+    def __init__(self, backend: Optional[str] = None, compact: bool = False):
+        self.backend = resolve_backend(backend)
+        self.compact = compact
+        self._orjson = self.backend == "orjson"
+        # Seconds by implementation: "orjson" or "json" (stdlib), and for
+        # decoding "planned" (decode plans) or an incremental reader's name
+        self.decode_timings: Dict[str, float] = {}
+        self.encode_timings: Dict[str, float] = {}
+
+    @staticmethod
+    def _add_time(timings: Dict[str, float], label: str, start: float) -> None:
+        timings[label] = timings.get(label, 0.0) + time.perf_counter() - start
+
+    def loads(self, data: Union[str, bytes], plan: Any = None) -> Any:
+        """Decode one JSON document, following a decode plan if given.
+
+        A plan (see :func:`~multi_format_parser.json_utils.compile_decode_plan`)
+        keeps parts of the text undecoded; it is followed by the pure-Python
+        :func:`~multi_format_parser.json_utils.decode_json_planned` whatever
+        the backend.
+
+        Raises:
+            json.JSONDecodeError: If ``data`` is not valid JSON
+        """
+        start = time.perf_counter()
+        decoder = "json"
+        try:
+            if plan is not None:
+                decoder = "planned"
+                try:
+                    value, end = decode_json_planned(data, 0, plan)
+                    if not data[end:].strip(" \t\n\r"):
+                        return value
+                except json.JSONDecodeError:
+                    pass
+                # Invalid: the standard library reports the error
+            elif self._orjson:
+                try:
+                    value = orjson.loads(data)
+                except orjson.JSONDecodeError:
+                    pass
+                else:
+                    decoder = "orjson"
+                    return value
+            return json.loads(data)
+        finally:
+            self._add_time(self.decode_timings, decoder, start)
+
+    def load(self, f: IO, plan: Any = None) -> Any:
+        """Read and decode a whole file, following a decode plan if given (only decoding is timed)."""
+        return self.loads(f.read(), plan)
+
+    def iter_decoded(self, values: Iterable[Any], reader: str) -> Iterator[Any]:
+        """Yield values decoded by an incremental ``reader`` (e.g. "scanner"), timed under its name.
+
+        Incremental readers decode as they read, so their file reads are
+        included in the time.
+        """
+        values = iter(values)
+        while True:
+            start = time.perf_counter()
+            try:
+                value = next(values)
+            except StopIteration:
+                return
+            finally:
+                self._add_time(self.decode_timings, reader, start)
+            yield value
+
+    def dumps(self, value: Any, ensure_ascii: bool = True) -> str:
+        """Encode a value as JSON text (compact text never escapes non-ASCII, whatever ``ensure_ascii``)."""
+        start = time.perf_counter()
+        encoder = "json"
+        try:
+            if not self.compact:
+                return json.dumps(value, ensure_ascii=ensure_ascii)
+            if self._orjson:
+                try:
+                    text = orjson.dumps(value).decode("utf-8")
+                except TypeError:
+                    pass
+                else:
+                    encoder = "orjson"
+                    return text
+            return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        finally:
+            self._add_time(self.encode_timings, encoder, start)
+
+    def take_timings(self) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """Return ``(decode_timings, encode_timings)`` and reset them (e.g. to ship from a worker)."""
+        timings = (self.decode_timings, self.encode_timings)
+        self.decode_timings, self.encode_timings = {}, {}
+        return timings
+
+    def add_timings(self, timings: Tuple[Dict[str, float], Dict[str, float]]) -> None:
+        """Add timings taken from another codec (see :meth:`take_timings`)."""
+        for own, other in zip((self.decode_timings, self.encode_timings), timings):
+            for label, seconds in other.items():
+                own[label] = own.get(label, 0.0) + seconds
+
+    def report(self, diagnostics: Dict[str, Any]) -> None:
+        """Move the accumulated timings into a run's diagnostics dict; nothing if the codec was not used.
+
+        ``json_decoders`` and ``json_encoders`` map each implementation that
+        handled calls to its seconds; ``json_decode_seconds`` and
+        ``json_encode_seconds`` only count calls through ``json_backend``.
+        """
+        decode_timings, encode_timings = self.take_timings()
+        if not (decode_timings or encode_timings):
+            return
+        diagnostics["json_backend"] = self.backend
+        for key, timings in (("json_decoders", decode_timings), ("json_encoders", encode_timings)):
+            totals = diagnostics.setdefault(key, {})
+            for label, seconds in timings.items():
+                totals[label] = totals.get(label, 0.0) + seconds
+        diagnostics["json_decode_seconds"] = diagnostics["json_decoders"].get(self.backend, 0.0)
+        diagnostics["json_encode_seconds"] = diagnostics["json_encoders"].get(self.backend, 0.0)
@@ -5,11 +5,157 @@ This module provides functions for extracting values from JSON data structures
 using dot notation paths and selector expressions.
 """
 
+import ast
+import json
 import logging
-from typing import Any
+import operator
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Characters read per refill by JsonScanner
+SCAN_CHUNK_SIZE = 1 << 16
+
+_JSON_KEY = re.compile(r"^[^\[\].]+$")
+_JSON_WHITESPACE = " \t\n\r"
+_JSON_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_SPACE = re.compile(r"[ \t\n\r]")
+# Strings and the text between them up to whitespace (joined, they are the minified text)
+_MINIFY_TOKENS = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[^ \t\n\r"]+')
+_scanstring = json.decoder.scanstring
+
+# Decode plan kinds keeping a value's source text (see decode_json_planned)
+RAW_TEXT = "raw"
+RAW_MINIFIED = "minified"
+# Path kind for values that are walked into (selectors), not read themselves (see compile_decode_plan)
+WALKED = "walked"
+# Decode plan kind for values that are skipped without being decoded
+SKIPPED = "skipped"
+
+
+def _skip_pattern(depth: int) -> str:
+    """Regex consuming JSON text up to the next bracket not closed within ``depth`` nested containers."""
+    plain = r'[^"\[\]{}]*'
+    string = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+    content = f"{plain}(?:{string}{plain})*"
+    for _ in range(depth):
+        containers = rf"\{{{content}\}}|\[{content}\]"
+        content = f"{plain}(?:(?:{string}|{containers}){plain})*"
+    return content
+
+
+# Strings and flat containers are skipped in one match (deeper patterns measured slower)
+_SKIP_NESTED = re.compile(_skip_pattern(1))
+_SKIP_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+_SKIP_SCALAR = re.compile(r'[^ \t\n\r,:\[\]{}"]+')
+
+# Selector steps expanding every element of an array, or those matching a filter
+WILDCARD = "[*]"
+FILTER_START = "[?("
+
+
+@lru_cache(maxsize=1024)
+def compile_json_path(path: str) -> Tuple[Tuple[str, Optional[int], bool], ...]:
+    """Compile a dot-notation path into ``(key, index, bracketed)`` steps.
+
+    A plain part ``"name"`` is looked up as a key in objects and, when it
+    is a non-negative integer, as an index in arrays. A bracketed part
+    ``"items[0]"`` looks up ``items`` (if given) and then requires an array.
+    Indexes that can never match (negative or malformed) compile to -1.
+    """
+    steps = []
+    for part in path.split('.'):
+        if '[' in part and part.endswith(']'):
+            bracket_pos = part.index('[')
+            steps.append((part[:bracket_pos], _parse_index(part[bracket_pos + 1:-1]), True))
+        else:
+            steps.append((part, _parse_index(part), False))
+    return tuple(steps)
+
+
+def _parse_index(text: str) -> Optional[int]:
+    """Return ``text`` as an array index; None if not an integer, -1 if negative."""
+    try:
+        index = int(text)
+    except ValueError:
+        return None
+    return index if index >= 0 else -1
+
+
+def _json_step(current: Any, step: Tuple[str, Optional[int], bool]) -> Any:
+    """Apply one compiled path step; None if it does not match."""
+    key, index, bracketed = step
+    if bracketed:
+        if key:
+            if not isinstance(current, dict):
+                return None
+            current = current.get(key)
+        if not isinstance(current, list) or index is None or not -1 < index < len(current):
+            return None
+        return current[index]
+    if isinstance(current, dict):
+        return current.get(key)
+    if isinstance(current, list):
+        if index is None or not -1 < index < len(current):
+            return None
+        return current[index]
+    return None
+
+
+def run_json_path(data: Any, steps: Tuple[Tuple[str, Optional[int], bool], ...]) -> Any:
+    """Follow compiled path steps (see :func:`compile_json_path`); None if any step is missing."""
+    current = data
+    for step in steps:
+        current = _json_step(current, step)
+        if current is None:
+            return None
+    return current
+
+
+def compile_path_tree(paths: Iterable[Tuple[Tuple[str, Optional[int], bool], ...]]) -> tuple:
+    """Merge compiled paths into a tree so shared prefixes are followed once.
+
+    Each node is a ``(key, index, bracketed, children, steps)`` tuple,
+    where ``steps`` is the full path ending at that node (None if no path
+    ends there).
+    """
+    tree: dict = {}
+    for steps in paths:
+        node = tree
+        for depth, step in enumerate(steps, start=1):
+            children, end = node.get(step, ({}, None))
+            node[step] = (children, steps if depth == len(steps) else end)
+            node = children
+
+    def freeze(node: dict) -> tuple:
+        return tuple((*step, freeze(children), steps) for step, (children, steps) in node.items())
+
+    return freeze(tree)
+
+
+def run_path_tree(data: Any, tree: tuple, out: Dict[tuple, Any]) -> Dict[tuple, Any]:
+    """Evaluate every path of a :func:`compile_path_tree` tree on ``data``.
+
+    Fills ``out`` with the value of each path that matched (missing paths
+    are left out, i.e. None) and returns it.
+    """
+    is_dict = isinstance(data, dict)
+    for key, index, bracketed, children, steps in tree:
+        if is_dict and not bracketed:
+            value = data.get(key)
+        else:
+            value = _json_step(data, (key, index, bracketed))
+        if value is None:
+            continue
+        if steps is not None:
+            out[steps] = value
+        if children:
+            run_path_tree(value, children, out)
+    return out
+
 
 def extract_json_path(data: Any, path: str) -> Any:
     """Extract value from JSON data using dot notation path.
@@ -19,6 +165,8 @@ def extract_json_path(data: Any, path: str) -> Any:
     - Array indexing: "items[0]", "items[0].price"
     - Nested paths: "user.address.city"
 
+    Paths are compiled once (see :func:`compile_json_path`) and cached.
+
     Args:
         data: JSON data (dict, list, or primitive)
         path: Dot-notation path string
@@ -38,72 +186,7 @@ def extract_json_path(data: Any, path: str) -> Any:
         logger.debug(f"Cannot extract path '{path}' from primitive type {type(data).__name__}")
         return None
 
-    try:
-        parts = path.split('.')
-        current = data
-
-        for part_idx, part in enumerate(parts):
-            if '[' in part and part.endswith(']'):
-                # Handle array indexing: "items[0]"
-                try:
-                    bracket_pos = part.index('[')
-                    key = part[:bracket_pos]
-                    index_str = part[bracket_pos + 1:-1]
-                except ValueError:
-                    return None
-
-                if key:
-                    if not isinstance(current, dict):
-                        return None
-                    current = current.get(key)
-                    if current is None:
-                        return None
-
-                # Validate current is a list before indexing
-                if not isinstance(current, list):
-                    logger.debug(f"Expected list for array indexing at '{part}' but got {type(current).__name__}")
-                    return None
-
-                try:
-                    index = int(index_str)
-                    # Handle negative indices safely
-                    if index < 0:
-                        logger.debug(f"Negative array index {index} not supported in path '{path}'")
-                        return None
-                    if index < len(current):
-                        current = current[index]
-                    else:
-                        return None
-                except (ValueError, TypeError):
-                    return None
-            else:
-                if isinstance(current, dict):
-                    current = current.get(part)
-                elif isinstance(current, list):
-                    try:
-                        idx = int(part)
-                        if idx < 0:
-                            logger.debug(f"Negative array index {idx} not supported")
-                            return None
-                        if idx < len(current):
-                            current = current[idx]
-                        else:
-                            return None
-                    except (ValueError, TypeError):
-                        return None
-                else:
-                    # Trying to traverse non-container type
-                    remaining_path = '.'.join(parts[part_idx:])
-                    logger.debug(f"Cannot traverse path '{remaining_path}' through {type(current).__name__}")
-                    return None
-
-            if current is None:
-                return None
-
-        return current
-    except (AttributeError, KeyError, IndexError, TypeError) as e:
-        logger.debug(f"Error extracting JSON path '{path}': {e}")
-        return None
+    return run_json_path(data, compile_json_path(path))
 
 
 def select_json_records(data: Any, selector: str) -> list:
@@ -207,3 +290,756 @@ def select_json_records(data: Any, selector: str) -> list:
 
     # Wrap non-list results in a list for consistency
     return [result]
+
+
+def selector_keys(selector: str) -> Optional[List[str]]:
+    """Split a dotted object-key selector into keys; None if it indexes arrays.
+
+    ``""``, ``"$"`` and ``"$."`` select the root (no keys). Selectors with
+    brackets or numeric parts can only be resolved on a loaded document.
+    """
+    path = (selector or "").lstrip('$').lstrip('.')
+    if not path:
+        return []
+    parts = path.split('.')
+    if not all(_JSON_KEY.match(part) and not part.isdigit() for part in parts):
+        return None
+    return parts
+
+
+class RawJson:
+    """Source text of a JSON value kept undecoded (see :func:`decode_json_planned`)."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def __repr__(self) -> str:
+        return f"RawJson({self.text!r})"
+
+
+def compile_decode_plan(paths: Iterable[Tuple[Tuple[str, ...], Optional[str]]], skip: bool = False) -> Optional[tuple]:
+    """Build a plan for :func:`decode_json_planned` from the key paths a config reads.
+
+    Each ``(keys, kind)`` pair names a value by its object keys (arrays on
+    the way are entered element by element); ``kind`` is None when the
+    value is needed decoded, :data:`RAW_TEXT`/:data:`RAW_MINIFIED` when
+    only its text is, or :data:`WALKED` when only the values other paths
+    name inside it are read. A value is kept as text only if nothing else
+    reads it or anything inside it. With ``skip``, object keys no path
+    names are skipped (see :data:`SKIPPED`) instead of decoded.
+
+    Returns:
+        The plan, or None if nothing would be kept as text or skipped
+        (plain decoding is then just as good)
+    """
+    rest = SKIPPED if skip else None
+    tree: dict = {}
+    for keys, kind in paths:
+        node = tree
+        for key in keys:
+            node = node.setdefault("children", {}).setdefault(key, {})
+        node.setdefault("kinds", set()).add(kind)
+
+    def freeze(node: dict) -> Any:
+        kinds = node.get("kinds", set())
+        children = node.get("children")
+        if None in kinds:
+            return None
+        if kinds - {WALKED}:
+            return kinds.pop() if len(kinds) == 1 and not children else None
+        if not children:
+            return None
+        return {key: freeze(child) for key, child in children.items()}, rest
+
+    def keeps_text(plan: Any) -> bool:
+        if isinstance(plan, tuple):
+            return any(keeps_text(child) for child in plan[0].values())
+        return plan in (RAW_TEXT, RAW_MINIFIED)
+
+    plan = freeze(tree) if tree else None
+    return plan if (skip and isinstance(plan, tuple)) or keeps_text(plan) else None
+
+
+def decode_json_planned(text: str, pos: int, plan: Any,
+                        decoder: json.JSONDecoder = _JSON_DECODER) -> Tuple[Any, int]:
+    """Decode the value at ``text[pos:]`` following a plan; returns ``(value, end)``.
+
+    A plan is None (decode the value), :data:`RAW_TEXT` or
+    :data:`RAW_MINIFIED` (keep its source text as :class:`RawJson`; null
+    stays None), :data:`SKIPPED` (see :func:`skip_json_value`; the value
+    is None and skipped object keys are left out), or ``(children, rest)``
+    where ``children`` maps object keys to plans and ``rest`` is the plan
+    for other keys. Arrays apply their plan to every element. Values kept
+    raw are still scanned (and so checked) by ``decoder``, but only their
+    text is kept.
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON (or is cut short)
+    """
+    pos = _WHITESPACE.match(text, pos).end()
+    if plan is None:
+        return decoder.raw_decode(text, pos)
+    if plan == SKIPPED:
+        return None, skip_json_value(text, pos)
+    if not isinstance(plan, tuple):
+        value, end = decoder.raw_decode(text, pos)
+        if value is None:
+            return None, end
+        raw = text[pos:end]
+        if plan == RAW_MINIFIED and _JSON_SPACE.search(raw):
+            raw = "".join(_MINIFY_TOKENS.findall(raw))
+        return RawJson(raw), end
+
+    char = text[pos:pos + 1]
+    if char == "{":
+        children, rest = plan
+        obj = {}
+        pos = _WHITESPACE.match(text, pos + 1).end()
+        if text.startswith("}", pos):
+            return obj, pos + 1
+        while True:
+            if not text.startswith('"', pos):
+                raise json.JSONDecodeError("Expecting property name enclosed in double quotes", text, pos)
+            key, pos = _scanstring(text, pos + 1)
+            pos = _WHITESPACE.match(text, pos).end()
+            if not text.startswith(":", pos):
+                raise json.JSONDecodeError("Expecting ':' delimiter", text, pos)
+            child = children.get(key, rest)
+            if child == SKIPPED:
+                pos = skip_json_value(text, pos + 1)
+            else:
+                obj[key], pos = decode_json_planned(text, pos + 1, child, decoder)
+            pos = _WHITESPACE.match(text, pos).end()
+            if text.startswith("}", pos):
+                return obj, pos + 1
+            if not text.startswith(",", pos):
+                raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
+            pos = _WHITESPACE.match(text, pos + 1).end()
+    if char == "[":
+        items = []
+        pos = _WHITESPACE.match(text, pos + 1).end()
+        if text.startswith("]", pos):
+            return items, pos + 1
+        while True:
+            item, pos = decode_json_planned(text, pos, plan, decoder)
+            items.append(item)
+            pos = _WHITESPACE.match(text, pos).end()
+            if text.startswith("]", pos):
+                return items, pos + 1
+            if not text.startswith(",", pos):
+                raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
+            pos += 1
+    return decoder.raw_decode(text, pos)
+
+
+def skip_json_value(text: str, pos: int) -> int:
+    """Return the end of the JSON value at ``text[pos:]`` without decoding it.
+
+    Only brackets and strings are checked (brackets must match, strings
+    must be closed); numbers and literals are taken as they are.
+
+    Raises:
+        json.JSONDecodeError: If the value is cut short or its brackets do not match
+    """
+    pos = _WHITESPACE.match(text, pos).end()
+    char = text[pos:pos + 1]
+    if char == '"':
+        match = _SKIP_STRING.match(text, pos)
+        if match is None:
+            raise json.JSONDecodeError("Unterminated string starting at", text, pos)
+        return match.end()
+    if char != "{" and char != "[":
+        match = _SKIP_SCALAR.match(text, pos)
+        if match is None:
+            raise json.JSONDecodeError("Expecting value", text, pos)
+        return match.end()
+
+    closing = []
+    while True:
+        if char == "{":
+            closing.append("}")
+        elif char == "[":
+            closing.append("]")
+        elif char == "}" or char == "]":
+            if closing.pop() != char:
+                raise json.JSONDecodeError(f"Unexpected {char!r}", text, pos)
+            if not closing:
+                return pos + 1
+        else:
+            # End of text, or a string that is not closed
+            raise json.JSONDecodeError("Unterminated value", text, pos)
+        pos = _SKIP_NESTED.match(text, pos + 1).end()
+        char = text[pos:pos + 1]
+
+
+class JsonScanner:
+    """Buffered reader decoding one JSON value at a time from a text stream.
+
+    Values are decoded with :meth:`json.JSONDecoder.raw_decode` from a buffer
+    that is refilled (and grown for values larger than it) as needed, so
+    only the value being decoded is held in memory.
+    """
+
+    def __init__(self, f: TextIO, chunk_size: int = SCAN_CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.offset = 0  # characters dropped from the front of the buffer
+        self.lines = 0  # line breaks in the dropped characters
+        self.line_start = 0  # offset of the character after the last dropped line break
+        self.eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Read more text into the buffer; False at end of file."""
+        if self.eof:
+            return False
+        chunk = self.f.read(max(self.chunk_size, len(self.buf) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        dropped = self.buf[:self.pos]
+        newlines = dropped.count("\n")
+        if newlines:
+            self.lines += newlines
+            self.line_start = self.offset + dropped.rindex("\n") + 1
+        self.offset += self.pos
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def error(self, msg: str, pos: Optional[int] = None) -> json.JSONDecodeError:
+        """Build a syntax error at buffer position ``pos`` (default: current position).
+
+        Line, column and character are counted from the start of the
+        document, as :func:`json.loads` reports them.
+        """
+        pos = self.pos if pos is None else pos
+        error = json.JSONDecodeError(msg, self.buf, pos)
+        error.pos = self.offset + pos
+        error.lineno += self.lines
+        if error.lineno == self.lines + 1:
+            error.colno = error.pos - self.line_start + 1
+        error.args = (f"{msg}: line {error.lineno} column {error.colno} (char {error.pos})",)
+        return error
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of file)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _JSON_WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._fill():
+                return self.buf[self.pos:self.pos + 1]
+
+    def take(self, allowed: str) -> str:
+        """Consume the next non-whitespace character, which must be one of ``allowed``."""
+        char = self.peek()
+        if not char or char not in allowed:
+            raise self.error(f"Expecting {allowed[0]!r} delimiter")
+        self.pos += 1
+        return char
+
+    def value(self, plan: Any = None) -> Any:
+        """Decode the next value, following a :func:`decode_json_planned` plan if given."""
+        self.peek()
+        while True:
+            try:
+                if plan is None:
+                    value, end = self._decoder.raw_decode(self.buf, self.pos)
+                else:
+                    value, end = decode_json_planned(self.buf, self.pos, plan, self._decoder)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                raise self.error(e.msg, e.pos) from None
+            # A number or literal ending at the buffer end may continue in the next chunk
+            if end < len(self.buf) or not self._fill():
+                self.pos = end
+                return value
+
+
+def _scan_selected(scanner: JsonScanner, keys: List[str], plan: Any = None,
+                   occurrences: Optional[List[int]] = None) -> Iterator[Any]:
+    """Consume the value at the scanner, yielding what ``select_json_records`` selects from it.
+
+    With ``occurrences`` (see :func:`_last_occurrences`) only the given
+    occurrence of each key is followed; otherwise every occurrence is.
+    """
+    # Values beside the path are skipped when the plan skips unreferenced values
+    other = SKIPPED if isinstance(plan, tuple) and plan[1] == SKIPPED else None
+    if not keys:
+        if scanner.peek() != '[':
+            value = scanner.value(plan)
+            if value is not None:
+                yield value
+            return
+        scanner.take('[')
+        if scanner.peek() == ']':
+            scanner.take(']')
+            return
+        while True:
+            yield scanner.value(plan)
+            if scanner.take(',]') == ']':
+                return
+
+    if scanner.peek() != '{':
+        scanner.value(other)
+        return
+    scanner.take('{')
+    if scanner.peek() == '}':
+        scanner.take('}')
+        return
+    count = 0
+    while True:
+        if scanner.peek() != '"':
+            raise scanner.error("Expecting property name enclosed in double quotes")
+        key = scanner.value()
+        scanner.take(':')
+        if key == keys[0]:
+            count += 1
+        if key == keys[0] and (occurrences is None or count == occurrences[0]):
+            yield from _scan_selected(scanner, keys[1:], plan, None if occurrences is None else occurrences[1:])
+        else:
+            scanner.value(other)
+        if scanner.take(',}') == '}':
+            return
+
+
+def _last_occurrences(scanner: JsonScanner, keys: List[str], plan: Any = None) -> List[int]:
+    """Consume the value at the scanner, returning which occurrence of each key on the path ``json.load`` keeps.
+
+    Counts are 1-based; 0 marks a missing key (or a value that is not an
+    object), below which nothing is selected.
+    """
+    if not keys:
+        for _ in _scan_selected(scanner, keys, plan):
+            pass
+        return []
+    other = SKIPPED if isinstance(plan, tuple) and plan[1] == SKIPPED else None
+    if scanner.peek() != '{':
+        scanner.value(other)
+        return [0]
+    scanner.take('{')
+    if scanner.peek() == '}':
+        scanner.take('}')
+        return [0]
+    count, last = 0, [0]
+    while True:
+        if scanner.peek() != '"':
+            raise scanner.error("Expecting property name enclosed in double quotes")
+        key = scanner.value()
+        scanner.take(':')
+        if key == keys[0]:
+            count += 1
+            last = [count] + _last_occurrences(scanner, keys[1:], plan)
+        else:
+            scanner.value(other)
+        if scanner.take(',}') == '}':
+            return last
+
+
+def _keys_may_repeat(f: TextIO, keys: List[str], chunk_size: int) -> bool:
+    """Tell whether an object key on the path may occur twice, reading the stream as plain text.
+
+    False when the quoted text of each key appears at most once and no
+    escape sequence that could spell one of its characters appears at
+    all, which rules out repeats at any level.
+    """
+    spellings = [json.dumps(key, ensure_ascii=False) for key in keys]
+    hexes, short = set(), ""
+    for char in "".join(keys):
+        code = ord(char)
+        if code > 0xFFFF:
+            code = 0xD800 + ((code - 0x10000) >> 10)
+        hexes.add(f"{code:04x}")
+        short += {'"': '"', "\\": "\\\\", "/": "/", "\b": "b", "\f": "f", "\n": "n", "\r": "r", "\t": "t"}.get(char, "")
+    escapes = re.compile(r"\\(?:u(?:%s)%s)" % ("|".join(sorted(hexes)), f"|[{short}]" if short else ""), re.IGNORECASE)
+
+    counts = [0] * len(spellings)
+    overlap = max(len(spelling) for spelling in spellings + ["\\u0000"]) - 1
+    tail = ""
+    for chunk in iter(lambda: f.read(chunk_size), ""):
+        text = tail + chunk
+        # Matches must end in the new chunk, so none is counted twice
+        for i, spelling in enumerate(spellings):
+            counts[i] += text.count(spelling, max(0, len(tail) - len(spelling) + 1))
+        if max(counts) > 1 or escapes.search(text):
+            return True
+        tail = text[-overlap:]
+    return False
+
+
+def scan_json_records(f: TextIO, keys: List[str], chunk_size: int = SCAN_CHUNK_SIZE,
+                      plan: Any = None) -> Iterator[Any]:
+    """Yield the records ``select_json_records`` selects, decoding them one at a time.
+
+    An array at the selected path is streamed element by element; any other
+    value is yielded whole (nothing for null or a missing path). Values
+    beside the path are decoded and dropped, so memory is bounded by the
+    largest single element. The whole document is still checked: a syntax
+    error raises after the records before it were yielded.
+
+    A key on the path that is repeated in its object selects its last
+    value, as with ``json.load``. Seekable streams whose text may hold such
+    a repeat are scanned twice, first to find the last occurrences.
+
+    Args:
+        f: Text stream positioned at the start of the document
+        keys: Object keys leading to the records (see :func:`selector_keys`)
+        chunk_size: Characters read per refill
+        plan: Decode plan applied to each record (see :func:`compile_decode_plan`)
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    occurrences = None
+    if keys and f.seekable():
+        start = f.tell()
+        if _keys_may_repeat(f, keys, chunk_size):
+            f.seek(start)
+            scanner = JsonScanner(f, chunk_size)
+            if scanner.peek():
+                occurrences = _last_occurrences(scanner, keys, plan)
+        f.seek(start)
+
+    scanner = JsonScanner(f, chunk_size)
+    if not scanner.peek():
+        raise scanner.error("Expecting value")
+    yield from _scan_selected(scanner, keys, plan, occurrences)
+    if scanner.peek():
+        raise scanner.error("Extra data")
+
+
+@lru_cache(maxsize=256)
+def split_wildcard_selector(selector: str) -> Tuple[str, Optional[tuple]]:
+    """Split a selector at its first ``[*]`` or ``[?(...)]`` step.
+
+    Returns ``(head, steps)``: ``head`` is the plain selector before that
+    step and ``steps`` holds one ``(predicate, path)`` pair per ``[*]`` or
+    filter step, ``predicate`` being the compiled filter (None for ``[*]``,
+    see :func:`compile_json_filter`) and ``path`` the dotted path up to the
+    next such step. ``steps`` is None for plain selectors.
+    ``"$[*].data[*].transaction"`` splits into
+    ``("$", ((None, "data"), (None, "transaction")))``.
+
+    Raises:
+        ValueError: If a filter is unterminated or malformed
+    """
+    selector = selector or ""
+    pos = _next_iteration(selector, 0)
+    if pos < 0:
+        return selector, None
+    head = selector[:pos]
+    steps = []
+    while pos >= 0:
+        if selector.startswith(WILDCARD, pos):
+            predicate, end = None, pos + len(WILDCARD)
+        else:
+            end = _filter_end(selector, pos)
+            predicate = compile_json_filter(selector[pos + len(FILTER_START):end - 2])
+        pos = _next_iteration(selector, end)
+        steps.append((predicate, selector[end:pos if pos >= 0 else len(selector)].lstrip('.')))
+    return head, tuple(steps)
+
+
+def _next_iteration(selector: str, start: int) -> int:
+    """Position of the next ``[*]`` or ``[?(`` at or after ``start``; -1 if none."""
+    found = [pos for pos in (selector.find(WILDCARD, start), selector.find(FILTER_START, start)) if pos >= 0]
+    return min(found) if found else -1
+
+
+def _filter_end(selector: str, start: int) -> int:
+    """Position after the ``)]`` closing the filter that opens at ``start``."""
+    depth = 1
+    quote = None
+    pos = start + len(FILTER_START)
+    while pos < len(selector):
+        char = selector[pos]
+        if quote:
+            if char == '\\':
+                pos += 1
+            elif char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if not depth:
+                if selector[pos + 1:pos + 2] != ']':
+                    break
+                return pos + 2
+        pos += 1
+    raise ValueError(f"Unterminated filter in selector '{selector}': expected ')]'")
+
+
+def compile_json_filter(expression: str) -> Callable[[Any], bool]:
+    """Compile a filter expression (the ``...`` of ``[?(...)]``) into a predicate on one element.
+
+    Supports:
+    - Paths: ``@`` (the element), ``@.transaction.type``, ``@.items[0]``
+    - Literals: strings (single or double quotes), numbers, ``true``, ``false``, ``null``
+    - Comparisons: ``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=``
+    - Membership: ``@.type in ['Sale', 'Return']``, ``not in``
+    - Existence: a bare path is true when the value is present and not null
+    - ``&&``, ``||``, ``!`` and parentheses
+
+    A comparison with a missing value is false, ordering comparisons only
+    hold between two numbers or two strings, and booleans never equal
+    numbers. The predicate's ``paths`` attribute lists the paths it reads
+    (``""`` for ``@`` itself).
+
+    Raises:
+        ValueError: If the expression is malformed
+    """
+    return _FilterCompiler(expression).compile()
+
+
+_FILTER_TOKEN = re.compile(r"""\s*(?:
+    (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+  | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+  | (?P<path>@(?:\.[^\s.\[\]()=!<>&|,'"]+|\[\d+\])*)
+  | (?P<op>==|!=|<=|>=|<|>|&&|\|\||!|\(|\)|\[|\]|,)
+  | (?P<word>[A-Za-z_]\w*)
+)""", re.VERBOSE)
+
+_FILTER_WORDS = {"true": True, "false": False, "null": None}
+_ORDERINGS = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge}
+
+
+def _filter_equal(left: Any, right: Any) -> bool:
+    """JSON equality: like ``==`` except that booleans never equal numbers."""
+    return left == right and isinstance(left, bool) == isinstance(right, bool)
+
+
+def _filter_ordered(left: Any, right: Any) -> bool:
+    """Whether two values can be ordered (both numbers or both strings)."""
+    if isinstance(left, str) or isinstance(right, str):
+        return isinstance(left, str) and isinstance(right, str)
+    return (isinstance(left, (int, float)) and isinstance(right, (int, float))
+            and not isinstance(left, bool) and not isinstance(right, bool))
+
+
+class _FilterCompiler:
+    """Recursive-descent compiler turning a filter expression into nested closures."""
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.tokens = []
+        pos = 0
+        while expression[pos:].strip():
+            match = _FILTER_TOKEN.match(expression, pos)
+            if not match:
+                raise self.error(f"unexpected '{expression[pos:].strip()[0]}'")
+            self.tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            pos = match.end()
+        self.pos = 0
+        self.paths: List[str] = []
+
+    def error(self, msg: str) -> ValueError:
+        return ValueError(f"Invalid filter '{self.expression}': {msg}")
+
+    def peek(self) -> Tuple[Optional[str], Optional[str]]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def accept(self, *texts: str) -> Optional[str]:
+        """Consume the next token if its text is one of ``texts``."""
+        text = self.peek()[1]
+        if text in texts:
+            self.pos += 1
+            return text
+        return None
+
+    def expect(self, text: str) -> None:
+        if not self.accept(text):
+            raise self.error(f"expected '{text}'" + (f" before '{self.peek()[1]}'" if self.peek()[1] else ""))
+
+    def compile(self) -> Callable[[Any], bool]:
+        if not self.tokens:
+            raise self.error("empty expression")
+        predicate = self.disjunction()
+        if self.pos < len(self.tokens):
+            raise self.error(f"unexpected '{self.peek()[1]}'")
+        predicate.paths = tuple(self.paths)
+        return predicate
+
+    def disjunction(self) -> Callable[[Any], bool]:
+        terms = [self.conjunction()]
+        while self.accept("||"):
+            terms.append(self.conjunction())
+        if len(terms) == 1:
+            return terms[0]
+        return lambda element: any(term(element) for term in terms)
+
+    def conjunction(self) -> Callable[[Any], bool]:
+        terms = [self.negation()]
+        while self.accept("&&"):
+            terms.append(self.negation())
+        if len(terms) == 1:
+            return terms[0]
+        return lambda element: all(term(element) for term in terms)
+
+    def negation(self) -> Callable[[Any], bool]:
+        if self.accept("!"):
+            term = self.negation()
+            return lambda element: not term(element)
+        if self.accept("("):
+            term = self.disjunction()
+            self.expect(")")
+            return term
+        return self.comparison()
+
+    def comparison(self) -> Callable[[Any], bool]:
+        kind, left = self.operand()
+        op = self.accept("==", "!=", "<", "<=", ">", ">=", "in", "not")
+        if op is None:
+            if kind != "path":
+                raise self.error("a literal needs a comparison")
+            return lambda element: left(element) is not None
+        if op == "not":
+            self.expect("in")
+            op = "not in"
+        right_kind, right = self.operand()
+        if kind == "value" and right_kind == "value":
+            raise self.error("a comparison needs a path")
+
+        if op in ("in", "not in"):
+            member = self._membership(left, kind, right, right_kind)
+            if op == "in":
+                return member
+            return lambda element: left(element) is not None and not member(element)
+        if op in ("==", "!="):
+            # Compare a path against a literal without calling the literal's getter
+            if right_kind == "value":
+                left, right = right, left
+            if kind == "value" or right_kind == "value":
+                value = left(None)
+                if op == "==":
+                    return lambda element: _filter_equal(right(element), value)
+                return lambda element: (found := right(element)) is not None and not _filter_equal(found, value)
+
+            def equal(element: Any) -> bool:
+                a, b = left(element), right(element)
+                return a is not None and b is not None and _filter_equal(a, b)
+            return equal if op == "==" else lambda element: (
+                left(element) is not None and right(element) is not None and not equal(element))
+
+        compare = _ORDERINGS[op]
+
+        def ordered(element: Any) -> bool:
+            a, b = left(element), right(element)
+            return _filter_ordered(a, b) and compare(a, b)
+        return ordered
+
+    def _membership(self, left: Callable, kind: str, right: Callable, right_kind: str) -> Callable[[Any], bool]:
+        """Predicate for ``left in right``: ``right`` must be an array."""
+        if right_kind == "value":
+            options = right(None)
+            if not isinstance(options, list):
+                raise self.error("'in' needs an array")
+            # Strings are looked up in a set; other literals keep JSON equality
+            strings = frozenset(option for option in options if isinstance(option, str))
+            others = [option for option in options if not isinstance(option, str)]
+            if not others:
+                return lambda element: isinstance(found := left(element), str) and found in strings
+            return lambda element: (found := left(element)) is not None and (
+                found in strings if isinstance(found, str) else any(_filter_equal(found, o) for o in others))
+
+        def member(element: Any) -> bool:
+            found, options = left(element), right(element)
+            return (found is not None and isinstance(options, list)
+                    and any(_filter_equal(found, option) for option in options))
+        return member
+
+    def operand(self) -> Tuple[str, Callable[[Any], Any]]:
+        """Parse a path or literal into ``(kind, getter)``; literal getters ignore their argument."""
+        kind, text = self.peek()
+        if kind is None:
+            raise self.error("unexpected end of expression")
+        self.pos += 1
+        if kind == "path":
+            path = text[1:].lstrip('.')
+            self.paths.append(path)
+            if not path:
+                return "path", lambda element: element
+            steps = compile_json_path(path)
+            return "path", lambda element: run_json_path(element, steps)
+        if text == "[":
+            values = []
+            while not self.accept("]"):
+                if values:
+                    self.expect(",")
+                value_kind, value = self.operand()
+                if value_kind != "value":
+                    raise self.error("arrays may only hold literals")
+                values.append(value(None))
+            return "value", lambda element: values
+        value = self.literal(kind, text)
+        return "value", lambda element: value
+
+    def literal(self, kind: str, text: str) -> Any:
+        if kind == "string":
+            return ast.literal_eval(text)
+        if kind == "number":
+            return float(text) if any(c in text for c in ".eE") else int(text)
+        if kind == "word" and text in _FILTER_WORDS:
+            return _FILTER_WORDS[text]
+        raise self.error(f"unexpected '{text}'")
+
+
+def _as_elements(value: Any) -> list:
+    """Elements an array-valued step yields: the items of a list, else the value itself."""
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def expand_json_wildcards(element: Any, steps: tuple) -> List[Tuple[Any, tuple]]:
+    """Apply the ``[*]``/filter steps of a selector to one element of the first such array.
+
+    Each step first drops the element if its filter does not match, then
+    follows the step's path; each further step iterates the array found
+    there (a non-array value counts as one element). As with plain
+    selectors, an array at the end of the path yields its elements.
+    Filters run before anything else is read from an element.
+
+    Args:
+        element: Element of the array selected by the selector head
+        steps: Steps from :func:`split_wildcard_selector`
+
+    Returns:
+        ``(value, parents)`` pairs, where ``parents`` holds the enclosing
+        wildcard elements, nearest last (the value itself excluded)
+    """
+    predicate, path = steps[0]
+    if predicate is not None and not predicate(element):
+        return []
+    if len(steps) == 1:
+        if not path:
+            return [(element, ())]
+        return [(item, (element,)) for item in _as_elements(extract_json_path(element, path))]
+    return [(item, (element, *parents))
+            for child in _as_elements(extract_json_path(element, path))
+            for item, parents in expand_json_wildcards(child, steps[1:])]
+
+
+def select_json_elements(data: Any, selector: str) -> List[Tuple[Any, tuple]]:
+    """Select records like :func:`select_json_records`, also expanding ``[*]`` and filter steps.
+
+    ``"$[*].data[*].transaction"`` selects the ``transaction`` of every
+    ``data`` item of every root array element, and
+    ``"$.messages[?(@.type == 'Sale')]"`` the messages whose ``type`` is
+    ``Sale``. The part before the first such step is a plain selector.
+
+    Returns:
+        ``(value, parents)`` pairs (see :func:`expand_json_wildcards`);
+        plain selectors have no parents
+    """
+    head, steps = split_wildcard_selector(selector)
+    if steps is None:
+        return [(value, ()) for value in select_json_records(data, selector)]
+    return [pair for element in select_json_records(data, head) for pair in expand_json_wildcards(element, steps)]
@@ -14,9 +14,10 @@ import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-from multi_format_parser.csv_writer import CSVWriter
+from multi_format_parser.csv_writer import DEFAULT_BUFFER_SIZE, AsyncCSVWriter, CSVWriter
 from multi_format_parser.models import ParsingStats
 from multi_format_parser.parsers import parse_csv, parse_fixed_width, parse_json, parse_xml
+from multi_format_parser.streaming import get_batch_size, parse_file_streaming
 from multi_format_parser.validators import validate_config
 from multi_format_parser.zip_utils import extract_compressed_file, is_compressed_file
 
@@ -161,9 +162,15 @@ def parse_files(
 
     logger.info(f"Format: {format_type}, Files: {len(input_files)}, Fail-fast: {fail_fast}")
 
+    streaming = config.get("streaming", False)
+    if streaming:
+        logger.info(f"Streaming mode: batches of {get_batch_size(config):,} records")
+
     # Initialize stats dict for parsers (currently unused but required by signature)
     stats = {}
     record_stats = {}
+    # Run-level counters and diagnostics, kept apart from the per-record counts in stats
+    run_stats = {"unmatched_rows": 0, "skipped_documents": 0, "diagnostics": {}}
     successful_files = 0
     failed_files = 0
 
@@ -181,7 +188,11 @@ def parse_files(
 
     # Use context manager to ensure files are always closed, even on exceptions
     # In dry-run mode, writer will be None
-    writer_or_none: Optional[CSVWriter] = None if dry_run else CSVWriter(output_dir, flush_every=flush_every)
+    # With async_writer, a background thread writes the files while parsing continues
+    buffer_size = config.get("output", {}).get("buffer_size", DEFAULT_BUFFER_SIZE)
+    writer_class = AsyncCSVWriter if config.get("output", {}).get("async_writer") else CSVWriter
+    writer_or_none: Optional[CSVWriter] = None if dry_run else writer_class(output_dir, flush_every=flush_every,
+                                                                            buffer_size=buffer_size)
 
     try:
         if writer_or_none:
@@ -258,30 +269,38 @@ def parse_files(
 
             # Wrap individual file processing in try/except for continue-on-error
             try:
-                if format_type == "xml":
+                if streaming:
+                    ok, error = parse_file_streaming(input_file, config, writer_or_none, stats, record_stats, run_stats)
+                    if not ok:
+                        raise FileProcessingError(error or f"{format_type.upper()} parse failure")
+                elif format_type == "xml":
                     # parse_xml returns (ok: bool, error: Optional[str])
-                    ok, error = parse_xml(input_file, config, writer_or_none, stats, record_stats)
+                    ok, error = parse_xml(input_file, config, writer_or_none, stats, record_stats, run_stats)
                     if not ok:
                         # File-level parse failure handled by ignoreBrokenFiles flag
                         raise FileProcessingError(error or "XML parse failure")
                 elif format_type == "csv":
                     # parse_csv returns (ok: bool, error: Optional[str])
-                    ok, error = parse_csv(input_file, config, writer_or_none, stats, record_stats)
+                    ok, error = parse_csv(input_file, config, writer_or_none, stats, record_stats, run_stats)
                     if not ok:
                         raise FileProcessingError(error or "CSV parse failure")
                 elif format_type == "fixed_width":
                     # parse_fixed_width returns (ok: bool, error: Optional[str])
-                    ok, error = parse_fixed_width(input_file, config, writer_or_none, stats, record_stats)
+                    ok, error = parse_fixed_width(input_file, config, writer_or_none, stats, record_stats, run_stats)
                     if not ok:
                         raise FileProcessingError(error or "Fixed-width parse failure")
                 elif format_type == "json":
                     # parse_json returns (ok: bool, error: Optional[str])
-                    ok, error = parse_json(input_file, config, writer_or_none, stats, record_stats)
+                    ok, error = parse_json(input_file, config, writer_or_none, stats, record_stats, run_stats)
                     if not ok:
                         raise FileProcessingError(error or "JSON parse failure")
                 else:
                     raise ValueError(f"Unsupported format: {format_type}")
 
+                if writer_or_none:
+                    # A file is done once its rows are written (errors of a background writer fail it)
+                    writer_or_none.drain()
+
                 file_duration = time.time() - file_start
                 logger.info(f"✅ Completed {input_file.name} in {file_duration:.2f}s")
                 successful_files += 1
@@ -322,12 +341,29 @@ def parse_files(
     logger.info(f"Total processing time: {total_duration:.2f}s")
     logger.info(f"Files: {successful_files} succeeded, {failed_files} failed")
 
+    unmatched_rows = run_stats["unmatched_rows"]
+    if unmatched_rows:
+        logger.info(f"Rows matching no record type: {unmatched_rows:,}")
+    skipped_documents = run_stats["skipped_documents"]
+    if skipped_documents:
+        logger.info(f"Documents skipped (failed to parse): {skipped_documents:,}")
+
+    diagnostics = run_stats["diagnostics"]
+    if "json_backend" in diagnostics:
+        def timings(key):
+            return ", ".join(f"{label} {seconds:.2f}s" for label, seconds in diagnostics[key].items()) or "none"
+        logger.info(f"JSON codec {diagnostics['json_backend']}: decoded by {timings('json_decoders')}; "
+                    f"encoded by {timings('json_encoders')}")
+
     # Populate stats dictionary with summary
     stats = {
         "processed": successful_files + failed_files,
         "succeeded": successful_files,
         "failed": failed_files,
-        "duration": total_duration
+        "duration": total_duration,
+        "unmatched_rows": unmatched_rows,
+        "skipped_documents": skipped_documents,
+        "diagnostics": diagnostics
     }
 
     return stats, record_stats, file_errors
@@ -0,0 +1,184 @@
+"""
+Parallel parsing support for large files.
+
+Files are split into byte ranges that end on record boundaries and the ranges
+are parsed in a process pool. Each worker is prepared once per run through a
+pool initializer (config, record plans), returns extracted and validated rows
+per range, and the parent writes results in input order so output files,
+stats and row numbers match a single-process run.
+"""
+
+import codecs
+import logging
+import mmap
+import os
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+
+# Encodings where b"\n" and the quote byte can only ever appear as themselves
+_ASCII_COMPATIBLE_ENCODINGS = {
+    "ascii", "utf-8", "utf-8-sig", "latin-1", "iso8859-1", "iso8859-15", "cp1252",
+}
+
+# Encodings with one byte per character (ASCII-compatible, then EBCDIC code pages)
+_SINGLE_BYTE_ENCODINGS = {
+    "ascii", "latin-1", "iso8859-1", "iso8859-15", "cp1252",
+    "cp037", "cp273", "cp500", "cp875", "cp1026", "cp1140",
+}
+
+# Per-process state built by the pool initializer
+_worker_state: Any = None
+
+
+def get_parallel_workers(config: dict) -> int:
+    """Return the configured worker count (``parallel_workers``; 0 = all cores)."""
+    workers = config.get("parallel_workers", 1)
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 0:
+        raise ValueError(f"parallel_workers must be a non-negative integer, got {workers!r}")
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def get_chunk_bytes(config: dict) -> int:
+    """Return the target byte range size (``parallel_chunk_bytes``)."""
+    chunk_bytes = config.get("parallel_chunk_bytes", DEFAULT_CHUNK_BYTES)
+    if not isinstance(chunk_bytes, int) or isinstance(chunk_bytes, bool) or chunk_bytes <= 0:
+        raise ValueError(f"parallel_chunk_bytes must be a positive integer, got {chunk_bytes!r}")
+    return chunk_bytes
+
+
+def is_ascii_compatible(encoding: str) -> bool:
+    """Check whether byte-level newline/quote scanning is safe for an encoding."""
+    try:
+        return codecs.lookup(encoding).name in _ASCII_COMPATIBLE_ENCODINGS
+    except LookupError:
+        return False
+
+
+def is_single_byte(encoding: str) -> bool:
+    """Check whether byte offsets equal character offsets for an encoding."""
+    try:
+        return codecs.lookup(encoding).name in _SINGLE_BYTE_ENCODINGS
+    except LookupError:
+        return False
+
+
+def split_byte_ranges(path: Path, start: int, chunk_bytes: int,
+                      quote: Optional[bytes] = None) -> List[Tuple[int, int]]:
+    """Split ``path`` from ``start`` into ranges ending just after a newline.
+
+    With ``quote`` set, a newline only counts as a record boundary when the
+    number of quote bytes since ``start`` is even, so newlines embedded in
+    quoted fields never split a record. Escaped quotes (``""``) add two and
+    keep the parity, which holds for RFC 4180 style CSV.
+
+    Args:
+        path: Input file
+        start: Byte offset of the first record
+        chunk_bytes: Target range size
+        quote: Quote byte for quote-aware boundaries (None = plain lines)
+
+    Returns:
+        List of ``(start, end)`` byte offsets covering ``[start, EOF)``
+    """
+    size = path.stat().st_size
+    if start >= size:
+        return []
+
+    ranges = []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos = start
+        while pos < size:
+            target = pos + chunk_bytes
+            if target >= size:
+                ranges.append((pos, size))
+                break
+
+            newline = mm.find(b"\n", target)
+            if newline != -1 and quote is not None:
+                odd = mm[pos:newline].count(quote) & 1
+                while odd and newline != -1:
+                    next_newline = mm.find(b"\n", newline + 1)
+                    if next_newline == -1:
+                        newline = -1
+                        break
+                    odd ^= mm[newline:next_newline].count(quote) & 1
+                    newline = next_newline
+
+            if newline == -1:
+                ranges.append((pos, size))
+                break
+            ranges.append((pos, newline + 1))
+            pos = newline + 1
+    return ranges
+
+
+def read_byte_range(path: Path, start: int, end: int) -> bytes:
+    """Read ``[start, end)`` from ``path``."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read(end - start)
+
+
+def _init_worker(setup: Callable, args: tuple) -> None:
+    """Pool initializer: build per-worker state once."""
+    global _worker_state
+    _worker_state = setup(*args)
+
+
+def worker_state() -> Any:
+    """Return the state built by the pool initializer in this worker."""
+    return _worker_state
+
+
+def portable_error(error: Exception) -> Exception:
+    """Return ``error`` if it survives pickling, else a RuntimeError with its message."""
+    try:
+        pickle.loads(pickle.dumps(error))
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
+
+
+def imap_ordered(func: Callable, tasks: Iterable[tuple], workers: int,
+                 setup: Callable, setup_args: tuple = (),
+                 window: Optional[int] = None) -> Iterator[Any]:
+    """Run ``func(*task)`` in a process pool and yield results in task order.
+
+    At most ``window`` tasks (default: two per worker) are in flight, which
+    bounds memory held by finished but not yet consumed results.
+
+    Args:
+        func: Module-level worker function
+        tasks: Argument tuples, one per task
+        workers: Process count
+        setup: Module-level function building per-worker state
+        setup_args: Arguments for ``setup``
+        window: Maximum tasks in flight
+
+    Yields:
+        ``func`` results in submission order
+    """
+    window = window or workers * 2
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(setup, setup_args)) as pool:
+        pending = deque()
+        try:
+            for task in tasks:
+                pending.append(pool.submit(func, *task))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Consumer stopped early (error or fail-fast): drop queued work
+            for future in pending:
+                future.cancel()
@@ -5,18 +5,23 @@ This module provides a base class that extracts common logic shared across
 all parser implementations (XML, CSV, JSON, Fixed-Width).
 """
 
+import copy
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from multi_format_parser.casting import cast_value
 from multi_format_parser.csv_writer import CSVWriter
 from multi_format_parser.formula_utils import format_formula
+from multi_format_parser.json_codec import JsonCodec
 from multi_format_parser.models import FieldDef, ParsingStats
 from multi_format_parser.validators import validate_field_value
 
 logger = logging.getLogger(__name__)
 
+# (row_num, record_name, row, validation_errors, error) - see BaseParser.apply_row_results
+RowResult = Tuple[int, Optional[str], Optional[Dict[str, Any]], Optional[List[str]], Optional[Exception]]
+
 
 class BaseParser:
     """Base class for all file format parsers.
@@ -31,21 +36,26 @@ class BaseParser:
     """
 
     def __init__(self, file_path: Path, config: dict, writer: Optional[CSVWriter],
-                 stats: dict, record_stats: Dict[str, ParsingStats]):
+                 stats: dict, record_stats: Dict[str, ParsingStats], run_stats: Optional[dict] = None):
         """Initialize parser with common configuration.
         
         Args:
             file_path: Path to input file
             config: Parser configuration dict
             writer: Optional CSV writer for output
-            stats: Row count statistics dict
+            stats: Row count statistics dict (keyed by record name)
             record_stats: Per-record parsing statistics
+            run_stats: Run-level counters such as ``unmatched_rows`` and
+                ``skipped_documents``, kept apart from ``stats`` so record names
+                cannot collide with them, and the JSON codec timings under
+                ``diagnostics``
         """
         self.file_path = file_path
         self.config = config
         self.writer = writer
         self.stats = stats
         self.record_stats = record_stats
+        self.run_stats = {} if run_stats is None else run_stats
 
         # Extract common configuration flags
         self.ignore_broken = self._get_config_flag("ignoreBrokenFiles", False)
@@ -56,6 +66,9 @@ class BaseParser:
         # Pre-build computed fields dictionary
         self.computed_fields = {c["name"]: c for c in config.get("computed_fields", [])}
 
+        # Decodes JSON documents and encodes JSON-typed fields
+        self.json_codec = JsonCodec(config.get("json_codec"), compact=config.get("json_field_text") == "compact")
+
         # Initialize stats for all records upfront
         self._initialize_record_stats()
 
@@ -154,35 +167,46 @@ class BaseParser:
                     row[field_name] = cast_value(computed_value, field_type, self.safe_mode)
         return row
 
-    def validate_and_write_row(self, record_name: str, row: Dict[str, any],
-                               columns: List[str], field_defs: List[FieldDef],
-                               row_num: Optional[int] = None) -> bool:
-        """Validate row data and write to output or rejected file.
-        
+    def validate_row(self, row: Dict[str, any], field_defs: List[FieldDef]) -> List[str]:
+        """Validate row data against field definitions.
+
+        Pure check with no side effects, so it can run in worker processes.
+
         Args:
-            record_name: Name of the record type
             row: Row data dict
-            columns: Column names
             field_defs: Field definitions for validation
-            row_num: Optional row number for logging
-            
+
         Returns:
-            True if row was valid and written, False if rejected
+            List of validation error messages (empty if the row is valid)
         """
-        # Validate fields
         validation_errors = []
         for field_def in field_defs:
-            value = row.get(field_def.name)
-            is_valid, error_msg = validate_field_value(value, field_def)
+            is_valid, error_msg = validate_field_value(row.get(field_def.name), field_def)
             if not is_valid:
                 validation_errors.append(error_msg)
-                self.record_stats[record_name].validation_errors += 1
+        return validation_errors
 
-        # Write row or reject it
+    def write_validated_row(self, record_name: str, row: Dict[str, any], columns: List[str],
+                            validation_errors: List[str], row_num: Optional[int] = None) -> bool:
+        """Write a validated row to output or rejected file and update stats.
+
+        Args:
+            record_name: Name of the record type
+            row: Row data dict
+            columns: Column names
+            validation_errors: Errors returned by :meth:`validate_row`
+            row_num: Optional row number for logging
+
+        Returns:
+            True if row was valid and written, False if rejected
+        """
         if validation_errors:
+            self.record_stats[record_name].validation_errors += len(validation_errors)
             self.record_stats[record_name].failed_rows += 1
+            error_summary = "; ".join(validation_errors)
+            if row_num is not None:
+                logger.debug(f"Rejected {record_name} row {row_num}: {error_summary}")
             if self.writer:
-                error_summary = "; ".join(validation_errors)
                 self.writer.write_rejected_row(record_name, row, error_summary, columns)
             return False
         else:
@@ -194,6 +218,79 @@ class BaseParser:
             self.stats[record_name] = self.stats.get(record_name, 0) + 1
             return True
 
+    def validate_and_write_row(self, record_name: str, row: Dict[str, any],
+                               columns: List[str], field_defs: List[FieldDef],
+                               row_num: Optional[int] = None) -> bool:
+        """Validate row data and write to output or rejected file.
+        
+        Args:
+            record_name: Name of the record type
+            row: Row data dict
+            columns: Column names
+            field_defs: Field definitions for validation
+            row_num: Optional row number for logging
+            
+        Returns:
+            True if row was valid and written, False if rejected
+        """
+        validation_errors = self.validate_row(row, field_defs)
+        return self.write_validated_row(record_name, row, columns, validation_errors, row_num)
+
+    def apply_row_results(self, results: Iterable[RowResult], columns_by_record: Dict[str, List[str]],
+                          row_offset: int = 0) -> None:
+        """Write rows extracted and validated elsewhere (e.g. in a worker process).
+
+        Each result is ``(row_num, record_name, row, validation_errors, error)``:
+        ``record_name`` is None for a row matching no record, ``row`` is None
+        when extraction failed, and ``error`` carries the row-level exception
+        to hand to :meth:`handle_row_error`.
+
+        Args:
+            results: Row results in input order
+            columns_by_record: Output columns per record name
+            row_offset: Added to each row number (rows before this chunk)
+        """
+        for row_num, record_name, row, validation_errors, error in results:
+            if record_name is None:
+                self.count_unmatched_row()
+                continue
+            row_num += row_offset
+            try:
+                if row is not None:
+                    self.record_stats[record_name].total_rows += 1
+                if error is not None:
+                    raise error
+                self.write_validated_row(record_name, row, columns_by_record[record_name],
+                                         validation_errors, row_num)
+            except Exception as row_error:
+                self.handle_row_error(record_name, row_error, row_num)
+
+    def checkpoint(self) -> tuple:
+        """Snapshot the output files and row counters, to undo a failed file with :meth:`rollback`."""
+        return (self.writer.checkpoint() if self.writer else None,
+                {name: copy.copy(pstats) for name, pstats in self.record_stats.items()},
+                dict(self.stats), self.run_stats.get("unmatched_rows", 0))
+
+    def rollback(self, checkpoint: tuple) -> None:
+        """Drop the rows written and counted since :meth:`checkpoint`."""
+        marks, record_stats, stats, unmatched_rows = checkpoint
+        if self.writer:
+            self.writer.rollback(marks)
+        self.record_stats.clear()
+        self.record_stats.update(record_stats)
+        self.stats.clear()
+        self.stats.update(stats)
+        if "unmatched_rows" in self.run_stats:
+            self.run_stats["unmatched_rows"] = unmatched_rows
+
+    def count_unmatched_row(self) -> None:
+        """Count an input row that matched no configured record type."""
+        self.run_stats["unmatched_rows"] = self.run_stats.get("unmatched_rows", 0) + 1
+
+    def count_skipped_document(self) -> None:
+        """Count a document of a multi-document stream skipped because it failed to parse."""
+        self.run_stats["skipped_documents"] = self.run_stats.get("skipped_documents", 0) + 1
+
     def log_progress(self, record_name: str, row_num: int, total_processed: int) -> None:
         """Log parsing progress at intervals.
         
@@ -239,6 +336,8 @@ class BaseParser:
             Exception: Re-raises error if ignoreBrokenFiles is False
         """
         error_msg = str(error)
+        # Time spent on a failed file still counts
+        self.report_diagnostics()
 
         if self.ignore_broken:
             logger.error(f"File parsing failed: {error_msg} (continuing due to ignoreBrokenFiles)")
@@ -250,9 +349,14 @@ class BaseParser:
             # Re-raise the error
             raise
 
+    def report_diagnostics(self) -> None:
+        """Move JSON codec timings into ``run_stats['diagnostics']``."""
+        self.json_codec.report(self.run_stats.setdefault("diagnostics", {}))
+
     def finalize_stats(self) -> None:
-        """Finalize parsing statistics with end time."""
+        """Finalize parsing statistics with end time and JSON codec timings."""
         import time
+        self.report_diagnostics()
         for record_name, pstats in self.record_stats.items():
             if pstats.end_time is None:
                 pstats.end_time = time.time()
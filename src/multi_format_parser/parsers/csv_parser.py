@@ -3,174 +3,799 @@ CSV parser module.
 """
 
 import csv
+import functools
+import io
+import itertools
 import logging
+from decimal import Decimal
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
 
 from multi_format_parser.casting import cast_value
 from multi_format_parser.csv_writer import CSVWriter
 from multi_format_parser.formula_utils import format_formula
-from multi_format_parser.models import ParsingStats
-from multi_format_parser.parsers.base_parser import BaseParser
+from multi_format_parser.models import FieldDef, ParsingStats
+from multi_format_parser.parallel import (
+    get_chunk_bytes,
+    get_parallel_workers,
+    imap_ordered,
+    is_ascii_compatible,
+    portable_error,
+    read_byte_range,
+    split_byte_ranges,
+    worker_state,
+)
+from multi_format_parser.parsers.base_parser import BaseParser, RowResult
+from multi_format_parser.validators import validate_field_value
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
 logger = logging.getLogger(__name__)
 
+# Rows per Arrow record batch converted to Python at a time
+ARROW_BATCH_ROWS = 65536
+
+# Text the Arrow engine casts in bulk, per type; it reads exactly as
+# ``cast_value`` would (other text is cast per value)
+_ARROW_DECIMAL_TEXT = r"^[+-]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][+-]?[0-9]{1,4})?$"
+_ARROW_NUMBER_TEXT = {
+    "int": r"^-?[0-9]{1,18}$",
+    "float": _ARROW_DECIMAL_TEXT,
+    "decimal": _ARROW_DECIMAL_TEXT,
+    "number": _ARROW_DECIMAL_TEXT,
+}
+
+
+def csv_reader_args(config: dict) -> dict:
+    """Build ``csv.reader`` keyword arguments from the csv_* config keys."""
+    reader_args = {
+        'delimiter': config.get("csv_delimiter", ","),
+        'quotechar': config.get("csv_quotechar", '"'),
+        'doublequote': config.get("csv_doublequote", True),
+    }
+    escapechar = config.get("csv_escapechar")
+    if escapechar is not None:
+        reader_args['escapechar'] = escapechar
+        reader_args['doublequote'] = False
+    return reader_args
+
+
+def iter_csv_rows(lines: Iterator[str], reader_args: dict, max_column: Optional[int] = None) -> Iterator[List[str]]:
+    """Yield CSV rows, splitting unquoted lines directly on the delimiter.
+
+    Lines that contain no quote (or escape) character cannot hold quoted
+    fields or embedded newlines, so they are split with ``str.split``. When
+    ``max_column`` is given the split stops after that column; the trailing
+    cell then holds the unparsed remainder of the line. Lines containing a
+    quote character are handed to ``csv.reader``, which pulls continuation
+    lines from the same iterator for multi-line quoted fields.
+
+    Args:
+        lines: Iterator over raw lines (file opened with ``newline=''``)
+        reader_args: ``csv.reader`` keyword arguments
+        max_column: Highest column index the caller reads (None = all)
+
+    Yields:
+        List of cell strings per record (an empty list for lines holding
+        nothing but delimiters and whitespace)
+    """
+    delimiter = reader_args["delimiter"]
+    quotechar = reader_args["quotechar"]
+    escapechar = reader_args.get("escapechar")
+    maxsplit = -1 if max_column is None else max_column + 1
+
+    for line in lines:
+        if quotechar in line or (escapechar is not None and escapechar in line):
+            yield next(csv.reader(itertools.chain((line,), lines), **reader_args))
+            continue
+
+        line = line.rstrip("\r\n")
+        if not line.replace(delimiter, "").strip():
+            # Only delimiters and whitespace: every cell would be blank
+            yield []
+        else:
+            yield line.split(delimiter, maxsplit)
+
+
+def _resolve_column(path, header_idx: Dict[str, int], has_header: bool) -> Optional[int]:
+    """Map a field/context path to a column index (header name or integer index)."""
+    if has_header:
+        return header_idx.get(path)
+    try:
+        col_idx = int(path)
+    except (TypeError, ValueError):
+        return None
+    return col_idx if col_idx >= 0 else None
+
+
+def build_record_plans(config: dict, parser_obj: BaseParser, header_idx: Dict[str, int],
+                       has_header: bool) -> List[dict]:
+    """Resolve each record's context and fields to column indexes once per file.
+
+    Args:
+        config: Parser configuration
+        parser_obj: Base parser (for column and field definition helpers)
+        header_idx: Header name to column index mapping
+        has_header: Whether paths are header names (True) or integer indexes
+
+    Returns:
+        One plan dict per record with ``record``, ``columns``, ``field_defs``,
+        ``context_specs``, ``field_specs`` and ``computed_specs``
+    """
+    plans = []
+    for record in config["records"]:
+        context_specs = []
+        for ctx in record.get("context", []):
+            if ctx.get("value") is not None:
+                context_specs.append((ctx["name"], ctx["value"], None))
+            elif ctx.get("from") or ctx.get("from_expr"):
+                path_key = ctx.get("from") or ctx.get("from_expr")
+                context_specs.append((ctx["name"], None, _resolve_column(path_key, header_idx, has_header)))
+            else:
+                context_specs.append((ctx["name"], None, None))
+
+        field_specs = []
+        computed_specs = []
+        for fld in record.get("fields", []):
+            if fld.get("type") == "computed":
+                field_specs.append((fld["name"], None, None))
+                if fld.get("computed_field"):
+                    comp = parser_obj.computed_fields.get(fld["computed_field"])
+                    computed_specs.append((fld["name"], fld["computed_field"], comp.get("formula", "") if comp else None))
+                continue
+
+            if not fld.get("path"):
+                logger.debug(f"Field '{fld['name']}' in record '{record['name']}' has no path configured")
+                field_specs.append((fld["name"], None, None))
+                continue
+
+            col_idx = _resolve_column(fld["path"], header_idx, has_header)
+            field_specs.append((fld["name"], col_idx, fld.get("type", "string")))
+
+        # Discriminator: a field name of this record (mirroring fixed-width) or a column reference
+        type_column = None
+        record_type_field = record.get("record_type_field")
+        record_type_value = record.get("record_type_value")
+        discriminated = record_type_field is not None and record_type_value is not None
+        if discriminated:
+            type_path = next((fld.get("path") for fld in record.get("fields", [])
+                              if fld["name"] == record_type_field), None) or record_type_field
+            type_column = _resolve_column(type_path, header_idx, has_header)
+            if type_column is None:
+                logger.warning(f"Record type field '{record_type_field}' for record '{record['name']}' "
+                               f"does not resolve to a column; the record will never match")
+
+        plans.append({
+            "record": record,
+            "order": len(plans),
+            "discriminated": discriminated,
+            "type_column": type_column,
+            "type_value": str(record_type_value) if discriminated else None,
+            "columns": parser_obj.get_columns(record),
+            "field_defs": parser_obj.build_field_defs(record),
+            "context_specs": context_specs,
+            "field_specs": field_specs,
+            "computed_specs": computed_specs,
+        })
+    return plans
+
+
+def projected_max_column(plans: List[dict]) -> Optional[int]:
+    """Return the highest column index referenced by any plan (None if none)."""
+    indexes = [col_idx for plan in plans for _, _, col_idx in plan["context_specs"] if col_idx is not None]
+    indexes += [col_idx for plan in plans for _, col_idx, _ in plan["field_specs"] if col_idx is not None]
+    indexes += [plan["type_column"] for plan in plans if plan["type_column"] is not None]
+    return max(indexes) if indexes else None
+
+
+def build_record_router(plans: List[dict], fan_out: bool = False) -> dict:
+    """Index record plans by discriminator column and value.
+
+    Records with ``record_type_field``/``record_type_value`` only receive rows
+    whose type column holds that value; records without a discriminator
+    receive every row. Unless ``fan_out`` is set, a row goes to the first
+    matching record in config order only.
+
+    Args:
+        plans: Record plans from :func:`build_record_plans`
+        fan_out: Emit each row into every matching record
+
+    Returns:
+        Router dict consumed by :func:`route_row`
+    """
+    limit = None if fan_out else 1
+    default = [plan for plan in plans if not plan["discriminated"]]
+
+    tables: Dict[int, Dict[str, List[dict]]] = {}
+    for plan in plans:
+        if plan["discriminated"] and plan["type_column"] is not None:
+            tables.setdefault(plan["type_column"], {}).setdefault(plan["type_value"], []).append(plan)
+
+    if len(tables) == 1:
+        # Common case: one type column, so candidates per value are precomputed
+        for value, matched in tables[next(iter(tables))].items():
+            matched[:] = sorted(matched + default, key=lambda p: p["order"])[:limit]
+
+    return {"tables": list(tables.items()), "default": default[:limit], "limit": limit}
+
+
+def route_row(router: dict, csv_row: List[str]) -> List[dict]:
+    """Return the record plans that should receive a parsed CSV row."""
+    tables = router["tables"]
+    if not tables:
+        return router["default"]
+
+    row_len = len(csv_row)
+    if len(tables) == 1:
+        type_column, table = tables[0]
+        if type_column < row_len:
+            return table.get(csv_row[type_column].strip(), router["default"])
+        return router["default"]
+
+    matched = []
+    for type_column, table in tables:
+        if type_column < row_len:
+            matched.extend(table.get(csv_row[type_column].strip(), ()))
+    if not matched:
+        return router["default"]
+    return sorted(matched + router["default"], key=lambda p: p["order"])[:router["limit"]]
+
+
+def build_row(plan: dict, csv_row: List[str], safe_mode: bool) -> dict:
+    """Build an output row for one record plan from a parsed CSV row."""
+    row = {}
+    row_len = len(csv_row)
+
+    for name, value, col_idx in plan["context_specs"]:
+        if col_idx is None:
+            row[name] = value
+        elif col_idx < row_len:
+            row[name] = cast_value(csv_row[col_idx].strip(), "string", safe_mode)
+        else:
+            row[name] = None
+
+    for name, col_idx, field_type in plan["field_specs"]:
+        if col_idx is not None and col_idx < row_len:
+            row[name] = cast_value(csv_row[col_idx].strip(), field_type, safe_mode)
+        else:
+            row[name] = None
+
+    apply_computed_specs(plan, row)
+    return row
+
+
+def apply_computed_specs(plan: dict, row: dict) -> None:
+    """Fill a built row's computed fields in place."""
+    for name, comp_ref, formula in plan["computed_specs"]:
+        if formula is None:
+            logger.warning(f"Computed field '{comp_ref}' referenced but not defined in computed_fields")
+            row[name] = None
+        else:
+            row[name] = format_formula(formula, row) if formula else None
+
+
+def iter_row_results(rows: Iterator[List[str]], router: dict, parser_obj: BaseParser,
+                     progress: bool = True) -> Iterator[RowResult]:
+    """Route, extract and validate parsed CSV rows.
+
+    Writing is left to :meth:`BaseParser.apply_row_results`, so the same
+    loop serves the single-process path and parallel workers.
+
+    Args:
+        rows: Parsed rows from :func:`iter_csv_rows`
+        router: Router from :func:`build_record_router`
+        parser_obj: Base parser (cast mode and validation)
+        progress: Log progress every ``progress_interval`` rows
+
+    Yields:
+        Row results numbered from 1 within ``rows``
+    """
+    safe_mode = parser_obj.safe_mode
+    row_num = 0
+    for csv_row in rows:
+        row_num += 1
+
+        # Log progress periodically
+        if progress:
+            parser_obj.log_progress("CSV", row_num, row_num)
+
+        # Skip completely empty rows
+        if not csv_row:
+            logger.debug(f"Skipping empty row at line {row_num}")
+            continue
+
+        # Skip rows where all cells are empty/whitespace
+        if all(not cell or cell.strip() == '' for cell in csv_row):
+            logger.debug(f"Skipping blank row at line {row_num}")
+            continue
+
+        # Route row to its record type(s) - the first match only unless csv_fan_out is set
+        matched_plans = route_row(router, csv_row)
+        if not matched_plans:
+            yield (row_num, None, None, None, None)
+            continue
+
+        for plan in matched_plans:
+            record_name = plan["record"]["name"]
+            row = None
+            try:
+                row = build_row(plan, csv_row, safe_mode)
+                validation_errors = parser_obj.validate_row(row, plan["field_defs"])
+            except Exception as row_error:
+                yield (row_num, record_name, row, None, row_error)
+                break  # Skip to next row
+            yield (row_num, record_name, row, validation_errors, None)
+
+
+def _csv_worker_setup(config: dict, header_idx: Dict[str, int], has_header: bool) -> dict:
+    """Prepare record plans once per worker process."""
+    parser_obj = BaseParser(Path(), config, None, {}, {})
+    plans = build_record_plans(config, parser_obj, header_idx, has_header)
+    return {
+        "parser": parser_obj,
+        "router": build_record_router(plans, config.get("csv_fan_out", False)),
+        "max_column": projected_max_column(plans),
+        "reader_args": csv_reader_args(config),
+        "encoding": config.get("csv_encoding", "utf-8"),
+    }
+
+
+def _parse_csv_range(csv_path: Path, start: int, end: int) -> Tuple[int, List[RowResult]]:
+    """Parse one byte range in a worker; returns (rows read, row results)."""
+    state = worker_state()
+    text = read_byte_range(csv_path, start, end).decode(state["encoding"])
+    rows_read = 0
+
+    def counted_rows():
+        nonlocal rows_read
+        for csv_row in iter_csv_rows(io.StringIO(text, newline=''), state["reader_args"], state["max_column"]):
+            rows_read += 1
+            yield csv_row
+
+    results = []
+    for row_num, record_name, row, validation_errors, error in iter_row_results(counted_rows(), state["router"],
+                                                                                state["parser"], progress=False):
+        if error is not None:
+            error = portable_error(error)
+        results.append((row_num, record_name, row, validation_errors, error))
+    return rows_read, results
+
+
+def _read_record_bytes(f: BinaryIO, quote: bytes) -> bytes:
+    """Read one raw record, following newlines inside quoted fields."""
+    record = f.readline()
+    while record.count(quote) & 1:
+        line = f.readline()
+        if not line:
+            break
+        record += line
+    return record
+
+
+def _read_preamble(f: BinaryIO, skip_rows: int, has_header: bool, quote: bytes) -> bytes:
+    """Skip ``skip_rows`` lines and return the raw header record (may span lines)."""
+    for _ in range(skip_rows):
+        f.readline()
+    if not has_header:
+        return b""
+    return _read_record_bytes(f, quote)
+
+
+def _parse_record_bytes(raw: bytes, encoding: str, reader_args: dict) -> Optional[List[str]]:
+    """Parse one raw record with ``csv.reader`` (None if empty)."""
+    return next(csv.reader(io.StringIO(raw.decode(encoding), newline=''), **reader_args), None)
+
+
+def _read_csv_arrow(csv_path: Path, config: dict, reader_args: dict,
+                    encoding: str) -> Tuple[Optional[List[str]], Optional["pa.Table"]]:
+    """Tokenize a CSV file with ``pyarrow.csv``, every column read as text.
+
+    Skipped lines and the header are consumed with the same rules as the
+    stdlib path; Arrow only sees the data. Column names are positional, so
+    every column can be typed as string up front (no type inference).
+
+    Returns:
+        Tuple of (header, table); table is None for a file without data rows
+
+    Raises:
+        pyarrow.ArrowInvalid: Input Arrow cannot tokenize like ``csv.reader``
+            (e.g. rows with differing column counts)
+    """
+    has_header = config.get("csv_has_header", True)
+    quote = reader_args["quotechar"].encode(encoding)
+
+    with open(csv_path, "rb") as f:
+        header_bytes = _read_preamble(f, config.get("csv_skip_rows", 0), has_header, quote)
+        header = _parse_record_bytes(header_bytes, encoding, reader_args) if header_bytes else None
+
+        data_start = f.tell()
+        # Without a header the first non-blank record sizes the columns
+        first_row = header
+        while not first_row:
+            raw = _read_record_bytes(f, quote)
+            if not raw:
+                return header, None
+            first_row = _parse_record_bytes(raw, encoding, reader_args)
+        f.seek(data_start)
+
+        column_names = [str(i) for i in range(len(first_row))]
+        table = pa_csv.read_csv(
+            f,
+            read_options=pa_csv.ReadOptions(column_names=column_names, encoding=encoding),
+            parse_options=pa_csv.ParseOptions(
+                delimiter=reader_args["delimiter"],
+                quote_char=reader_args["quotechar"],
+                double_quote=reader_args["doublequote"],
+                escape_char=reader_args.get("escapechar") or False,
+                newlines_in_values=True,
+                ignore_empty_lines=False,
+            ),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in column_names},
+                strings_can_be_null=False,
+                quoted_strings_can_be_null=False,
+            ),
+        )
+    return header, table
+
+
+def _arrow_cast_column(texts: "pa.Array", field_type: str, safe_mode: bool,
+                       errors: Dict[int, Exception]) -> Tuple[list, Optional["pa.Array"]]:
+    """Cast a trimmed text column; returns (values, float64 array for range checks or None).
+
+    Int and float text in plain notation is converted by Arrow, decimal
+    text by ``Decimal``; other text and types go through ``cast_value``
+    per value, so values match :func:`build_row`. The float64 array is
+    null where a value was cast per value. Strict-mode cast failures are
+    recorded per row in ``errors``.
+    """
+    t = (field_type or "string").lower()
+    if t == "string":
+        return [text or None for text in texts.to_pylist()], None
+
+    pattern = _ARROW_NUMBER_TEXT.get(t)
+    if pattern is None:
+        fast = None
+        values = [None] * len(texts)
+        slow = range(len(texts))
+        slow_texts = texts.to_pylist()
+    else:
+        fast = pc.match_substring_regex(texts, pattern)
+        fast_texts = pc.if_else(fast, texts, pa.scalar(None, pa.string()))
+        numbers = pc.cast(fast_texts, pa.float64())
+        if t == "int":
+            values = pc.cast(fast_texts, pa.int64()).to_pylist()
+        elif t == "float":
+            values = numbers.to_pylist()
+        else:
+            values = [None if text is None else Decimal(text) for text in fast_texts.to_pylist()]
+        slow_indexes = pc.indices_nonzero(pc.invert(fast))
+        slow = slow_indexes.to_pylist()
+        slow_texts = texts.take(slow_indexes).to_pylist()
+
+    for i, text in zip(slow, slow_texts):
+        try:
+            values[i] = cast_value(text or None, t, safe_mode)
+        except Exception as cast_error:
+            errors.setdefault(i, cast_error)
+    return values, None if fast is None else numbers
+
+
+def _arrow_validate(columns: Dict[str, list], numeric: Dict[str, "pa.Array"], field_defs: List[FieldDef],
+                    count: int) -> Dict[int, List[str]]:
+    """Validate whole columns; returns error messages by row (rows without errors omitted).
+
+    Messages and their order match :meth:`BaseParser.validate_row`.
+    """
+    errors: Dict[int, List[str]] = {}
+    for field_def in field_defs:
+        values = columns.get(field_def.name, [None] * count)
+        bounds = [bound for bound in (field_def.min_value, field_def.max_value) if bound is not None]
+        if field_def.nullable and not field_def.regex and not bounds:
+            continue
+
+        numbers = numeric.get(field_def.name)
+        if numbers is not None and all(float(bound) == bound for bound in bounds):
+            # Numbers cast in bulk are never null or text: only range checks can fail
+            failed = pc.is_null(numbers)
+            if field_def.min_value is not None:
+                failed = pc.or_(failed, pc.fill_null(pc.less(numbers, field_def.min_value), False))
+            if field_def.max_value is not None:
+                failed = pc.or_(failed, pc.fill_null(pc.greater(numbers, field_def.max_value), False))
+            candidates = pc.indices_nonzero(failed).to_pylist()
+        elif not field_def.regex and not bounds:
+            candidates = [i for i, value in enumerate(values) if value is None or value == '']
+        else:
+            candidates = range(count)
+
+        for i in candidates:
+            is_valid, error_msg = validate_field_value(values[i], field_def)
+            if not is_valid:
+                errors.setdefault(i, []).append(error_msg)
+    return errors
+
+
+def _arrow_plan_rows(batch: "pa.RecordBatch", take: "pa.Array", plan: dict, trimmed: Callable[[int], "pa.Array"],
+                     safe_mode: bool) -> Tuple[List[Optional[dict]], Dict[int, List[str]], Dict[int, Exception]]:
+    """Build, cast and validate one record's rows of a batch column by column.
+
+    Returns:
+        Tuple of (rows, validation errors by row, row errors by row); rows
+        are None where extraction failed
+    """
+    count = len(take)
+    num_columns = batch.num_columns
+    names = []
+    columns: Dict[str, list] = {}
+    numeric: Dict[str, "pa.Array"] = {}
+    errors: Dict[int, Exception] = {}
+
+    for name, value, col_idx in plan["context_specs"]:
+        names.append(name)
+        numeric.pop(name, None)
+        if col_idx is None:
+            columns[name] = [value] * count
+        elif col_idx < num_columns:
+            columns[name] = [text or None for text in trimmed(col_idx).take(take).to_pylist()]
+        else:
+            columns[name] = [None] * count
+
+    for name, col_idx, field_type in plan["field_specs"]:
+        names.append(name)
+        numeric.pop(name, None)
+        if col_idx is not None and col_idx < num_columns:
+            columns[name], numbers = _arrow_cast_column(trimmed(col_idx).take(take), field_type, safe_mode, errors)
+            if numbers is not None:
+                numeric[name] = numbers
+        else:
+            columns[name] = [None] * count
+
+    rows: List[Optional[dict]] = []
+    for i, values in enumerate(zip(*(columns[name] for name in names))):
+        if i in errors:
+            rows.append(None)
+            continue
+        row = dict(zip(names, values))
+        if plan["computed_specs"]:
+            try:
+                apply_computed_specs(plan, row)
+            except Exception as row_error:
+                errors[i] = row_error
+                row = None
+        rows.append(row)
+    for name, _, _ in plan["computed_specs"]:
+        numeric.pop(name, None)
+        columns[name] = [row.get(name) if row is not None else None for row in rows]
+
+    return rows, _arrow_validate(columns, numeric, plan["field_defs"], count), errors
+
+
+def _arrow_batch_results(batch: "pa.RecordBatch", plans: List[dict], router: dict, parser_obj: BaseParser,
+                         first_row: int) -> List[RowResult]:
+    """Route, extract and validate a record batch column by column, like :func:`iter_row_results`.
+
+    Blank rows are found column-wise and skipped; rows are only built as
+    dicts for the writer.
+    """
+    num_columns = batch.num_columns
+    trimmed_columns: Dict[int, "pa.Array"] = {}
+
+    def trimmed(col_idx):
+        if col_idx not in trimmed_columns:
+            trimmed_columns[col_idx] = pc.utf8_trim_whitespace(batch.column(col_idx))
+        return trimmed_columns[col_idx]
+
+    interval = parser_obj.progress_interval
+    if interval > 0:
+        for row_num in range(first_row - first_row % interval + interval, first_row + batch.num_rows + 1, interval):
+            parser_obj.log_progress("CSV", row_num, row_num)
+
+    blank = functools.reduce(pc.and_, (pc.equal(trimmed(i), "") for i in range(num_columns)))
+    kept = pc.indices_nonzero(pc.invert(blank))
+    row_indexes = kept.to_pylist()
+
+    # Route each distinct combination of discriminator values once
+    type_columns = [type_column for type_column, _ in router["tables"] if type_column < num_columns]
+    if router["tables"]:
+        routes_by_key: Dict[tuple, List[dict]] = {}
+        routes = []
+        for key in zip(*(batch.column(col_idx).take(kept).to_pylist() for col_idx in type_columns)):
+            matched = routes_by_key.get(key)
+            if matched is None:
+                cells = [""] * num_columns
+                for col_idx, value in zip(type_columns, key):
+                    cells[col_idx] = value
+                matched = routes_by_key[key] = route_row(router, cells)
+            routes.append(matched)
+    else:
+        routes = [router["default"]] * len(row_indexes)
+
+    positions: Dict[int, List[int]] = {plan["order"]: [] for plan in plans}
+    for pos, matched in enumerate(routes):
+        for plan in matched:
+            positions[plan["order"]].append(row_indexes[pos])
+    built = {plan["order"]: _arrow_plan_rows(batch, pa.array(positions[plan["order"]], pa.int64()), plan,
+                                             trimmed, parser_obj.safe_mode)
+             for plan in plans if positions[plan["order"]]}
+
+    results = []
+    next_index = dict.fromkeys(built, 0)
+    for pos, matched in enumerate(routes):
+        row_num = first_row + row_indexes[pos] + 1
+        if not matched:
+            results.append((row_num, None, None, None, None))
+            continue
+        indexes = [next_index[plan["order"]] for plan in matched]
+        for plan in matched:
+            next_index[plan["order"]] += 1
+        for plan, i in zip(matched, indexes):
+            rows, validation_errors, row_errors = built[plan["order"]]
+            record_name = plan["record"]["name"]
+            if i in row_errors:
+                results.append((row_num, record_name, None, None, row_errors[i]))
+                break  # Skip to next row
+            results.append((row_num, record_name, rows[i], validation_errors.get(i, []), None))
+    return results
+
+
+def iter_arrow_results(table: "pa.Table", plans: List[dict], router: dict,
+                       parser_obj: BaseParser) -> Iterator[RowResult]:
+    """Yield row results for an Arrow table, one record batch at a time (see :func:`_arrow_batch_results`).
+
+    Args:
+        table: Table from :func:`_read_csv_arrow`
+        plans: Record plans from :func:`build_record_plans`
+        router: Router from :func:`build_record_router`
+        parser_obj: Base parser (cast mode and progress)
+
+    Yields:
+        Row results numbered from 1 within the table
+    """
+    first_row = 0
+    for batch in table.to_batches(max_chunksize=ARROW_BATCH_ROWS):
+        yield from _arrow_batch_results(batch, plans, router, parser_obj, first_row)
+        first_row += batch.num_rows
+
 
-def parse_csv(csv_path: Path, config: dict, writer: Optional[CSVWriter], stats: dict, record_stats: Dict[str, ParsingStats]) -> Tuple[bool, Optional[str]]:
+def _parse_csv_arrow(csv_path: Path, config: dict, parser_obj: BaseParser, reader_args: dict,
+                     encoding: str) -> bool:
+    """Parse a CSV file with the Arrow tokenizer.
+
+    Returns:
+        False if Arrow is unavailable or cannot read the file (caller uses the stdlib reader)
+    """
+    if not HAS_PYARROW:
+        logger.warning("csv_engine 'arrow' requires pyarrow (pip install pyarrow); using the stdlib reader")
+        return False
+    if not is_ascii_compatible(encoding):
+        logger.warning(f"csv_engine 'arrow' does not support encoding '{encoding}'; using the stdlib reader")
+        return False
+
+    try:
+        header, table = _read_csv_arrow(csv_path, config, reader_args, encoding)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+        # Nothing has been written yet, so the stdlib reader can take over
+        logger.warning(f"Arrow CSV reader failed for {csv_path.name} ({e}); using the stdlib reader")
+        return False
+
+    header_idx = {name: i for i, name in enumerate(header)} if header else {}
+    record_plans = build_record_plans(config, parser_obj, header_idx, bool(header))
+    if table is not None:
+        router = build_record_router(record_plans, config.get("csv_fan_out", False))
+        columns_by_record = {plan["record"]["name"]: plan["columns"] for plan in record_plans}
+        parser_obj.apply_row_results(iter_arrow_results(table, record_plans, router, parser_obj), columns_by_record)
+    return True
+
+
+def _parallel_csv_unsupported(config: dict, encoding: str, reader_args: dict) -> Optional[str]:
+    """Return why a file cannot be split into byte ranges (None if it can)."""
+    if not is_ascii_compatible(encoding):
+        return f"encoding '{encoding}' is not ASCII-compatible"
+    if "escapechar" in reader_args:
+        return "csv_escapechar is set"
+    if len(reader_args["quotechar"].encode(encoding)) != 1:
+        return "quote character is not a single byte"
+    return None
+
+
+def _parse_csv_parallel(csv_path: Path, config: dict, parser_obj: BaseParser, workers: int) -> bool:
+    """Parse a CSV file over byte ranges in a process pool.
+
+    Returns:
+        False if the file is too small to split (caller parses it in-process)
+    """
+    has_header = config.get("csv_has_header", True)
+    encoding = config.get("csv_encoding", "utf-8")
+    reader_args = csv_reader_args(config)
+    quote = reader_args["quotechar"].encode(encoding)
+
+    with open(csv_path, "rb") as f:
+        header_bytes = _read_preamble(f, config.get("csv_skip_rows", 0), has_header, quote)
+        data_start = f.tell()
+
+    ranges = split_byte_ranges(csv_path, data_start, get_chunk_bytes(config), quote)
+    if len(ranges) < 2:
+        return False
+
+    header = None
+    header_idx = {}
+    if header_bytes:
+        header = _parse_record_bytes(header_bytes, encoding, reader_args)
+        if header:
+            header_idx = {name: i for i, name in enumerate(header)}
+
+    plans = build_record_plans(config, parser_obj, header_idx, bool(header))
+    columns_by_record = {plan["record"]["name"]: plan["columns"] for plan in plans}
+    logger.info(f"Parsing {csv_path.name} in {len(ranges)} ranges with {workers} workers")
+
+    row_offset = 0
+    tasks = ((csv_path, start, end) for start, end in ranges)
+    chunk_results = imap_ordered(_parse_csv_range, tasks, workers,
+                                 _csv_worker_setup, (config, header_idx, bool(header)))
+    try:
+        for rows_read, results in chunk_results:
+            parser_obj.apply_row_results(results, columns_by_record, row_offset)
+            row_offset += rows_read
+            if parser_obj.progress_interval > 0:
+                logger.info(f"[CSV] Processed {row_offset:,} rows")
+    finally:
+        chunk_results.close()
+    return True
+
+
+def parse_csv(csv_path: Path, config: dict, writer: Optional[CSVWriter], stats: dict, record_stats: Dict[str, ParsingStats],
+              run_stats: Optional[dict] = None) -> Tuple[bool, Optional[str]]:
     """Parse CSV file.
-    
+
     Returns:
         Tuple[bool, Optional[str]]: (success, error_message)
     """
-    parser_obj = BaseParser(csv_path, config, writer, stats, record_stats)
+    parser_obj = BaseParser(csv_path, config, writer, stats, record_stats, run_stats)
 
     try:
-        delimiter = config.get("csv_delimiter", ",")
-        quotechar = config.get("csv_quotechar", '"')
-        escapechar = config.get("csv_escapechar")
-        doublequote = config.get("csv_doublequote", True)
         has_header = config.get("csv_has_header", True)
         skip_rows = config.get("csv_skip_rows", 0)
         encoding = config.get("csv_encoding", "utf-8")
-
-        # Pre-build field mappings for all records
-        record_field_maps = []
+        reader_args = csv_reader_args(config)
+
+        if config.get("csv_engine", "python") == "arrow" and _parse_csv_arrow(csv_path, config, parser_obj,
+                                                                               reader_args, encoding):
+            parser_obj.finalize_stats()
+            return (True, None)
+
+        workers = get_parallel_workers(config)
+        if workers > 1:
+            reason = _parallel_csv_unsupported(config, encoding, reader_args)
+            if reason:
+                logger.warning(f"Parallel parsing disabled for {csv_path.name}: {reason}")
+            elif _parse_csv_parallel(csv_path, config, parser_obj, workers):
+                parser_obj.finalize_stats()
+                return (True, None)
 
         with open(csv_path, encoding=encoding, newline='') as f:
             for _ in range(skip_rows):
                 next(f, None)
 
-            reader_args = {'delimiter': delimiter, 'quotechar': quotechar, 'doublequote': doublequote}
-            if escapechar is not None:
-                reader_args['escapechar'] = escapechar
-                reader_args['doublequote'] = False
-
-            reader = csv.reader(f, **reader_args)
-
             header = None
             header_idx = {}
             if has_header:
-                header = next(reader, None)
+                header = next(csv.reader(f, **reader_args), None)
                 if header:
                     header_idx = {name: i for i, name in enumerate(header)}
 
-            for record in config["records"]:
-                field_map = {}
-                for fld in record.get("fields", []):
-                    if fld.get("type") == "computed" or not fld.get("path"):
-                        if not fld.get("path") and fld.get("type") != "computed":
-                            logger.debug(f"Field '{fld['name']}' in record '{record['name']}' has no path configured")
-                        continue
-
-                    if header:
-                        field_map[fld["name"]] = header_idx.get(fld["path"])
-                    else:
-                        try:
-                            field_map[fld["name"]] = int(fld["path"])
-                        except ValueError:
-                            field_map[fld["name"]] = None
-
-                columns = parser_obj.get_columns(record)
-                field_defs = parser_obj.build_field_defs(record)
-
-                record_field_maps.append({
-                    "record": record,
-                    "field_map": field_map,
-                    "columns": columns,
-                    "field_defs": field_defs
-                })
-
-            row_num = 0
-            for csv_row in reader:
-                row_num += 1
-
-                # Log progress periodically
-                parser_obj.log_progress("CSV", row_num, row_num)
-
-                # Skip completely empty rows
-                if not csv_row:
-                    logger.debug(f"Skipping empty row at line {row_num}")
-                    continue
-
-                # Skip rows where all cells are empty/whitespace
-                if all(not cell or cell.strip() == '' for cell in csv_row):
-                    logger.debug(f"Skipping blank row at line {row_num}")
-                    continue
-
-                # Process row with first matching record type only
-                # (prevents duplicate processing when multiple records are configured)
-                row_processed = False
-                for record_info in record_field_maps:
-                    record = record_info["record"]
-                    field_map = record_info["field_map"]
-                    columns = record_info["columns"]
-                    field_defs = record_info["field_defs"]
-
-                    # Wrap row processing in try-except if continueOnError is enabled
-                    try:
-                        row = {}
-
-                        # Extract context
-                        for ctx in record.get("context", []):
-                            if ctx.get("value") is not None:
-                                row[ctx["name"]] = ctx["value"]
-                            elif ctx.get("from") or ctx.get("from_expr"):
-                                # Context extraction from CSV columns
-                                path_key = ctx.get("from") or ctx.get("from_expr")
-                                if header:
-                                    col_idx = header_idx.get(path_key)
-                                else:
-                                    try:
-                                        col_idx = int(path_key)
-                                    except ValueError:
-                                        col_idx = None
-
-                                if col_idx is not None and 0 <= col_idx < len(csv_row):
-                                    cell = csv_row[col_idx].strip()
-                                    row[ctx["name"]] = cast_value(cell, "string", parser_obj.safe_mode)
-                                else:
-                                    row[ctx["name"]] = None
-                            else:
-                                row[ctx["name"]] = None
-
-                        # Extract fields
-                        for fld in record.get("fields", []):
-                            if fld.get("type") == "computed":
-                                row[fld["name"]] = None
-                                continue
-
-                            col_idx = field_map.get(fld["name"])
-                            if col_idx is not None and 0 <= col_idx < len(csv_row):
-                                cell = csv_row[col_idx].strip()
-                                row[fld["name"]] = cast_value(cell, fld.get("type", "string"), parser_obj.safe_mode)
-                            else:
-                                row[fld["name"]] = None
-
-                        for fld in record.get("fields", []):
-                            if fld.get("type") == "computed" and fld.get("computed_field"):
-                                comp = parser_obj.computed_fields.get(fld["computed_field"])
-                                if comp:
-                                    formula = comp.get("formula", "")
-                                    row[fld["name"]] = format_formula(formula, row) if formula else None
-                                else:
-                                    logger.warning(f"Computed field '{fld['computed_field']}' referenced but not defined in computed_fields")
-                                    row[fld["name"]] = None
-
-                        record_name = record["name"]
-                        record_stats[record_name].total_rows += 1
-
-                        # Validate and write row
-                        parser_obj.validate_and_write_row(record_name, row, columns, field_defs, row_num)
-
-                        # Mark row as processed and break to prevent duplicate processing
-                        # If you need ALL records to process each row, remove this break
-                        row_processed = True
-                        break
-
-                    except Exception as row_error:
-                        # Handle row-level errors using base parser
-                        parser_obj.handle_row_error(record["name"], row_error, row_num)
-                        break  # Skip to next row
+            # Pre-build column mappings for all records
+            record_plans = build_record_plans(config, parser_obj, header_idx, bool(header))
+            router = build_record_router(record_plans, config.get("csv_fan_out", False))
+            rows = iter_csv_rows(f, reader_args, projected_max_column(record_plans))
+
+            columns_by_record = {plan["record"]["name"]: plan["columns"] for plan in record_plans}
+            parser_obj.apply_row_results(iter_row_results(rows, router, parser_obj), columns_by_record)
 
         parser_obj.finalize_stats()
         return (True, None)
@@ -2,212 +2,980 @@
 Fixed-width file parser module.
 """
 
+import io
 import logging
+import mmap
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+from multi_format_parser.binary_fields import BINARY_TYPES, make_column_decoder, make_field_decoder
 from multi_format_parser.casting import cast_value
 from multi_format_parser.csv_writer import CSVWriter
 from multi_format_parser.formula_utils import format_formula
-from multi_format_parser.models import ParsingStats
-from multi_format_parser.parsers.base_parser import BaseParser
+from multi_format_parser.models import FieldDef, ParsingStats
+from multi_format_parser.parallel import (
+    get_chunk_bytes,
+    get_parallel_workers,
+    imap_ordered,
+    is_ascii_compatible,
+    is_single_byte,
+    portable_error,
+    read_byte_range,
+    split_byte_ranges,
+    worker_state,
+)
+from multi_format_parser.parsers.base_parser import BaseParser, RowResult
+from multi_format_parser.validators import validate_field_value
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 logger = logging.getLogger(__name__)
 
+# Lines per block parsed as arrays by the NumPy engine
+NUMPY_BLOCK_ROWS = 65536
 
-def parse_fixed_width(file_path: Path, config: dict, writer: Optional[CSVWriter], stats: dict, record_stats: Dict[str, ParsingStats]) -> Tuple[bool, Optional[str]]:
+
+def build_record_specs(config: dict, parser_obj: BaseParser) -> List[dict]:
+    """Resolve each record's field positions once per file.
+
+    Args:
+        config: Parser configuration
+        parser_obj: Base parser (for column and field definition helpers)
+
+    Returns:
+        One spec dict per record with ``order``, ``record``, ``field_specs``
+        (name to ``(start, end)``), ``columns``, ``field_defs``,
+        ``record_type_field``, ``record_type_value``, ``rolling_context``
+        (``(name, source record, source field)`` per ``from_record``
+        context) and ``keeps_state``
+    """
+    record_specs = []
+    for record in config["records"]:
+        # Build record type identifier if present
+        record_type_field = record.get("record_type_field")
+        record_type_value = record.get("record_type_value")
+
+        field_specs = {}
+        for fld in record.get("fields", []):
+            if fld.get("type") == "computed":
+                continue
+            start = fld.get("start")
+            end = fld.get("end")
+            width = fld.get("width")
+
+            if start is None:
+                logger.warning(f"Field '{fld['name']}' in record '{record['name']}' has no start position defined")
+                continue
+
+            # Calculate end from width if not explicitly provided
+            if end is None and width is not None:
+                end = start + width
+
+            # Validation: end must be set and greater than start
+            if end is None:
+                logger.warning(f"Field '{fld['name']}' in record '{record['name']}' has no end or width defined")
+                continue
+
+            if end <= start:
+                logger.warning(f"Field '{fld['name']}' in record '{record['name']}' has end ({end}) <= start ({start})")
+                continue
+
+            field_specs[fld["name"]] = (start, end)
+
+        columns = parser_obj.get_columns(record)
+        field_defs = parser_obj.build_field_defs(record)
+
+        record_specs.append({
+            "order": len(record_specs),
+            "record": record,
+            "field_specs": field_specs,
+            "columns": columns,
+            "field_defs": field_defs,
+            "record_type_field": record_type_field,
+            "record_type_value": record_type_value,
+            "rolling_context": [(ctx["name"], ctx["from_record"], ctx.get("field", ctx["name"]))
+                                for ctx in record.get("context", []) if ctx.get("from_record")],
+        })
+
+    # Rows of these records are kept as the latest of their type for from_record context
+    sources = {source for info in record_specs for _, source, _ in info["rolling_context"]}
+    for info in record_specs:
+        info["keeps_state"] = info["record"]["name"] in sources
+    return record_specs
+
+
+def has_rolling_context(config: dict) -> bool:
+    """Check whether any record takes context from the latest row of another record."""
+    return any(ctx.get("from_record") for record in config["records"] for ctx in record.get("context", []))
+
+
+def build_record_index(record_specs: List[dict]) -> dict:
+    """Index record specs by record type slice and value, once per file.
+
+    Records are grouped by the ``(start, end)`` slice of their record type
+    field, so matching a line costs one slice and one dict lookup per
+    distinct slice instead of one per record. Records without a record
+    type receive every line, as before.
+
+    Args:
+        record_specs: Specs from :func:`build_record_specs`
+
+    Returns:
+        Index dict consumed by :func:`match_record_specs`
+    """
+    default = []
+    tables: Dict[Tuple[int, int], Dict[str, List[dict]]] = {}
+    for record_info in record_specs:
+        record_type_field = record_info.get("record_type_field")
+        record_type_value = record_info.get("record_type_value")
+        if record_type_field is None or record_type_value is None:
+            default.append(record_info)
+            continue
+        type_spec = record_info["field_specs"].get(record_type_field)
+        if type_spec is None:
+            logger.warning(f"Record type field '{record_type_field}' not found in field specs for record '{record_info['record']['name']}'")
+            continue
+        tables.setdefault(type_spec, {}).setdefault(str(record_type_value), []).append(record_info)
+
+    if len(tables) == 1:
+        # Common case: one type slice, so candidates per value are precomputed
+        for value, matched in next(iter(tables.values())).items():
+            matched[:] = sorted(matched + default, key=lambda info: info["order"])
+
+    typed = any(r.get("record_type_field") is not None for r in record_specs)
+    return {
+        "tables": list(tables.items()),
+        "default": default,
+        # With no record type configured anywhere, every record gets every line
+        "typed": typed,
+    }
+
+
+def match_record_specs(index: dict, line: str) -> List[dict]:
+    """Return the record specs a line belongs to (empty if it matches none)."""
+    tables = index["tables"]
+    line_len = len(line)
+    if len(tables) == 1:
+        (start, end), table = tables[0]
+        if start < line_len:
+            return table.get(line[start:end].strip(), index["default"])
+        return index["default"]
+
+    matched = []
+    for (start, end), table in tables:
+        if start < line_len:
+            matched.extend(table.get(line[start:end].strip(), ()))
+    if not matched:
+        return index["default"]
+    return sorted(matched + index["default"], key=lambda info: info["order"])
+
+
+def match_record_bytes(index: dict, line: bytes, encoding: str) -> List[dict]:
+    """Bytes-line variant of :func:`match_record_specs` (decodes only the type slices)."""
+    tables = index["tables"]
+    line_len = len(line)
+    if len(tables) == 1:
+        (start, end), table = tables[0]
+        if start < line_len:
+            return table.get(line[start:end].decode(encoding).strip(), index["default"])
+        return index["default"]
+
+    matched = []
+    for (start, end), table in tables:
+        if start < line_len:
+            matched.extend(table.get(line[start:end].decode(encoding).strip(), ()))
+    if not matched:
+        return index["default"]
+    return sorted(matched + index["default"], key=lambda info: info["order"])
+
+
+def build_row(record_info: dict, line: str, line_num: int, parser_obj: BaseParser,
+              rolling: Optional[Dict[str, dict]] = None) -> dict:
+    """Build an output row for one record spec from a fixed-width line.
+
+    ``rolling`` maps record names to their latest row, for ``from_record``
+    context (see :func:`iter_line_results`).
+    """
+    record = record_info["record"]
+    field_specs = record_info["field_specs"]
+    row = {}
+
+    # Extract context
+    for ctx in record.get("context", []):
+        if ctx.get("value") is not None:
+            row[ctx["name"]] = ctx["value"]
+        elif ctx.get("from") or ctx.get("from_expr"):
+            # Context extraction from fixed-width positions
+            # Use field_specs to find the position for the context field
+            path_key = ctx.get("from") or ctx.get("from_expr")
+            spec = field_specs.get(path_key)
+            if spec:
+                start, end = spec
+                if start < len(line):
+                    actual_end = min(end, len(line))
+                    val = line[start:actual_end].strip()
+                    row[ctx["name"]] = cast_value(val, "string", parser_obj.safe_mode)
+                else:
+                    row[ctx["name"]] = None
+            else:
+                row[ctx["name"]] = None
+        else:
+            row[ctx["name"]] = None
+
+    # Extract fields
+    for fld in record.get("fields", []):
+        if fld.get("type") == "computed":
+            row[fld["name"]] = None
+            continue
+
+        spec = field_specs.get(fld["name"])
+        if spec:
+            start, end = spec
+
+            # Check if start position is within line bounds
+            if start >= len(line):
+                # Line is too short to contain this field
+                if not fld.get("nullable", True):
+                    logger.warning(f"Line {line_num}: Field '{fld['name']}' start position {start} exceeds line length {len(line)} (non-nullable)")
+                val = None
+            else:
+                # Clamp end to line length to prevent over-reading
+                actual_end = min(end, len(line))
+
+                # Warn if field is truncated
+                if actual_end < end:
+                    logger.debug(f"Line {line_num}: Field '{fld['name']}' truncated (expected end {end}, line length {len(line)})")
+
+                # Extract field value
+                val = line[start:actual_end].strip()
+
+                # Treat empty strings as None if field is nullable
+                if not val and fld.get("nullable", True):
+                    val = None
+
+            row[fld["name"]] = cast_value(val, fld.get("type", "string"), parser_obj.safe_mode)
+        else:
+            row[fld["name"]] = None
+
+    if record_info["rolling_context"]:
+        fill_rolling_context(record_info, row, rolling)
+    return apply_computed_fields(record, row, parser_obj)
+
+
+def fill_rolling_context(record_info: dict, row: dict, rolling: Optional[Dict[str, dict]]) -> None:
+    """Set ``from_record`` context values from the latest row of each source record."""
+    for name, source_record, source_field in record_info["rolling_context"]:
+        source_row = rolling.get(source_record) if rolling else None
+        row[name] = source_row.get(source_field) if source_row else None
+
+
+def apply_computed_fields(record: dict, row: dict, parser_obj: BaseParser) -> dict:
+    """Fill a record's computed fields from the extracted row values."""
+    for fld in record.get("fields", []):
+        if fld.get("type") == "computed" and fld.get("computed_field"):
+            comp = parser_obj.computed_fields.get(fld["computed_field"])
+            if comp:
+                formula = comp.get("formula", "")
+                row[fld["name"]] = format_formula(formula, row) if formula else None
+            else:
+                logger.warning(f"Computed field '{fld['computed_field']}' referenced but not defined in computed_fields")
+                row[fld["name"]] = None
+
+    return row
+
+
+def needs_bytes(config: dict) -> bool:
+    """Check whether any field must be decoded from raw bytes (binary type or own encoding)."""
+    return any(fld.get("type") in BINARY_TYPES or "encoding" in fld
+               for record in config["records"] for fld in record.get("fields", []))
+
+
+def get_bytes_encoding(config: dict, file_name: str) -> Optional[str]:
+    """Return the encoding to decode fields with if the bytes engine applies, else None.
+
+    ``fixed_width_engine: "bytes"`` (and ``"numpy"``) reads lines as bytes
+    and decodes only the extracted fields; binary fields (``comp3``, ``zoned``, ``binary_int``)
+    and per-field ``encoding`` overrides always use it. Positions are
+    character offsets, so this needs an encoding with one byte per
+    character, and line splitting needs an ASCII-compatible one (EBCDIC
+    files must use ``fixed_width_record_length``).
+
+    Raises:
+        ValueError: If binary fields are configured for an unsupported encoding
+    """
+    binary = needs_bytes(config)
+    engine = config.get("fixed_width_engine", "line")
+    if engine not in ("bytes", "numpy") and not binary:
+        return None
+    encoding = config.get("fixed_width_encoding", "utf-8")
+    if not is_single_byte(encoding):
+        reason = f"a single-byte encoding, not '{encoding}'"
+    elif not get_record_length(config) and not is_ascii_compatible(encoding):
+        reason = f"fixed_width_record_length for encoding '{encoding}' (no ASCII line breaks)"
+    else:
+        return encoding
+    if binary:
+        raise ValueError(f"Binary fields and field encodings need {reason}")
+    logger.warning(f"fixed_width_engine '{engine}' needs {reason}; reading {file_name} as text")
+    return None
+
+
+@lru_cache(maxsize=None)
+def _blank_bytes(encoding: str) -> bytes:
+    """Bytes that decode to whitespace (what ``str.strip`` removes) in ``encoding``."""
+    return bytes(b for b in range(256) if bytes([b]).decode(encoding, errors="ignore").isspace())
+
+
+def compile_bytes_extractors(record_specs: List[dict], encoding: str, safe_mode: bool = True) -> None:
+    """Precompile each record's field slices into one ``itemgetter`` call.
+
+    Adds ``extract`` (bytes line to tuple of field slices), ``field_encodings``
+    (text fields with their own encoding), ``bytes_layout``
+    (one ``(name, slice_index, decoder, type, nullable, static_value,
+    (start, end), is_context)`` entry per output column, in
+    :func:`build_row` order) and ``min_length`` (line length from which no
+    slice is clamped) to each spec. Text fields in the file encoding have no
+    decoder; binary fields have a decoder and no type (already typed).
+    """
+    for record_info in record_specs:
+        record = record_info["record"]
+        field_specs = record_info["field_specs"]
+        slice_index: Dict[Tuple[int, int], int] = {}
+        layout = []
+
+        def slot(spec):
+            return slice_index.setdefault(spec, len(slice_index))
+
+        for ctx in record.get("context", []):
+            path_key = ctx.get("from") or ctx.get("from_expr")
+            if ctx.get("value") is None and path_key and path_key in field_specs:
+                # Context values keep empty strings (no nullable handling)
+                spec = field_specs[path_key]
+                layout.append((ctx["name"], slot(spec), None, "string", False, None, spec, True))
+            else:
+                layout.append((ctx["name"], None, None, None, False, ctx.get("value"), None, True))
+
+        for fld in record.get("fields", []):
+            spec = field_specs.get(fld["name"])
+            field_type = fld.get("type", "string")
+            nullable = fld.get("nullable", True)
+            if field_type == "computed" or spec is None:
+                layout.append((fld["name"], None, None, None, False, None, None, False))
+            elif field_type in BINARY_TYPES:
+                decoder = make_field_decoder(fld, encoding, safe_mode)
+                layout.append((fld["name"], slot(spec), decoder, None, nullable, None, spec, False))
+            elif "encoding" in fld:
+                def decoder(raw, field_encoding=fld["encoding"]):
+                    return raw.decode(field_encoding).strip()
+                layout.append((fld["name"], slot(spec), decoder, field_type, nullable, None, spec, False))
+            else:
+                layout.append((fld["name"], slot(spec), None, field_type, nullable, None, spec, False))
+
+        slices = [slice(start, end) for start, end in slice_index]
+        if len(slices) == 1:
+            getter = itemgetter(slices[0])
+            record_info["extract"] = lambda line, getter=getter: (getter(line),)
+        elif slices:
+            record_info["extract"] = itemgetter(*slices)
+        else:
+            record_info["extract"] = lambda line: ()
+        record_info["bytes_layout"] = layout
+        record_info["field_encodings"] = {fld["name"]: fld["encoding"] for fld in record.get("fields", [])
+                                          if "encoding" in fld and fld.get("type") not in BINARY_TYPES}
+        record_info["min_length"] = max((end for _, end in slice_index), default=0)
+
+
+def build_row_bytes(record_info: dict, line: bytes, line_num: int, parser_obj: BaseParser,
+                    encoding: str, rolling: Optional[Dict[str, dict]] = None) -> dict:
+    """Build an output row from a bytes line, decoding only the extracted fields.
+
+    Short lines are clamped like :func:`build_row`; a truncated binary
+    field cannot be decoded, so it is an error in strict cast mode and
+    None in safe mode.
+    """
+    values = record_info["extract"](line)
+    line_len = len(line)
+    short = line_len < record_info["min_length"]
+    safe_mode = parser_obj.safe_mode
+    row = {}
+    for name, index, decoder, field_type, nullable, static_value, spec, is_context in record_info["bytes_layout"]:
+        if index is None:
+            row[name] = static_value
+            continue
+
+        if short and spec[1] > line_len:
+            start, end = spec
+            if start >= line_len:
+                if not nullable and not is_context:
+                    logger.warning(f"Line {line_num}: Field '{name}' start position {start} exceeds line length {line_len} (non-nullable)")
+                row[name] = None
+                continue
+            if not is_context:
+                logger.debug(f"Line {line_num}: Field '{name}' truncated (expected end {end}, line length {line_len})")
+            if field_type is None:
+                if not safe_mode:
+                    raise ValueError(f"Line {line_num}: binary field '{name}' truncated "
+                                     f"({line_len - start} of {end - start} bytes)")
+                row[name] = None
+                continue
+
+        if decoder is None:
+            val = values[index].decode(encoding).strip()
+        else:
+            val = decoder(values[index])
+            if field_type is None:
+                row[name] = val
+                continue
+        if not val and nullable:
+            val = None
+        row[name] = cast_value(val, field_type, safe_mode)
+
+    if record_info["rolling_context"]:
+        fill_rolling_context(record_info, row, rolling)
+    if parser_obj.computed_fields:
+        apply_computed_fields(record_info["record"], row, parser_obj)
+    return row
+
+
+def iter_line_results(lines: Iterable[Union[str, bytes]], index: dict, parser_obj: BaseParser,
+                      progress: bool = True, encoding: Optional[str] = None,
+                      terminated: bool = True, rolling: Optional[Dict[str, dict]] = None) -> Iterator[RowResult]:
+    """Match, extract and validate fixed-width lines.
+
+    Rows of records referenced by ``from_record`` context are kept in
+    ``rolling`` as the latest of their type, so e.g. detail lines carry
+    the values of the header line before them.
+
+    Args:
+        lines: Raw lines (after any skipped rows)
+        index: Record index from :func:`build_record_index`
+        parser_obj: Base parser (cast mode and validation)
+        progress: Log progress every ``progress_interval`` lines
+        encoding: Set when ``lines`` are bytes (see :func:`compile_bytes_extractors`)
+        terminated: Strip line terminators (False for fixed-length records, whose
+            binary fields may end in newline bytes)
+        rolling: Latest row per source record; pass the same dict to carry it
+            across calls (e.g. streaming batches)
+
+    Yields:
+        Row results numbered by line, from 1 within ``lines``
+    """
+    if rolling is None:
+        rolling = {}
+
+    if encoding is None:
+        line_ends, blank = '\n\r', None
+        match = match_record_specs
+
+        def extract(record_info, line, line_num):
+            return build_row(record_info, line, line_num, parser_obj, rolling)
+    else:
+        line_ends, blank = b'\n\r', _blank_bytes(encoding)
+
+        def match(index, line):
+            return match_record_bytes(index, line, encoding)
+
+        def extract(record_info, line, line_num):
+            return build_row_bytes(record_info, line, line_num, parser_obj, encoding, rolling)
+
+    for line_num, line in enumerate(lines, start=1):
+        # Log progress periodically
+        if progress:
+            parser_obj.log_progress("Fixed-Width", line_num, line_num)
+
+        if terminated:
+            line = line.rstrip(line_ends)
+        if not line.strip(blank):
+            continue
+
+        matched_records = match(index, line)
+        if not matched_records and index["typed"]:
+            yield (line_num, None, None, None, None)
+            continue
+
+        for record_info in matched_records:
+            record_name = record_info["record"]["name"]
+            row = None
+            try:
+                row = extract(record_info, line, line_num)
+                if record_info["keeps_state"]:
+                    rolling[record_name] = row
+                validation_errors = parser_obj.validate_row(row, record_info["field_defs"])
+            except Exception as row_error:
+                yield (line_num, record_name, row, None, row_error)
+                break  # Skip to next line
+            yield (line_num, record_name, row, validation_errors, None)
+
+
+def get_record_length(config: dict) -> Optional[int]:
+    """Return ``fixed_width_record_length`` (bytes per record without line terminators), or None.
+
+    Records are cut by bytes and fields by characters, so this needs an
+    encoding with one byte per character (a multibyte character could
+    also straddle two records).
+
+    Raises:
+        ValueError: If the length is not a positive integer or the encoding is multibyte
+    """
+    record_length = config.get("fixed_width_record_length")
+    if record_length is None:
+        return None
+    if not isinstance(record_length, int) or isinstance(record_length, bool) or record_length <= 0:
+        raise ValueError(f"fixed_width_record_length must be a positive integer, got {record_length!r}")
+    encoding = config.get("fixed_width_encoding", "utf-8")
+    if not is_single_byte(encoding):
+        raise ValueError(f"fixed_width_record_length needs a single-byte encoding, not '{encoding}'")
+    return record_length
+
+
+def iter_records(buffer, record_length: int, start: int = 0) -> Iterator[bytes]:
+    """Step through fixed-length records in ``buffer`` (bytes or mmap) by stride.
+
+    A shorter trailing record (e.g. a final newline) is yielded as is and
+    goes through the usual blank and short-line handling.
+    """
+    for pos in range(start, len(buffer), record_length):
+        yield buffer[pos:pos + record_length]
+
+
+def iter_input_lines(file_path: Path, config: dict, bytes_encoding: Optional[str]) -> Iterator[Union[str, bytes]]:
+    """Yield the lines (or fixed-length records) of a file after the skipped rows.
+
+    Lines are bytes when ``bytes_encoding`` is set, else decoded text.
+    """
+    encoding = config.get("fixed_width_encoding", "utf-8")
+    skip_rows = config.get("fixed_width_skip_rows", 0)
+    record_length = get_record_length(config)
+
+    if record_length:
+        if file_path.stat().st_size == 0:
+            return
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            records = iter_records(mm, record_length, skip_rows * record_length)
+            if bytes_encoding:
+                yield from records
+            else:
+                yield from (record.decode(encoding) for record in records)
+        return
+
+    with (open(file_path, "rb") if bytes_encoding else open(file_path, encoding=encoding)) as f:
+        for _ in range(skip_rows):
+            next(f, None)
+        yield from f
+
+
+def _fixed_width_worker_setup(config: dict, bytes_encoding: Optional[str]) -> dict:
+    """Prepare record specs and the type index once per worker process."""
+    parser_obj = BaseParser(Path(), config, None, {}, {})
+    record_specs = build_record_specs(config, parser_obj)
+    if bytes_encoding:
+        compile_bytes_extractors(record_specs, bytes_encoding, parser_obj.safe_mode)
+    return {
+        "parser": parser_obj,
+        "index": build_record_index(record_specs),
+        "encoding": config.get("fixed_width_encoding", "utf-8"),
+        "bytes_encoding": bytes_encoding,
+        "record_length": get_record_length(config),
+    }
+
+
+def _parse_fixed_width_range(file_path: Path, start: int, end: int) -> Tuple[int, List[RowResult]]:
+    """Parse one byte range in a worker; returns (lines read, row results)."""
+    state = worker_state()
+    data = read_byte_range(file_path, start, end)
+    if state["record_length"]:
+        lines = iter_records(data, state["record_length"])
+        if not state["bytes_encoding"]:
+            lines = (record.decode(state["encoding"]) for record in lines)
+    elif state["bytes_encoding"]:
+        lines = io.BytesIO(data)
+    else:
+        # Universal newlines, as when the whole file is opened in text mode
+        lines = io.StringIO(data.decode(state["encoding"]), newline=None)
+
+    lines_read = 0
+
+    def counted_lines():
+        nonlocal lines_read
+        for line in lines:
+            lines_read += 1
+            yield line
+
+    results = []
+    for line_num, record_name, row, validation_errors, error in iter_line_results(
+            counted_lines(), state["index"], state["parser"], progress=False,
+            encoding=state["bytes_encoding"], terminated=not state["record_length"]):
+        if error is not None:
+            error = portable_error(error)
+        results.append((line_num, record_name, row, validation_errors, error))
+    return lines_read, results
+
+
+def _parallel_fixed_width_unsupported(config: dict, encoding: str) -> Optional[str]:
+    """Return why a file cannot be split into byte ranges (None if it can)."""
+    if not get_record_length(config) and not is_ascii_compatible(encoding):
+        return f"encoding '{encoding}' is not ASCII-compatible"
+    if has_rolling_context(config):
+        return "from_record context carries state from line to line"
+    return None
+
+
+def _parse_fixed_width_parallel(file_path: Path, config: dict, parser_obj: BaseParser, workers: int,
+                                columns_by_record: Dict[str, List[str]], bytes_encoding: Optional[str]) -> bool:
+    """Parse a fixed-width file over newline- or record-aligned byte ranges in a process pool.
+
+    Returns:
+        False if the file is too small to split (caller parses it in-process)
+    """
+    skip_rows = config.get("fixed_width_skip_rows", 0)
+    record_length = get_record_length(config)
+    if record_length:
+        # Ranges are whole multiples of the record length
+        stride = max(1, get_chunk_bytes(config) // record_length) * record_length
+        size = file_path.stat().st_size
+        ranges = [(pos, min(pos + stride, size)) for pos in range(skip_rows * record_length, size, stride)]
+    else:
+        with open(file_path, "rb") as f:
+            for _ in range(skip_rows):
+                f.readline()
+            data_start = f.tell()
+        ranges = split_byte_ranges(file_path, data_start, get_chunk_bytes(config))
+    if len(ranges) < 2:
+        return False
+
+    logger.info(f"Parsing {file_path.name} in {len(ranges)} ranges with {workers} workers")
+
+    line_offset = 0
+    tasks = ((file_path, start, end) for start, end in ranges)
+    chunk_results = imap_ordered(_parse_fixed_width_range, tasks, workers,
+                                 _fixed_width_worker_setup, (config, bytes_encoding))
+    try:
+        for lines_read, results in chunk_results:
+            parser_obj.apply_row_results(results, columns_by_record, line_offset)
+            line_offset += lines_read
+            if parser_obj.progress_interval > 0:
+                logger.info(f"[Fixed-Width] Processed {line_offset:,} lines")
+    finally:
+        chunk_results.close()
+    return True
+
+
+def _numpy_unsupported(config: dict, record_specs: List[dict], bytes_encoding: Optional[str]) -> Optional[str]:
+    """Return why the NumPy engine cannot read a file (None if it can)."""
+    if not HAS_NUMPY:
+        return "numpy is not installed (pip install numpy)"
+    if not bytes_encoding:
+        return "it needs a single-byte encoding"
+    if len(record_specs) != 1:
+        return "it reads files with a single record layout"
+    if has_rolling_context(config):
+        return "from_record context carries state from line to line"
+    return None
+
+
+@lru_cache(maxsize=None)
+def _code_points(encoding: str):
+    """Map each byte to the code point it decodes to in ``encoding`` (-1 if undecodable)."""
+    points = []
+    for b in range(256):
+        try:
+            points.append(ord(bytes([b]).decode(encoding)))
+        except UnicodeDecodeError:
+            points.append(-1)
+    return np.array(points, np.int32)
+
+
+def _numpy_uniform(rows, term: bytes, text_slices: List[Tuple[int, int, str]]) -> bool:
+    """Check a block of equal-stride rows holds whole lines of equal length.
+
+    Every row must end with the line terminator and contain no other line
+    break or trailing carriage return (which the line engines would strip).
+    Text slices must not contain NUL bytes, which ``U`` arrays drop, or
+    bytes their encoding cannot decode.
+    """
+    width = rows.shape[1] - len(term)
+    content = rows[:, :width]
+    if term:
+        if not (rows[:, width:] == np.frombuffer(term, np.uint8)).all():
+            return False
+        if (content == 10).any() or (width and (content[:, -1] == 13).any()):
+            return False
+    return all((_code_points(encoding)[content[:, start:end]] > 0).all() for start, end, encoding in text_slices)
+
+
+def _numpy_text_column(rows, start: int, end: int, encoding: str):
+    """Slice, decode and strip (as ``str.strip``) one text column.
+
+    Bytes are decoded through a code point table, which only works for
+    single-byte encodings and rows checked by :func:`_numpy_uniform`.
+    """
+    codes = _code_points(encoding)[rows[:, start:end]].astype(np.uint32)
+    return np.char.strip(codes.view(f"U{end - start}").ravel())
+
+
+def _numpy_cast_column(texts, field_type: str, safe_mode: bool,
+                       errors: Dict[int, Exception]) -> Tuple[list, Optional[Any]]:
+    """Cast a decoded text column; returns (values, float array for range checks or None).
+
+    Int and float columns are parsed in one NumPy call; other types, and
+    columns NumPy cannot parse, go through ``cast_value`` per value.
+    Strict-mode cast failures are recorded per row in ``errors``.
+    """
+    t = (field_type or "string").lower()
+    empty = texts == ""
+    if t == "string":
+        values = texts.tolist()
+        for i in np.flatnonzero(empty).tolist():
+            values[i] = None
+        return values, None
+
+    if t in ("int", "float"):
+        try:
+            parsed = np.where(empty, "0", texts).astype(np.int64 if t == "int" else np.float64)
+        except (ValueError, OverflowError):
+            pass
+        else:
+            values = parsed.tolist()
+            for i in np.flatnonzero(empty).tolist():
+                values[i] = None
+            return values, parsed.astype(np.float64)
+
+    values = []
+    for i, text in enumerate(texts.tolist()):
+        try:
+            values.append(cast_value(text or None, t, safe_mode))
+        except Exception as cast_error:
+            errors.setdefault(i, cast_error)
+            values.append(None)
+    return values, None
+
+
+def _numpy_validate(columns: Dict[str, list], numeric: Dict[str, Any], field_defs: List[FieldDef],
+                    count: int) -> Dict[int, List[str]]:
+    """Validate whole columns; returns error messages by row (rows without errors omitted).
+
+    Messages and their order match :meth:`BaseParser.validate_row`.
+    """
+    errors: Dict[int, List[str]] = {}
+    for field_def in field_defs:
+        values = columns.get(field_def.name, [None] * count)
+        has_range = field_def.min_value is not None or field_def.max_value is not None
+        if field_def.nullable and not field_def.regex and not has_range:
+            continue
+
+        if field_def.regex or field_def.name not in numeric:
+            candidates = range(count)
+        else:
+            # Numeric column: only null and out-of-range rows can fail
+            failed = np.zeros(count, bool)
+            if not field_def.nullable:
+                failed |= np.fromiter((value is None for value in values), bool, count)
+            if field_def.min_value is not None:
+                failed |= numeric[field_def.name] < field_def.min_value
+            if field_def.max_value is not None:
+                failed |= numeric[field_def.name] > field_def.max_value
+            candidates = np.flatnonzero(failed).tolist()
+
+        for i in candidates:
+            is_valid, error_msg = validate_field_value(values[i], field_def)
+            if not is_valid:
+                errors.setdefault(i, []).append(error_msg)
+    return errors
+
+
+def _numpy_block_results(content, record_info: dict, parser_obj: BaseParser, encoding: str,
+                         first_line: int, column_decoders: Dict[str, Callable]) -> List[RowResult]:
+    """Extract, cast and validate a block of equal-length lines column by column.
+
+    Binary fields are decoded by ``column_decoders`` (see
+    :func:`~multi_format_parser.binary_fields.make_column_decoder`). Rows
+    are only built as dicts at the end, for the writer.
+    """
+    record_name = record_info["record"]["name"]
+
+    keep = ~np.isin(content, np.frombuffer(_blank_bytes(encoding), np.uint8)).all(axis=1)
+    matched = keep
+    type_field = record_info["record_type_field"]
+    if type_field is not None and record_info["record_type_value"] is not None:
+        type_spec = record_info["field_specs"].get(type_field)
+        if type_spec is None:
+            matched = np.zeros_like(keep)
+        else:
+            type_column = _numpy_text_column(content, type_spec[0], type_spec[1], encoding)
+            matched = keep & (type_column == str(record_info["record_type_value"]))
+
+    selected = np.flatnonzero(matched)
+    rows = content[selected]
+    count = len(selected)
+    field_encodings = record_info["field_encodings"]
+
+    names = []
+    columns: Dict[str, list] = {}
+    numeric: Dict[str, Any] = {}
+    row_errors: Dict[int, Exception] = {}
+    for name, index, decoder, field_type, nullable, static_value, spec, is_context in record_info["bytes_layout"]:
+        names.append(name)
+        numeric.pop(name, None)
+        if index is None:
+            columns[name] = [static_value] * count
+        elif field_type is None:
+            # Binary field: decode the column of raw slices
+            columns[name] = column_decoders[name](rows[:, spec[0]:spec[1]], row_errors)
+        else:
+            slot_encoding = encoding if is_context else field_encodings.get(name, encoding)
+            texts = _numpy_text_column(rows, spec[0], spec[1], slot_encoding)
+            columns[name], numbers = _numpy_cast_column(texts, field_type, parser_obj.safe_mode, row_errors)
+            if numbers is not None:
+                numeric[name] = numbers
+
+    validation_errors = _numpy_validate(columns, numeric, record_info["field_defs"], count)
+    computed = parser_obj.computed_fields
+    record = record_info["record"]
+
+    results = []
+    selected_pos = 0
+    row_values = zip(*(columns[name] for name in names))
+    for i in np.flatnonzero(keep).tolist():
+        line_num = first_line + i + 1
+        if not matched[i]:
+            results.append((line_num, None, None, None, None))
+            continue
+        row = dict(zip(names, next(row_values, ())))
+        if selected_pos in row_errors:
+            results.append((line_num, record_name, None, None, row_errors[selected_pos]))
+        else:
+            if computed:
+                apply_computed_fields(record, row, parser_obj)
+            results.append((line_num, record_name, row, validation_errors.get(selected_pos, []), None))
+        selected_pos += 1
+    return results
+
+
+def _parse_fixed_width_numpy(file_path: Path, config: dict, parser_obj: BaseParser, record_info: dict,
+                             index: dict, columns_by_record: Dict[str, List[str]], encoding: str) -> bool:
+    """Parse blocks of equal-length lines as NumPy arrays, one column per field.
+
+    The line length is taken from the first line. From the first block
+    that does not hold equal-length lines (and for a short final line)
+    the rest of the file goes through the bytes engine, so output always
+    matches the line engines.
+
+    Returns:
+        False if the first line does not fit the record layout (caller uses the bytes engine)
+    """
+    record_length = get_record_length(config)
+    skip_rows = config.get("fixed_width_skip_rows", 0)
+    field_encodings = record_info["field_encodings"]
+    text_slices = [(*spec, encoding if is_context else field_encodings.get(name, encoding))
+                   for name, slot_index, _, field_type, _, _, spec, is_context in record_info["bytes_layout"]
+                   if slot_index is not None and field_type is not None]
+    type_spec = record_info["field_specs"].get(record_info["record_type_field"])
+    if type_spec is not None:
+        text_slices.append((type_spec[0], type_spec[1], encoding))
+    fields = {fld["name"]: fld for fld in record_info["record"].get("fields", [])}
+    column_decoders = {name: make_column_decoder(fields[name], encoding, decoder)
+                       for name, slot_index, decoder, field_type, *_ in record_info["bytes_layout"]
+                       if slot_index is not None and field_type is None}
+
+    with open(file_path, "rb") as f:
+        if record_length:
+            f.seek(skip_rows * record_length)
+            stride, term = record_length, b""
+        else:
+            for _ in range(skip_rows):
+                f.readline()
+            data_start = f.tell()
+            first = f.readline()
+            f.seek(data_start)
+            term = b"\r\n" if first.endswith(b"\r\n") else b"\n"
+            stride = len(first)
+            if not first.endswith(b"\n"):
+                logger.info(f"fixed_width_engine 'numpy': {file_path.name} has no complete line; using the bytes engine")
+                return False
+        if stride - len(term) < record_info["min_length"]:
+            logger.info(f"fixed_width_engine 'numpy': lines in {file_path.name} are shorter than the record "
+                        f"layout; using the bytes engine")
+            return False
+
+        lines_done = 0
+        while True:
+            block_start = f.tell()
+            block = f.read(stride * NUMPY_BLOCK_ROWS)
+            count = len(block) // stride
+            rows = np.frombuffer(block, np.uint8, count * stride).reshape(count, stride) if count else None
+            if not count or not _numpy_uniform(rows, term, text_slices):
+                if len(block) >= stride:
+                    logger.info(f"fixed_width_engine 'numpy': {file_path.name} has lines of different lengths "
+                                f"after line {lines_done:,}; using the bytes engine from there")
+                f.seek(block_start)
+                lines = iter(lambda: f.read(record_length), b"") if record_length else f
+                parser_obj.apply_row_results(iter_line_results(lines, index, parser_obj, progress=False,
+                                                               encoding=encoding, terminated=not record_length),
+                                             columns_by_record, lines_done)
+                return True
+
+            content = rows[:, :stride - len(term)]
+            parser_obj.apply_row_results(_numpy_block_results(content, record_info, parser_obj, encoding,
+                                                              lines_done, column_decoders), columns_by_record)
+            lines_done += count
+            f.seek(block_start + count * stride)
+            if parser_obj.progress_interval > 0:
+                logger.info(f"[Fixed-Width] Processed {lines_done:,} lines")
+
+
+def parse_fixed_width(file_path: Path, config: dict, writer: Optional[CSVWriter], stats: dict, record_stats: Dict[str, ParsingStats],
+                      run_stats: Optional[dict] = None) -> Tuple[bool, Optional[str]]:
     """Parse fixed-width file.
     
     Returns:
         Tuple[bool, Optional[str]]: (success, error_message)
     """
-    parser_obj = BaseParser(file_path, config, writer, stats, record_stats)
+    parser_obj = BaseParser(file_path, config, writer, stats, record_stats, run_stats)
 
     try:
         encoding = config.get("fixed_width_encoding", "utf-8")
-        skip_rows = config.get("fixed_width_skip_rows", 0)
-
-        record_specs = []
-        for record in config["records"]:
-            # Build record type identifier if present
-            record_type_field = record.get("record_type_field")
-            record_type_value = record.get("record_type_value")
-
-            field_specs = {}
-            for fld in record.get("fields", []):
-                if fld.get("type") == "computed":
-                    continue
-                start = fld.get("start")
-                end = fld.get("end")
-                width = fld.get("width")
-
-                if start is None:
-                    logger.warning(f"Field '{fld['name']}' in record '{record['name']}' has no start position defined")
-                    continue
-
-                # Calculate end from width if not explicitly provided
-                if end is None and width is not None:
-                    end = start + width
-
-                # Validation: end must be set and greater than start
-                if end is None:
-                    logger.warning(f"Field '{fld['name']}' in record '{record['name']}' has no end or width defined")
-                    continue
-
-                if end <= start:
-                    logger.warning(f"Field '{fld['name']}' in record '{record['name']}' has end ({end}) <= start ({start})")
-                    continue
-
-                field_specs[fld["name"]] = (start, end)
-
-            columns = parser_obj.get_columns(record)
-            field_defs = parser_obj.build_field_defs(record)
-
-            record_specs.append({
-                "record": record,
-                "field_specs": field_specs,
-                "columns": columns,
-                "field_defs": field_defs,
-                "record_type_field": record_type_field,
-                "record_type_value": record_type_value
-            })
-
-        with open(file_path, encoding=encoding) as f:
-            for _ in range(skip_rows):
-                next(f, None)
-
-            for line_num, line in enumerate(f, start=1):
-                # Log progress periodically
-                parser_obj.log_progress("Fixed-Width", line_num, line_num)
-
-                line = line.rstrip('\n\r')
-                if not line.strip():
-                    continue
-
-                # Process line - check which record type(s) match
-                matched_records = []
-                for record_info in record_specs:
-                    record = record_info["record"]
-                    record_type_field = record_info.get("record_type_field")
-                    record_type_value = record_info.get("record_type_value")
-
-                    # If record type identification is configured, check if line matches
-                    if record_type_field is not None and record_type_value is not None:
-                        type_spec = record_info["field_specs"].get(record_type_field)
-                        if type_spec:
-                            start, end = type_spec
-                            # Validate line is long enough for record type field
-                            if start >= len(line):
-                                logger.debug(f"Line {line_num}: Too short ({len(line)} chars) for record type field at position {start}")
-                                continue  # Line too short for this record type
-
-                            # Extract record type value with safe boundary
-                            actual_end = min(end, len(line))
-                            actual_value = line[start:actual_end].strip()
-
-                            # Check if record type matches
-                            if actual_value != str(record_type_value):
-                                continue  # Skip this record type
-                        else:
-                            logger.warning(f"Record type field '{record_type_field}' not found in field specs for record '{record['name']}'")
-                            continue
-
-                    matched_records.append(record_info)
-
-                # If no record type identification is configured, process all records (backward compatibility)
-                if not matched_records:
-                    if any(r.get("record_type_field") is not None for r in record_specs):
-                        # Record type identification is configured but no match found
-                        logger.debug(f"Line {line_num}: No matching record type found")
-                        continue
-                    else:
-                        # No record type identification configured - use all records
-                        matched_records = record_specs
-
-                for record_info in matched_records:
-                    record = record_info["record"]
-                    field_specs = record_info["field_specs"]
-                    columns = record_info["columns"]
-                    field_defs = record_info["field_defs"]
-
-                    # Wrap row processing in try-except if continueOnError is enabled
-                    try:
-                        row = {}
-
-                        # Extract context
-                        for ctx in record.get("context", []):
-                            if ctx.get("value") is not None:
-                                row[ctx["name"]] = ctx["value"]
-                            elif ctx.get("from") or ctx.get("from_expr"):
-                                # Context extraction from fixed-width positions
-                                # Use field_specs to find the position for the context field
-                                path_key = ctx.get("from") or ctx.get("from_expr")
-                                spec = field_specs.get(path_key)
-                                if spec:
-                                    start, end = spec
-                                    if start < len(line):
-                                        actual_end = min(end, len(line))
-                                        val = line[start:actual_end].strip()
-                                        row[ctx["name"]] = cast_value(val, "string", parser_obj.safe_mode)
-                                    else:
-                                        row[ctx["name"]] = None
-                                else:
-                                    row[ctx["name"]] = None
-                            else:
-                                row[ctx["name"]] = None
-
-                        # Extract fields
-                        for fld in record.get("fields", []):
-                            if fld.get("type") == "computed":
-                                row[fld["name"]] = None
-                                continue
-
-                            spec = field_specs.get(fld["name"])
-                            if spec:
-                                start, end = spec
-
-                                # Check if start position is within line bounds
-                                if start >= len(line):
-                                    # Line is too short to contain this field
-                                    if not fld.get("nullable", True):
-                                        logger.warning(f"Line {line_num}: Field '{fld['name']}' start position {start} exceeds line length {len(line)} (non-nullable)")
-                                    val = None
-                                else:
-                                    # Clamp end to line length to prevent over-reading
-                                    actual_end = min(end, len(line))
-
-                                    # Warn if field is truncated
-                                    if actual_end < end:
-                                        logger.debug(f"Line {line_num}: Field '{fld['name']}' truncated (expected end {end}, line length {len(line)})")
-
-                                    # Extract field value
-                                    val = line[start:actual_end].strip()
-
-                                    # Treat empty strings as None if field is nullable
-                                    if not val and fld.get("nullable", True):
-                                        val = None
-
-                                row[fld["name"]] = cast_value(val, fld.get("type", "string"), parser_obj.safe_mode)
-                            else:
-                                row[fld["name"]] = None
-
-                        for fld in record.get("fields", []):
-                            if fld.get("type") == "computed" and fld.get("computed_field"):
-                                comp = parser_obj.computed_fields.get(fld["computed_field"])
-                                if comp:
-                                    formula = comp.get("formula", "")
-                                    row[fld["name"]] = format_formula(formula, row) if formula else None
-                                else:
-                                    logger.warning(f"Computed field '{fld['computed_field']}' referenced but not defined in computed_fields")
-                                    row[fld["name"]] = None
-
-                        record_name = record["name"]
-                        record_stats[record_name].total_rows += 1
-                        parser_obj.validate_and_write_row(record_name, row, columns, field_defs, line_num)
-
-                    except Exception as row_error:
-                        parser_obj.handle_row_error(record["name"], row_error, line_num)
-                        break  # Skip to next line
+
+        record_specs = build_record_specs(config, parser_obj)
+        index = build_record_index(record_specs)
+        columns_by_record = {info["record"]["name"]: info["columns"] for info in record_specs}
+
+        bytes_encoding = get_bytes_encoding(config, file_path.name)
+
+        if config.get("fixed_width_engine", "line") == "numpy":
+            reason = _numpy_unsupported(config, record_specs, bytes_encoding)
+            if reason:
+                logger.warning(f"fixed_width_engine 'numpy' not used for {file_path.name}: {reason}")
+            else:
+                compile_bytes_extractors(record_specs, bytes_encoding, parser_obj.safe_mode)
+                if _parse_fixed_width_numpy(file_path, config, parser_obj, record_specs[0], index,
+                                            columns_by_record, bytes_encoding):
+                    parser_obj.finalize_stats()
+                    return (True, None)
+
+        workers = get_parallel_workers(config)
+        if workers > 1:
+            reason = _parallel_fixed_width_unsupported(config, encoding)
+            if reason:
+                logger.warning(f"Parallel parsing disabled for {file_path.name}: {reason}")
+            elif _parse_fixed_width_parallel(file_path, config, parser_obj, workers,
+                                             columns_by_record, bytes_encoding):
+                parser_obj.finalize_stats()
+                return (True, None)
+
+        if bytes_encoding:
+            compile_bytes_extractors(record_specs, bytes_encoding, parser_obj.safe_mode)
+
+        lines = iter_input_lines(file_path, config, bytes_encoding)
+        parser_obj.apply_row_results(iter_line_results(lines, index, parser_obj, encoding=bytes_encoding,
+                                                       terminated=not get_record_length(config)),
+                                     columns_by_record)
+
         parser_obj.finalize_stats()
         return (True, None)
 
@@ -2,22 +2,50 @@
 JSON parser module.
 """
 
+import io
+import itertools
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from multi_format_parser.casting import cast_value
 from multi_format_parser.csv_writer import CSVWriter
 from multi_format_parser.formula_utils import format_formula
-from multi_format_parser.json_utils import extract_json_path, select_json_records
+from multi_format_parser.json_utils import (
+    RAW_MINIFIED,
+    RAW_TEXT,
+    WALKED,
+    RawJson,
+    compile_decode_plan,
+    compile_json_path,
+    compile_path_tree,
+    expand_json_wildcards,
+    run_json_path,
+    run_path_tree,
+    scan_json_records,
+    select_json_records,
+    selector_keys,
+    split_wildcard_selector,
+)
 from multi_format_parser.models import ParsingStats
-from multi_format_parser.parsers.base_parser import BaseParser
+from multi_format_parser.parallel import (
+    get_chunk_bytes,
+    get_parallel_workers,
+    imap_ordered,
+    is_ascii_compatible,
+    portable_error,
+    read_byte_range,
+    split_byte_ranges,
+    worker_state,
+)
+from multi_format_parser.parsers.base_parser import BaseParser, RowResult
 
 # Optional JSON Schema validation support
 try:
     import jsonschema
-    from jsonschema import Draft7Validator, ValidationError
+    from jsonschema import Draft7Validator
     HAS_JSONSCHEMA = True
 except ImportError:
     HAS_JSONSCHEMA = False
@@ -25,12 +53,53 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def get_schema_validator(schema: dict) -> "Draft7Validator":
+    """Return a checked validator for ``schema``, compiled once per distinct schema and cached across files.
+
+    Raises:
+        ImportError: If jsonschema library is not installed
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    if not HAS_JSONSCHEMA:
+        raise ImportError(
+            "jsonschema library is required for JSON schema validation. "
+            "Install with: pip install jsonschema"
+        )
+    return _compile_schema_validator(json.dumps(schema, sort_keys=True))
+
+
+@lru_cache(maxsize=32)
+def _compile_schema_validator(schema_text: str) -> "Draft7Validator":
+    """Compile a validator for a schema serialized by :func:`get_schema_validator`."""
+    schema = json.loads(schema_text)
+    Draft7Validator.check_schema(schema)
+    # Use Draft7Validator for better error messages
+    return Draft7Validator(schema)
+
+
+def schema_error_summary(validator: "Draft7Validator", data: Any) -> Optional[str]:
+    """Summarize the first five schema errors of ``data`` (None if valid); the rest are only counted."""
+    errors = validator.iter_errors(data)
+    error_messages = []
+    for error in itertools.islice(errors, 5):
+        path = ".".join(str(p) for p in error.path) if error.path else "root"
+        error_messages.append(f"{path}: {error.message}")
+    if not error_messages:
+        return None
+
+    error_summary = "; ".join(error_messages)
+    more = sum(1 for _ in errors)
+    if more:
+        error_summary += f" (and {more} more errors)"
+    return error_summary
+
+
 def validate_json_schema(data: dict, schema: dict) -> Tuple[bool, Optional[str]]:
     """Validate JSON data against a JSON Schema.
     
     Args:
         data: JSON data to validate
-        schema: JSON Schema definition
+        schema: JSON Schema definition (compiled once, see :func:`get_schema_validator`)
         
     Returns:
         Tuple of (is_valid, error_message)
@@ -38,28 +107,9 @@ def validate_json_schema(data: dict, schema: dict) -> Tuple[bool, Optional[str]]
     Raises:
         ImportError: If jsonschema library is not installed
     """
-    if not HAS_JSONSCHEMA:
-        raise ImportError(
-            "jsonschema library is required for JSON schema validation. "
-            "Install with: pip install jsonschema"
-        )
-
     try:
-        # Use Draft7Validator for better error messages
-        validator = Draft7Validator(schema)
-        errors = list(validator.iter_errors(data))
-
-        if errors:
-            # Format validation errors
-            error_messages = []
-            for error in errors[:5]:  # Limit to first 5 errors
-                path = ".".join(str(p) for p in error.path) if error.path else "root"
-                error_messages.append(f"{path}: {error.message}")
-
-            error_summary = "; ".join(error_messages)
-            if len(errors) > 5:
-                error_summary += f" (and {len(errors) - 5} more errors)"
-
+        error_summary = schema_error_summary(get_schema_validator(schema), data)
+        if error_summary:
             return False, error_summary
 
         return True, None
@@ -70,11 +120,632 @@ def validate_json_schema(data: dict, schema: dict) -> Tuple[bool, Optional[str]]
         return False, f"Unexpected validation error: {str(e)}"
 
 
+def json_schema_mode(config: dict) -> str:
+    """Return ``json_schema_mode``: "document" (validate the whole document first) or "element"."""
+    return config.get("json_schema_mode", "document")
+
+
+def load_element_validator(config: dict, json_path: Path) -> Optional["Draft7Validator"]:
+    """Return the validator for selected elements in ``json_schema_mode`` "element" (else None)."""
+    if json_schema_mode(config) != "element":
+        return None
+    json_schema = load_json_schema(config, json_path)
+    return get_schema_validator(json_schema) if json_schema else None
+
 
-def parse_json(json_path: Path, config: dict, writer: Optional[CSVWriter], stats: dict, record_stats: Dict[str, ParsingStats]) -> Tuple[bool, Optional[str]]:
+def compile_json_record(record: dict) -> dict:
+    """Compile a record's context and field paths once for :func:`build_json_row`.
+
+    Returns a plan with one ``(name, source, steps, type, path)`` slot per
+    context/field column, where ``source`` is ``"value"`` (``steps`` holds
+    the static value), ``"root"`` (``$``-rooted; None steps select the
+    root itself), ``"parent"`` (``steps`` is ``(levels up, steps)``),
+    ``"key"`` (a single object key) or ``"record"``, plus the computed fields.
+    """
+    slots = []
+    # A bare "parent." prefix only refers to the parent element under a wildcard or filter selector
+    wildcard = split_wildcard_selector(record.get("select", ""))[1] is not None
+
+    for ctx in record.get("context", []):
+        expr_raw = ctx.get("from") or ctx.get("from_expr")
+        if ctx.get("value") is not None:
+            slots.append((ctx["name"], "value", ctx["value"], None, None))
+        elif expr_raw:
+            slots.append((ctx["name"], *_compile_source(expr_raw, wildcard), "string", expr_raw))
+        else:
+            slots.append((ctx["name"], "value", None, None, None))
+
+    computed = []
+    for fld in record.get("fields", []):
+        if fld.get("type") == "computed":
+            slots.append((fld["name"], "value", None, None, None))
+            if fld.get("computed_field"):
+                computed.append((fld["name"], fld["computed_field"]))
+        elif not fld.get("path"):
+            logger.debug(f"Field '{fld['name']}' in record '{record['name']}' has no path configured")
+            slots.append((fld["name"], "value", None, None, None))
+        else:
+            field_type = fld.get("type", "string").lower()
+            slots.append((fld["name"], *_compile_source(fld["path"], wildcard), field_type, fld["path"]))
+
+    required = {fld["name"] for fld in record.get("fields", []) if not fld.get("nullable", True)}
+    return {"name": record["name"], "slots": slots, "computed": computed, "required": required}
+
+
+def parent_path_levels(path: str, wildcard: bool = True) -> Optional[Tuple[int, str]]:
+    """Parse a parent reference: ``"$parent.id"`` is ``(1, "id")``, ``"$parent.parent.id"`` ``(2, "id")``.
+
+    Without ``$`` the ``parent.`` prefix only counts under a wildcard
+    selector (elsewhere it is an ordinary key). Returns None for other paths.
+    """
+    if path == "$parent" or path.startswith("$parent."):
+        rest = path[len("$parent."):]
+    elif wildcard and path.startswith("parent."):
+        rest = path[len("parent."):]
+    else:
+        return None
+    levels = 1
+    while rest == "parent" or rest.startswith("parent."):
+        levels += 1
+        rest = rest[len("parent."):]
+    return levels, rest
+
+
+def _compile_source(path: str, wildcard: bool = False) -> Tuple[str, Any]:
+    """Split a context/field path into its source and compiled steps (see :func:`compile_json_record`)."""
+    parent = parent_path_levels(path, wildcard)
+    if parent is not None:
+        levels, rest = parent
+        return "parent", (levels, compile_json_path(rest) if rest else None)
+    if path.startswith("$"):
+        # Root-relative path
+        clean_path = path[1:].lstrip('.')  # Remove $ and leading dot
+        return "root", compile_json_path(clean_path) if clean_path else None
+    # Record-relative path
+    steps = compile_json_path(path)
+    if len(steps) == 1 and not steps[0][2]:
+        return "key", steps
+    return "record", steps
+
+
+def json_decode_plan(config: dict, records: List[dict], from_root: bool = False) -> Optional[tuple]:
+    """Plan which values of each selected element are skipped or kept as text, once per file.
+
+    With ``json_decode`` "selective", object keys that no selector,
+    filter, context or field path of ``records`` reads are skipped instead
+    of decoded. With ``json_field_text`` "raw"/"minify", json-typed fields
+    reached by object keys alone are copied from the source text instead of
+    being decoded and encoded again, unless something else reads the same
+    value (another field, a filter, a selector or a ``$parent`` path).
+    With ``from_root`` the plan applies to whole documents (JSON Lines, or
+    files parsed in memory) instead of the elements selected by the
+    selector heads.
+
+    Returns:
+        A plan for :func:`~multi_format_parser.json_utils.decode_json_planned`,
+        or None to decode everything: neither option is set, a schema is
+        validated, a selector head indexes arrays or (without
+        ``from_root``) a path is ``$``-rooted
+    """
+    raw = {"raw": RAW_TEXT, "minify": RAW_MINIFIED}.get(config.get("json_field_text", "encode"))
+    skip = config.get("json_decode", "full") == "selective"
+    if (raw is None and not skip) or "json_schema" in config or "json_schema_path" in config:
+        return None
+
+    paths = []
+    for record in records:
+        head, steps = split_wildcard_selector(record.get("select", ""))
+        keys = selector_keys(head) if from_root else []
+        if keys is None:
+            return None
+        # Locations of the element and of the values each [*]/filter step leads to
+        locations = [tuple(keys)]
+        for predicate, path in steps or ():
+            for filter_path in getattr(predicate, "paths", ()):
+                filter_keys = selector_keys(filter_path)
+                if filter_keys is None:
+                    return None
+                paths.append((locations[-1] + tuple(filter_keys), None))
+            path_keys = selector_keys(path)
+            if path_keys is None:
+                return None
+            locations.append(locations[-1] + tuple(path_keys))
+        paths.extend((location, WALKED) for location in locations)
+        # Elements passed as parents (see expand_json_wildcards)
+        parent_count = 0
+        if steps:
+            parent_count = len(steps) if steps[-1][1] else len(steps) - 1
+
+        for _, source, slot_steps, field_type, _ in compile_json_record(record)["slots"]:
+            if source == "value":
+                continue
+            if source == "root":
+                if not from_root:
+                    return None
+                location = ()
+            elif source == "parent":
+                levels, slot_steps = slot_steps
+                if levels > parent_count:
+                    continue
+                location = locations[parent_count - levels]
+            else:
+                location = locations[-1]
+            kind = raw if field_type == "json" and slot_steps is not None else None
+            for key, index, bracketed in slot_steps or ():
+                if index is not None or bracketed:
+                    # Indexed arrays are decoded whole
+                    if bracketed and key:
+                        location += (key,)
+                    kind = None
+                    break
+                location += (key,)
+            paths.append((location, kind))
+    return compile_decode_plan(paths, skip)
+
+
+def resolve_root_values(plan: dict, root_data: Any) -> Dict[int, Any]:
+    """Extract a plan's ``$``-rooted paths from the document root, by slot position (once per document)."""
+    return {i: run_json_path(root_data, steps) if steps is not None else root_data
+            for i, (_, source, steps, _, _) in enumerate(plan["slots"]) if source == "root"}
+
+
+def compile_json_group(records: List[dict]) -> dict:
+    """Compile records sharing a selector into one plan per record and a shared path tree.
+
+    The tree (see :func:`compile_path_tree`) follows every record-relative
+    path of every record once per element, so fields shared between
+    records (and common prefixes such as ``data[0].header``) are looked
+    up once.
+    """
+    plans = {record["name"]: compile_json_record(record) for record in records}
+    paths = [steps for plan in plans.values() for _, source, steps, _, _ in plan["slots"]
+             if source in ("key", "record")]
+    return {"records": records, "plans": plans, "tree": compile_path_tree(paths)}
+
+
+def group_json_records(records: List[dict], heads: bool = False) -> Dict[Any, List[dict]]:
+    """Group records by selector (equivalent spellings such as ``"$.a"`` and ``"a"`` together).
+
+    With ``heads``, records are grouped by the part of the selector before
+    the first ``[*]`` or filter (see :func:`split_wildcard_selector`), i.e.
+    by the elements they are expanded from.
+    """
+    groups: Dict[Any, List[dict]] = {}
+    for record in records:
+        select_expr = record.get("select", "")
+        if heads:
+            select_expr = split_wildcard_selector(select_expr)[0]
+        keys = selector_keys(select_expr)
+        groups.setdefault(tuple(keys) if keys is not None else select_expr, []).append(record)
+    return groups
+
+
+def build_json_row(record: dict, record_data: Any, root_data: Any, parser_obj: BaseParser,
+                   plan: Optional[dict] = None, root_values: Optional[Dict[int, Any]] = None,
+                   values: Optional[Dict[tuple, Any]] = None, parents: tuple = ()) -> dict:
+    """Build an output row for one record from a selected JSON value.
+
+    Args:
+        record: Record configuration
+        record_data: Selected record value
+        root_data: Document root (for ``$``-rooted paths)
+        parser_obj: Base parser (cast mode, computed fields)
+        plan: Compiled record (see :func:`compile_json_record`), compiled here if omitted
+        root_values: Values of ``$``-rooted paths (see :func:`resolve_root_values`),
+            resolved from ``root_data`` if omitted
+        values: Record-relative path values of ``record_data`` from the group's
+            path tree (see :func:`compile_json_group`), looked up here if omitted
+        parents: Enclosing wildcard elements, nearest last (for ``$parent`` paths)
+
+    Returns:
+        Row dict
+    """
+    if plan is None:
+        plan = compile_json_record(record)
+    if root_values is None:
+        root_values = resolve_root_values(plan, root_data)
+    safe_mode = parser_obj.safe_mode
+
+    row = {}
+    for i, (name, source, steps, field_type, path) in enumerate(plan["slots"]):
+        if source == "value":
+            row[name] = steps
+            continue
+        if source == "root":
+            val = root_values[i]
+        elif source == "parent":
+            levels, parent_steps = steps
+            parent = parents[-levels] if levels <= len(parents) else None
+            val = run_json_path(parent, parent_steps) if parent_steps is not None else parent
+        elif values is not None:
+            val = values.get(steps)
+        elif source == "key" and isinstance(record_data, dict):
+            val = record_data.get(steps[0][0])
+        else:
+            val = run_json_path(record_data, steps)
+
+        # Log when path extraction fails for non-nullable fields
+        if val is None and name in plan["required"]:
+            logger.debug(f"Field '{name}' (non-nullable) extracted None from path '{path}' in record '{plan['name']}'")
+
+        if val is not None and field_type == "json":
+            row[name] = val.text if isinstance(val, RawJson) else parser_obj.json_codec.dumps(val)
+        else:
+            row[name] = cast_value(val, field_type, safe_mode)
+
+    # Compute fields
+    for name, computed_field in plan["computed"]:
+        comp = parser_obj.computed_fields.get(computed_field)
+        if comp:
+            formula = comp.get("formula", "")
+            row[name] = format_formula(formula, row) if formula else None
+        else:
+            logger.warning(f"Computed field '{computed_field}' referenced but not defined in computed_fields")
+            row[name] = None
+
+    return row
+
+
+def load_json_schema(config: dict, json_path: Path) -> Optional[dict]:
+    """Return the schema from ``json_schema`` or ``json_schema_path`` (None if unset or unreadable).
+
+    Schema files are parsed once and re-read only when their modification
+    time or size changes.
+    """
+    if "json_schema" in config:
+        return config["json_schema"]
+    if "json_schema_path" not in config:
+        return None
+
+    schema_path = Path(config["json_schema_path"])
+    if not schema_path.is_absolute():
+        # Resolve relative to config file location
+        config_dir = json_path.parent
+        schema_path = config_dir / schema_path
+
+    try:
+        file_stat = schema_path.stat()
+        return _read_json_schema(str(schema_path), file_stat.st_mtime_ns, file_stat.st_size)
+    except Exception as e:
+        logger.warning(f"Failed to load JSON schema from {schema_path}: {e}")
+        return None
+
+
+@lru_cache(maxsize=32)
+def _read_json_schema(schema_path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a schema file; cached by path, modification time and size (see :func:`load_json_schema`)."""
+    with open(schema_path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def iter_json_line_results(lines: Iterable[str], records: List[dict], parser_obj: BaseParser,
+                           json_schema: Optional[dict] = None, progress: bool = True,
+                           schema_mode: str = "document", decode_plan: Optional[tuple] = None) -> Iterator[RowResult]:
+    """Extract and validate rows from JSON Lines, one document per line.
+
+    Each record's ``select`` is applied to every line's document (which is
+    also the root for ``$`` paths). Row numbers are line numbers; blank
+    lines are skipped. A line that is not valid JSON (or fails the schema)
+    is a row error for every record, and a document selecting no rows is
+    counted as unmatched.
+
+    Args:
+        lines: Text lines (line terminators allowed)
+        records: Record configurations
+        parser_obj: Base parser
+        json_schema: Optional schema each document must satisfy
+        progress: Log progress periodically
+        schema_mode: "element" checks each selected element against the
+            schema instead (see :func:`iter_json_element_rows`)
+        decode_plan: Plan keeping json-typed fields as text (see :func:`json_decode_plan`)
+
+    Yields:
+        Row results for :meth:`BaseParser.apply_row_results`
+    """
+    field_defs = {record["name"]: parser_obj.build_field_defs(record) for record in records}
+    heads = [(split_wildcard_selector(group[0].get("select", ""))[0], compile_json_selectors(group))
+             for group in group_json_records(records, heads=True).values()]
+    validator = get_schema_validator(json_schema) if json_schema else None
+    document_validator, element_validator = (None, validator) if schema_mode == "element" else (validator, None)
+
+    for line_num, line in enumerate(lines, start=1):
+        # Log progress periodically
+        if progress:
+            parser_obj.log_progress("JSON Lines", line_num, line_num)
+
+        if not line.strip():
+            continue
+
+        try:
+            document = parser_obj.json_codec.loads(line.rstrip("\r\n"), decode_plan)
+            if document_validator is not None:
+                error_msg = schema_error_summary(document_validator, document)
+                if error_msg:
+                    raise ValueError(f"JSON schema validation failed: {error_msg}")
+        except ValueError as e:
+            error = ValueError(f"Invalid JSON line: {e}")
+            for record in records:
+                yield (line_num, record["name"], None, None, error)
+            continue
+
+        matched = False
+        for head, selectors in heads:
+            elements = select_json_records(document, head)
+            if not elements:
+                continue
+            root_values = resolve_selector_root_values(selectors, document)
+            for element in elements:
+                for result in iter_json_element_rows(selectors, element, document, root_values, parser_obj,
+                                                     field_defs, line_num, element_validator):
+                    matched = True
+                    yield result
+        if not matched:
+            yield (line_num, None, None, None, None)
+
+
+def compile_json_selectors(records: List[dict]) -> List[Tuple[Optional[tuple], dict]]:
+    """Compile records sharing a selector head into ``(steps, group)`` pairs, one per full selector.
+
+    ``steps`` are the selector's ``[*]`` and filter steps (None for plain
+    selectors, see :func:`split_wildcard_selector`) and ``group`` comes
+    from :func:`compile_json_group`.
+    """
+    return [(split_wildcard_selector(group[0].get("select", ""))[1], compile_json_group(group))
+            for group in group_json_records(records).values()]
+
+
+def resolve_selector_root_values(selectors: List[Tuple[Optional[tuple], dict]], root_data: Any) -> Dict[str, Dict[int, Any]]:
+    """Resolve the ``$``-rooted paths of every compiled record (see :func:`resolve_root_values`)."""
+    return {name: resolve_root_values(plan, root_data)
+            for _, group in selectors for name, plan in group["plans"].items()}
+
+
+def iter_json_element_rows(selectors: List[Tuple[Optional[tuple], dict]], element: Any, root_data: Any,
+                           root_values: Dict[str, Dict[int, Any]], parser_obj: BaseParser,
+                           field_defs: Dict[str, list], row_num: int,
+                           validator: Optional["Draft7Validator"] = None) -> Iterator[RowResult]:
+    """Yield the row results of every record for one element selected by the selector head.
+
+    Wildcard and filter selectors expand the element (see
+    :func:`expand_json_wildcards`) into one row per selected value, so
+    elements a filter drops are never extracted or cast; null values
+    produce no rows. With a schema ``validator`` (``json_schema_mode``
+    "element"), every row of an element that fails the schema is rejected
+    with the schema errors.
+    """
+    schema_error = None
+    checked = validator is None
+    for steps, group in selectors:
+        selected = [(element, ())] if steps is None else expand_json_wildcards(element, steps)
+        for record_data, parents in selected:
+            if record_data is None:
+                continue
+            if not checked:
+                # Only elements that produce rows are validated
+                checked = True
+                error_msg = schema_error_summary(validator, element)
+                schema_error = f"JSON schema validation failed: {error_msg}" if error_msg else None
+            yield from iter_json_group_rows(group, record_data, root_data, root_values, parser_obj,
+                                            field_defs, row_num, parents, schema_error)
+
+
+def iter_json_group_rows(group: dict, record_data: Any, root_data: Any, root_values: Dict[str, Dict[int, Any]],
+                         parser_obj: BaseParser, field_defs: Dict[str, list], row_num: int,
+                         parents: tuple = (), schema_error: Optional[str] = None) -> Iterator[RowResult]:
+    """Yield one row result per record of a group (see :func:`compile_json_group`) for one element.
+
+    The element's paths are looked up once through the group's path tree.
+    A ``schema_error`` is added to every row's validation errors.
+    """
+    values = run_path_tree(record_data, group["tree"], {})
+    for record in group["records"]:
+        record_name = record["name"]
+        row = None
+        try:
+            row = build_json_row(record, record_data, root_data, parser_obj, group["plans"][record_name],
+                                 root_values[record_name], values, parents)
+            validation_errors = parser_obj.validate_row(row, field_defs[record_name])
+            if schema_error:
+                validation_errors.append(schema_error)
+        except Exception as row_error:
+            yield (row_num, record_name, row, None, row_error)
+            continue
+        yield (row_num, record_name, row, validation_errors, None)
+
+
+def _json_lines_worker_setup(config: dict, json_path: Path) -> dict:
+    """Prepare the parser and schema once per worker process."""
+    return {
+        "parser": BaseParser(Path(), config, None, {}, {}),
+        "records": config["records"],
+        "schema": load_json_schema(config, json_path),
+        "schema_mode": json_schema_mode(config),
+        "decode_plan": json_decode_plan(config, config["records"], from_root=True),
+        "encoding": config.get("json_encoding", "utf-8"),
+    }
+
+
+def _parse_json_lines_range(json_path: Path, start: int, end: int) -> Tuple[int, List[RowResult], Tuple[float, float]]:
+    """Parse one byte range of JSON Lines in a worker; returns (lines read, row results, codec timings)."""
+    state = worker_state()
+    # Universal newlines, as when the whole file is opened in text mode
+    lines = io.StringIO(read_byte_range(json_path, start, end).decode(state["encoding"]), newline=None)
+
+    lines_read = 0
+
+    def counted_lines():
+        nonlocal lines_read
+        for line in lines:
+            lines_read += 1
+            yield line
+
+    results = []
+    for line_num, record_name, row, validation_errors, error in iter_json_line_results(
+            counted_lines(), state["records"], state["parser"], state["schema"], progress=False,
+            schema_mode=state["schema_mode"], decode_plan=state["decode_plan"]):
+        if error is not None:
+            error = portable_error(error)
+        results.append((line_num, record_name, row, validation_errors, error))
+    return lines_read, results, state["parser"].json_codec.take_timings()
+
+
+def _parse_json_lines_parallel(json_path: Path, config: dict, parser_obj: BaseParser, workers: int,
+                               columns_by_record: Dict[str, List[str]]) -> bool:
+    """Parse JSON Lines over newline-aligned byte ranges in a process pool.
+
+    Returns:
+        False if the file is too small to split (caller parses it in-process)
+    """
+    ranges = split_byte_ranges(json_path, 0, get_chunk_bytes(config))
+    if len(ranges) < 2:
+        return False
+
+    logger.info(f"Parsing {json_path.name} in {len(ranges)} ranges with {workers} workers")
+
+    line_offset = 0
+    tasks = ((json_path, start, end) for start, end in ranges)
+    chunk_results = imap_ordered(_parse_json_lines_range, tasks, workers,
+                                 _json_lines_worker_setup, (config, json_path))
+    try:
+        for lines_read, results, codec_timings in chunk_results:
+            parser_obj.json_codec.add_timings(codec_timings)
+            parser_obj.apply_row_results(results, columns_by_record, line_offset)
+            line_offset += lines_read
+            if parser_obj.progress_interval > 0:
+                logger.info(f"[JSON Lines] Processed {line_offset:,} lines")
+    finally:
+        chunk_results.close()
+    return True
+
+
+def parse_json_lines(json_path: Path, config: dict, parser_obj: BaseParser) -> None:
+    """Parse a JSON Lines (NDJSON) file, in parallel byte ranges when ``parallel_workers`` > 1."""
+    encoding = config.get("json_encoding", "utf-8")
+    columns_by_record = {record["name"]: parser_obj.get_columns(record) for record in config["records"]}
+
+    workers = get_parallel_workers(config)
+    if workers > 1:
+        if not is_ascii_compatible(encoding):
+            logger.warning(f"Parallel parsing disabled for {json_path.name}: "
+                           f"encoding '{encoding}' is not ASCII-compatible")
+        elif _parse_json_lines_parallel(json_path, config, parser_obj, workers, columns_by_record):
+            return
+
+    json_schema = load_json_schema(config, json_path)
+    try:
+        with open(json_path, encoding=encoding) as f:
+            results = iter_json_line_results(
+                f, config["records"], parser_obj, json_schema, schema_mode=json_schema_mode(config),
+                decode_plan=json_decode_plan(config, config["records"], from_root=True))
+            parser_obj.apply_row_results(results, columns_by_record)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"JSON file not found: {json_path}")
+    except PermissionError:
+        raise PermissionError(f"Permission denied reading JSON file: {json_path}")
+
+
+def incremental_json_groups(config: dict) -> Optional[Dict[Tuple[str, ...], List[dict]]]:
+    """Group records by the object keys of their selector head for incremental reading.
+
+    Returns None if any record needs the whole document: schema validation
+    of the document (per-element validation is fine), selectors indexing
+    arrays before the first ``[*]`` or filter, or ``$``-rooted context/field
+    paths (``$parent`` paths are fine).
+    """
+    if ("json_schema" in config or "json_schema_path" in config) and json_schema_mode(config) != "element":
+        return None
+
+    groups: Dict[Tuple[str, ...], List[dict]] = {}
+    for record in config["records"]:
+        keys = selector_keys(split_wildcard_selector(record.get("select", ""))[0])
+        if keys is None:
+            return None
+        paths = [ctx.get("from") or ctx.get("from_expr") for ctx in record.get("context", [])
+                 if ctx.get("value") is None]
+        paths += [fld.get("path") for fld in record.get("fields", [])]
+        if any(path.startswith("$") and parent_path_levels(path) is None for path in filter(None, paths)):
+            return None
+        groups.setdefault(tuple(keys), []).append(record)
+    return groups
+
+
+def process_json_records(records: List[dict], values: Iterable[Any], root_data: Any,
+                         parser_obj: BaseParser, validator: Optional["Draft7Validator"] = None) -> int:
+    """Build, validate and write rows of ``records`` (sharing a selector head) for each selected value.
+
+    With a ``validator`` each value is also checked against the schema
+    (see :func:`iter_json_element_rows`).
+
+    Returns:
+        Number of values read
+    """
+    columns = {record["name"]: parser_obj.get_columns(record) for record in records}
+    field_defs = {record["name"]: parser_obj.build_field_defs(record) for record in records}
+    # Paths are compiled and $-rooted values resolved once per file
+    selectors = compile_json_selectors(records)
+    root_values = resolve_selector_root_values(selectors, root_data)
+
+    record_idx = 0
+
+    def row_results():
+        nonlocal record_idx
+        for record_data in values:
+            record_idx += 1
+
+            # Log progress periodically
+            parser_obj.log_progress("JSON", record_idx, record_idx)
+
+            yield from iter_json_element_rows(selectors, record_data, root_data, root_values, parser_obj,
+                                              field_defs, record_idx, validator)
+
+    parser_obj.apply_row_results(row_results(), columns)
+    return record_idx
+
+
+def parse_json_incremental(json_path: Path, config: dict, parser_obj: BaseParser,
+                           groups: Dict[Tuple[str, ...], List[dict]]) -> None:
+    """Read the records of each selector group in one pass over the file.
+
+    Arrays are decoded element by element (see :func:`scan_json_records`),
+    so memory is bounded by one element instead of the whole document.
+    json-typed fields may be copied from the text (see :func:`json_decode_plan`).
+    A syntax error is only found once the rows before it are written; they
+    are rolled back (see :meth:`BaseParser.rollback`), so like a document
+    loaded whole, an invalid file writes no rows.
+    """
+    encoding = config.get("json_encoding", "utf-8")
+    validator = load_element_validator(config, json_path)
+    checkpoint = parser_obj.checkpoint()
+
+    for keys, records in groups.items():
+        plan = json_decode_plan(config, records)
+        try:
+            with open(json_path, encoding=encoding) as f:
+                try:
+                    values = parser_obj.json_codec.iter_decoded(scan_json_records(f, list(keys), plan=plan), "scanner")
+                    read = process_json_records(records, values, None, parser_obj, validator)
+                except json.JSONDecodeError as e:
+                    parser_obj.rollback(checkpoint)
+                    raise ValueError(f"Invalid JSON in file {json_path}: {e}")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"JSON file not found: {json_path}")
+        except PermissionError:
+            raise PermissionError(f"Permission denied reading JSON file: {json_path}")
+
+        if not read:
+            for record in records:
+                logger.warning(f"No records found for '{record['name']}' with selector '{record.get('select', '')}'")
+
+
+def parse_json(json_path: Path, config: dict, writer: Optional[CSVWriter], stats: dict, record_stats: Dict[str, ParsingStats],
+               run_stats: Optional[dict] = None) -> Tuple[bool, Optional[str]]:
     """Parse JSON file.
     
     Supports optional JSON Schema validation via config.json_schema or config.json_schema_path.
+    Configs that do not need the whole document (see :func:`incremental_json_groups`)
+    are read incrementally, one array element at a time. Values no path reads
+    can be skipped while decoding (see :func:`json_decode_plan`). With ``json_lines``
+    each line is a separate document (see :func:`parse_json_lines`).
     
     Args:
         json_path: Path to JSON file
@@ -82,19 +753,31 @@ def parse_json(json_path: Path, config: dict, writer: Optional[CSVWriter], stats
         writer: Optional CSV writer
         stats: Statistics dictionary
         record_stats: Per-record statistics
+        run_stats: Run-level counters (see :class:`BaseParser`)
     
     Returns:
         Tuple[bool, Optional[str]]: (success, error_message)
     """
-    parser_obj = BaseParser(json_path, config, writer, stats, record_stats)
+    parser_obj = BaseParser(json_path, config, writer, stats, record_stats, run_stats)
 
     try:
+        if config.get("json_lines"):
+            parse_json_lines(json_path, config, parser_obj)
+            parser_obj.finalize_stats()
+            return (True, None)
+
+        groups = incremental_json_groups(config)
+        if groups is not None:
+            parse_json_incremental(json_path, config, parser_obj, groups)
+            parser_obj.finalize_stats()
+            return (True, None)
+
         encoding = config.get("json_encoding", "utf-8")
 
         try:
             with open(json_path, encoding=encoding) as f:
                 try:
-                    root_data = json.load(f)
+                    root_data = parser_obj.json_codec.load(f, json_decode_plan(config, config["records"], from_root=True))
                 except json.JSONDecodeError as e:
                     raise ValueError(f"Invalid JSON in file {json_path}: {e}")
         except FileNotFoundError:
@@ -102,24 +785,12 @@ def parse_json(json_path: Path, config: dict, writer: Optional[CSVWriter], stats
         except PermissionError:
             raise PermissionError(f"Permission denied reading JSON file: {json_path}")
 
-        # Optional JSON Schema validation
-        json_schema = None
-        if "json_schema" in config:
-            json_schema = config["json_schema"]
-        elif "json_schema_path" in config:
-            schema_path = Path(config["json_schema_path"])
-            if not schema_path.is_absolute():
-                # Resolve relative to config file location
-                config_dir = json_path.parent
-                schema_path = config_dir / schema_path
-
-            try:
-                with open(schema_path, encoding='utf-8') as f:
-                    json_schema = json.load(f)
-            except Exception as e:
-                logger.warning(f"Failed to load JSON schema from {schema_path}: {e}")
-
-        if json_schema:
+        # Optional JSON Schema validation, of the whole document up front or of each element
+        json_schema = load_json_schema(config, json_path)
+        validator = None
+        if json_schema and json_schema_mode(config) == "element":
+            validator = get_schema_validator(json_schema)
+        elif json_schema:
             logger.info("Validating JSON against schema")
             is_valid, error_msg = validate_json_schema(root_data, json_schema)
 
@@ -129,122 +800,35 @@ def parse_json(json_path: Path, config: dict, writer: Optional[CSVWriter], stats
             logger.info("JSON schema validation passed")
 
 
-        for record in config["records"]:
-            select_expr = record.get("select", "")
+        # Records sharing a selector are filled in one pass over its elements
+        for group in group_json_records(config["records"], heads=True).values():
+            select_expr = split_wildcard_selector(group[0].get("select", ""))[0]
+            names = ", ".join(f"'{record['name']}'" for record in group)
 
             # Validate root data type before selection
             if not isinstance(root_data, (dict, list, str, int, float, bool, type(None))):
-                logger.error(f"Unexpected root data type {type(root_data).__name__} for record '{record['name']}'")
+                logger.error(f"Unexpected root data type {type(root_data).__name__} for record {names}")
                 continue
 
             try:
                 records = select_json_records(root_data, select_expr)
             except Exception as e:
-                logger.error(f"Error selecting records for '{record['name']}' with selector '{select_expr}': {e}")
+                logger.error(f"Error selecting records for {names} with selector '{select_expr}': {e}")
                 continue
 
             if not records:
-                logger.warning(f"No records found for '{record['name']}' with selector '{select_expr}'")
+                for record in group:
+                    logger.warning(f"No records found for '{record['name']}' with selector '{record.get('select', '')}'")
                 continue
 
             # Validate records is actually a list
             if not isinstance(records, list):
-                logger.error(f"select_json_records returned {type(records).__name__} instead of list for '{record['name']}'")
+                logger.error(f"select_json_records returned {type(records).__name__} instead of list for {names}")
                 continue
 
-            logger.debug(f"Found {len(records)} record(s) for '{record['name']}' with selector '{select_expr}'")
-
-            columns = parser_obj.get_columns(record)
-            field_defs = parser_obj.build_field_defs(record)
-
-            record_idx = 0
-            for record_data in records:
-                record_idx += 1
-
-                # Log progress periodically
-                parser_obj.log_progress(record["name"], record_idx, record_idx)
+            logger.debug(f"Found {len(records)} record(s) for {names} with selector '{select_expr}'")
 
-                if record_data is None:
-                    continue
-
-                # Wrap row processing in try-except if continueOnError is enabled
-                try:
-                    row = {}
-
-                    # Extract context
-                    for ctx in record.get("context", []):
-                        if ctx.get("value") is not None:
-                            row[ctx["name"]] = ctx["value"]
-                        elif ctx.get("from") or ctx.get("from_expr"):
-                            expr_raw = ctx.get("from") or ctx.get("from_expr")
-                            if expr_raw.startswith("$"):
-                                # Root-relative path
-                                path = expr_raw[1:].lstrip('.')  # Remove $ and leading dot
-                                val = extract_json_path(root_data, path) if path else root_data
-                            else:
-                                # Record-relative path
-                                val = extract_json_path(record_data, expr_raw)
-                            row[ctx["name"]] = cast_value(val, "string", parser_obj.safe_mode)
-                        else:
-                            row[ctx["name"]] = None
-
-                    # Extract fields
-                    for fld in record.get("fields", []):
-                        if fld.get("type") == "computed":
-                            row[fld["name"]] = None
-                            continue
-
-                        if not fld.get("path"):
-                            logger.debug(f"Field '{fld['name']}' in record '{record['name']}' has no path configured")
-                            row[fld["name"]] = None
-                            continue
-
-                        path = fld["path"]
-                        if path.startswith("$"):
-                            # Root-relative path
-                            clean_path = path[1:].lstrip('.')  # Remove $ and leading dot
-                            val = extract_json_path(root_data, clean_path) if clean_path else root_data
-                        else:
-                            # Record-relative path
-                            val = extract_json_path(record_data, path)
-
-                        # Log when path extraction fails for non-nullable fields
-                        if val is None and not fld.get("nullable", True):
-                            logger.debug(f"Field '{fld['name']}' (non-nullable) extracted None from path '{path}' in record '{record['name']}'")
-
-                        if fld.get("type", "").lower() == "json" and val is not None:
-                            row[fld["name"]] = json.dumps(val)
-                        else:
-                            row[fld["name"]] = cast_value(val, fld.get("type", "string"), parser_obj.safe_mode)
-
-                    # Compute fields
-                    for fld in record.get("fields", []):
-                        if fld.get("type") == "computed" and fld.get("computed_field"):
-                            comp = parser_obj.computed_fields.get(fld["computed_field"])
-                            if comp:
-                                formula = comp.get("formula", "")
-                                row[fld["name"]] = format_formula(formula, row) if formula else None
-                            else:
-                                logger.warning(f"Computed field '{fld['computed_field']}' referenced but not defined in computed_fields")
-                                row[fld["name"]] = None
-
-                    # Validate row
-                    record_name = record["name"]
-                    record_stats[record_name].total_rows += 1
-                    parser_obj.validate_and_write_row(record_name, row, columns, field_defs, record_idx)
-
-                except Exception as row_error:
-                    # Handle row-level errors if continueOnError is enabled
-                    if parser_obj.continue_on_error:
-                        logger.warning(f"Row processing error in {record['name']} (continuing): {type(row_error).__name__}: {row_error}")
-                        record_name = record["name"]
-                        if record_name not in record_stats:
-                            record_stats[record_name] = ParsingStats()
-                        record_stats[record_name].skipped_rows += 1
-                        continue
-                    else:
-                        # Re-raise if continueOnError is not enabled
-                        raise
+            process_json_records(group, records, root_data, parser_obj, validator)
 
         parser_obj.finalize_stats()
         return (True, None)
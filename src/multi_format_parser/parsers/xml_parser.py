@@ -3,9 +3,10 @@ XML parser module.
 """
 
 import logging
+import re
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple
 
 try:
     from lxml import etree
@@ -61,21 +62,412 @@ def clear_xpath_cache():
 
 
 
+# Scanner for concatenated XML streams: after the opening '<' of a start or end
+# tag, consume attributes (quoted values may contain '>') up to the closing '>'.
+_XML_TAG_BODY = re.compile(rb'(?:[^>"\']|"[^"]*"|\'[^\']*\')*>')
+
+# Markup that never changes element depth, mapped to its terminator
+_XML_MARKUP_TERMINATORS = (
+    (b"<?", b"?>"),
+    (b"<!--", b"-->"),
+    (b"<![CDATA[", b"]]>"),
+)
+
+# Bytes that may follow "<?xml" in an XML declaration (not in e.g. <?xml-stylesheet?>)
+_XML_SPACE = (b" ", b"\t", b"\r", b"\n")
+
+# Element name at the start of a tag (after its '<')
+_XML_TAG_NAME = re.compile(rb'[^\s/>]+')
+
+
+def iter_xml_documents(stream: BinaryIO, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+    """Split a byte stream of back-to-back XML documents at document boundaries.
+
+    The scanner only tracks element depth (start, end and self-closing tags),
+    skipping comments, processing instructions, CDATA sections and DOCTYPE
+    declarations. A document is complete when its root element closes and
+    is yielded once the next one starts (or the stream ends). Comments and
+    processing instructions between two roots open the next document's
+    prolog, unless an XML declaration follows them (nothing may precede
+    it) or the stream ends, in which case they trail the previous document.
+    Only the document being scanned is buffered.
+
+    A document whose root never closes is cut short where the next one
+    starts, so the XML parser can report it without losing later
+    documents: at an XML declaration, or else at the first start tag
+    named like its root inside it. The latter is only known once the
+    stream ends (a root may contain elements of its own name), so the rest
+    of the stream is buffered and scanned again from that tag.
+
+    Args:
+        stream: Binary file-like object
+        chunk_size: Number of bytes to read per refill
+
+    Yields:
+        Raw bytes of each document, including its XML declaration if present
+    """
+    buf = bytearray()
+    pos = 0
+    doc_start = -1
+    doc_end = -1  # End of the root element of a complete, not yet yielded document
+    misc_start = misc_end = -1  # Comments and PIs after that root
+    depth = 0
+    root_name = b""
+    resync = -1  # First start tag named like the open root inside it
+    eof = False
+
+    while True:
+        end = -1
+        lt = buf.find(b"<", pos)
+        if lt != -1 and (eof or len(buf) - lt >= 9):
+            terminator = None
+            for opener, closer in _XML_MARKUP_TERMINATORS:
+                if buf.startswith(opener, lt):
+                    terminator = closer
+                    break
+
+            if terminator is not None:
+                end = buf.find(terminator, lt + 2)
+                if end != -1:
+                    end += len(terminator)
+                    if buf.startswith(b"<?xml", lt) and buf[lt + 5:lt + 6] in _XML_SPACE:
+                        # An XML declaration always starts a new document
+                        if depth > 0 and resync >= 0:
+                            # Unclosed root: cut it before its first root-named tag and scan again from there
+                            yield bytes(buf[doc_start:resync]).rstrip()
+                            pos, doc_start, depth, resync = resync, -1, 0, -1
+                            continue
+                        if depth > 0:
+                            yield bytes(buf[doc_start:lt]).rstrip()
+                            depth = 0
+                        elif doc_end >= 0:
+                            yield bytes(buf[doc_start:max(doc_end, misc_end)])
+                            doc_end = misc_start = misc_end = -1
+                        doc_start = lt
+                    elif depth == 0 and doc_end >= 0:
+                        if misc_start < 0:
+                            misc_start = lt
+                        misc_end = end
+                    elif depth == 0 and doc_start < 0:
+                        doc_start = lt
+            elif buf.startswith(b"<!", lt):
+                # DOCTYPE, possibly with an internal subset containing '>'
+                end = buf.find(b">", lt)
+                bracket = buf.find(b"[", lt, end if end != -1 else len(buf))
+                if bracket != -1:
+                    close = buf.find(b"]", bracket)
+                    end = buf.find(b">", close) if close != -1 else -1
+                if end != -1:
+                    end += 1
+                    if depth == 0 and doc_end >= 0:
+                        yield bytes(buf[doc_start:doc_end])
+                        doc_start = lt if misc_start < 0 else misc_start
+                        doc_end = misc_start = misc_end = -1
+                    elif depth == 0 and doc_start < 0:
+                        doc_start = lt
+            else:
+                is_end_tag = buf.startswith(b"</", lt)
+                match = _XML_TAG_BODY.match(buf, lt + (2 if is_end_tag else 1))
+                if match is not None:
+                    end = match.end()
+                    if is_end_tag:
+                        depth -= 1
+                    else:
+                        if depth == 0:
+                            if doc_end >= 0:
+                                yield bytes(buf[doc_start:doc_end])
+                                doc_start = lt if misc_start < 0 else misc_start
+                                doc_end = misc_start = misc_end = -1
+                            elif doc_start < 0:
+                                doc_start = lt
+                            name = _XML_TAG_NAME.match(buf, lt + 1)
+                            root_name = name.group() if name else b""
+                        elif (resync < 0 and root_name and buf.startswith(root_name, lt + 1)
+                              and buf[lt + 1 + len(root_name):lt + 2 + len(root_name)] in (*_XML_SPACE, b"/", b">")):
+                            resync = lt
+                        if buf[end - 2:end - 1] != b"/":
+                            depth += 1
+                    if depth <= 0:
+                        depth = 0
+                        resync = -1
+                        if doc_start >= 0 and doc_end < 0:
+                            doc_end = end
+
+        if end != -1:
+            pos = end
+            continue
+
+        if eof:
+            if doc_end >= 0:
+                yield bytes(buf[doc_start:max(doc_end, misc_end)])
+            elif resync >= 0:
+                # Unclosed root: cut it before its first root-named tag and scan again from there
+                yield bytes(buf[doc_start:resync]).rstrip()
+                pos, doc_start, depth, resync = resync, -1, 0, -1
+                continue
+            elif doc_start >= 0 and buf[doc_start:].strip():
+                # Truncated trailing document - let the XML parser report it
+                yield bytes(buf[doc_start:])
+            return
+
+        # Need more data: drop everything before the current document
+        if doc_start >= 0:
+            del buf[:doc_start]
+            pos -= doc_start
+            if doc_end >= 0:
+                doc_end -= doc_start
+            if misc_start >= 0:
+                misc_start -= doc_start
+                misc_end -= doc_start
+            if resync >= 0:
+                resync -= doc_start
+            doc_start = 0
+        else:
+            del buf[:lt if lt != -1 else len(buf)]
+            pos = 0
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            eof = True
+        buf += chunk
+
+
+def _build_namespace_map(root, config: dict, announce: bool = True) -> Dict[str, str]:
+    """Collect namespace prefixes from a document and merge config mappings.
+
+    Args:
+        root: Document root element
+        config: Parser configuration
+        announce: Log default-namespace auto-mapping at INFO level (only the
+                  first document of a multi-document stream does this)
+
+    Returns:
+        Prefix to namespace URI mapping for XPath evaluation
+    """
+    ns = {}
+    default_ns_uri = root.nsmap.get(None)
+
+    if not default_ns_uri:
+        for elem in root.iter():
+            uri = elem.nsmap.get(None)
+            if uri:
+                default_ns_uri = uri
+                break
+
+    for elem in root.iter():
+        for prefix, uri in elem.nsmap.items():
+            if prefix:
+                ns[prefix] = uri
+
+    config_namespaces = config.get("namespaces", {})
+    ns.update(config_namespaces)
+
+    if default_ns_uri:
+        if default_ns_uri not in ns.values():
+            if 'ns0' not in ns:
+                ns['ns0'] = default_ns_uri
+                if announce:
+                    logger.info(f"Detected default XML namespace URI={default_ns_uri}; auto-mapped to prefix 'ns0'. "
+                               f"Use 'ns0:' in XPath or provide namespaces in config to override.")
+            elif announce:
+                logger.warning(f"Default namespace detected (URI={default_ns_uri}), but 'ns0' is already mapped "
+                              f"in config to a different URI. Provide an explicit prefix mapping for the default "
+                              f"namespace in config (namespaces: {{\"yourprefix\": \"{default_ns_uri}\"}}) to use it in XPath.")
+
+    return ns
+
+
+def build_xml_row(node, root, record: dict, ns: Dict[str, str], ns_tuple: tuple, parser_obj: BaseParser) -> dict:
+    """Build an output row for one record from a selected element.
+
+    Args:
+        node: Selected record element
+        root: Document root (for absolute context paths)
+        record: Record configuration
+        ns: Namespace prefix mapping
+        ns_tuple: ``ns`` as a sorted tuple (compiled XPath cache key)
+        parser_obj: Base parser (cast mode, computed fields)
+
+    Returns:
+        Row dict
+    """
+    row = {}
+
+    # Extract context
+    for ctx in record.get("context", []):
+        if ctx.get("value") is not None:
+            row[ctx["name"]] = ctx["value"]
+        elif ctx.get("from") or ctx.get("from_expr"):
+            expr_raw = ctx.get("from") or ctx.get("from_expr")
+            expr = normalize_xpath(expr_raw)
+
+            # Use cached compiled XPath
+            try:
+                compiled_expr = compile_xpath(expr, ns_tuple)
+                if expr.startswith("/"):
+                    val = compiled_expr(root)
+                else:
+                    val = compiled_expr(node)
+            except etree.XPathSyntaxError:
+                # Fallback for dynamic/invalid expressions
+                if expr.startswith("/"):
+                    val = root.xpath(expr, namespaces=ns)
+                else:
+                    val = node.xpath(expr, namespaces=ns)
+
+            val = val[0] if isinstance(val, list) and val else val
+            row[ctx["name"]] = cast_value(val, "string", parser_obj.safe_mode)
+        else:
+            row[ctx["name"]] = None
+
+    # Extract fields
+    for fld in record.get("fields", []):
+        if fld.get("type") == "computed":
+            row[fld["name"]] = None
+            continue
+
+        if not fld.get("path"):
+            logger.debug(f"Field '{fld['name']}' in record '{record['name']}' has no path configured")
+            row[fld["name"]] = None
+            continue
+
+        expr = normalize_xpath(fld["path"])
+
+        # Use cached compiled XPath
+        try:
+            compiled_expr = compile_xpath(expr, ns_tuple)
+            val = compiled_expr(node)
+        except etree.XPathSyntaxError:
+            # Fallback for dynamic/invalid expressions
+            val = node.xpath(expr, namespaces=ns)
+
+        field_type = fld.get("type", "string").lower()
+
+        # Handle JSON field type (variant/complex fields)
+        if field_type == "json":
+            try:
+                # val is already a list or single element from xpath
+                row[fld["name"]] = xml_element_to_json(val, codec=parser_obj.json_codec)
+            except ImportError as e:
+                logger.error(f"Cannot use JSON field type: {e}")
+                row[fld["name"]] = None
+            except Exception as e:
+                logger.warning(f"Failed to convert field '{fld['name']}' to JSON: {e}")
+                row[fld["name"]] = None
+        # Handle XML field type (stores raw XML string)
+        elif field_type == "xml":
+            val = val[0] if isinstance(val, list) and val else val
+            if isinstance(val, etree._Element):
+                row[fld["name"]] = etree.tostring(val, encoding="unicode", with_tail=False)
+            else:
+                row[fld["name"]] = cast_value(val, "string", parser_obj.safe_mode)
+        # Handle all other field types
+        else:
+            val = val[0] if isinstance(val, list) and val else val
+            row[fld["name"]] = cast_value(val, field_type, parser_obj.safe_mode)
+
+    # Compute fields
+    for fld in record.get("fields", []):
+        if fld.get("type") == "computed" and fld.get("computed_field"):
+            comp = parser_obj.computed_fields.get(fld["computed_field"])
+            if comp:
+                formula = comp.get("formula", "")
+                row[fld["name"]] = format_formula(formula, row) if formula else None
+            else:
+                logger.warning(f"Computed field '{fld['computed_field']}' referenced but not defined in computed_fields")
+                row[fld["name"]] = None
+
+    return row
+
+
+def _extract_document(root, ns: Dict[str, str], config: dict, parser_obj: BaseParser) -> int:
+    """Run record extraction for every configured record against one document.
+
+    Args:
+        root: Document root element
+        ns: Namespace prefix mapping
+        config: Parser configuration
+        parser_obj: Shared parser state (writer, stats, flags)
+
+    Returns:
+        Number of selected nodes across all records
+    """
+    record_stats = parser_obj.record_stats
+    total_nodes = 0
+
+    # Convert namespaces dict to tuple for caching
+    ns_tuple = tuple(sorted(ns.items())) if ns else ()
+
+    for record in config["records"]:
+        select_expr = normalize_xpath(record["select"])
+
+        # Use cached compiled XPath for better performance
+        try:
+            compiled_select = compile_xpath(select_expr, ns_tuple)
+            nodes = compiled_select(root)
+        except etree.XPathSyntaxError:
+            # Fallback to direct xpath if compilation fails
+            logger.warning(f"Failed to compile XPath '{select_expr}', using fallback")
+            nodes = root.xpath(select_expr, namespaces=ns)
+
+        if not isinstance(nodes, list):
+            nodes = [nodes] if nodes else []
+
+        columns = parser_obj.get_columns(record)
+        field_defs = parser_obj.build_field_defs(record)
+
+        for node in nodes:
+            if not isinstance(node, etree._Element):
+                continue
+
+            # Wrap row processing in try-except if continueOnError is enabled
+            try:
+                row = build_xml_row(node, root, record, ns, ns_tuple, parser_obj)
+
+                # Validate and write row
+                record_name = record["name"]
+                record_stats[record_name].total_rows += 1
+                parser_obj.validate_and_write_row(record_name, row, columns, field_defs)
+
+            except Exception as row_error:
+                parser_obj.handle_row_error(record["name"], row_error)
+                continue
+
+        total_nodes += len(nodes)
+
+    return total_nodes
+
+
+def _fatal_errors(parser) -> list:
+    """Return fatal entries from an XMLParser's error log."""
+    if not parser.error_log:
+        return []
+    return [e for e in parser.error_log if 'FATAL' in str(e)]
+
+
 def parse_xml(
     xml_path: Path,
     config: dict,
     writer: Optional[CSVWriter],
     stats: dict,
-    record_stats: Dict[str, ParsingStats]
+    record_stats: Dict[str, ParsingStats],
+    run_stats: Optional[dict] = None
 ) -> Tuple[bool, Optional[str]]:
     """Parse XML file.
 
+    With ``xml_multi_document`` enabled the file is treated as a stream of
+    back-to-back XML documents (e.g. one per transaction). Documents are split
+    with :func:`iter_xml_documents` and each one is parsed with a reused
+    ``XMLParser`` and run through the normal record extraction. With
+    ``continueOnError`` a document that fails to parse is skipped and
+    counted as ``skipped_documents`` in the run stats.
+
     Args:
         xml_path: Path to XML file
         config: Parser configuration
         writer: Optional CSV writer for output
         stats: Row count statistics dict
         record_stats: Per-record parsing statistics
+        run_stats: Run-level counters (see :class:`BaseParser`)
 
     Returns:
         Tuple[bool, Optional[str]]: (success, error_message)
@@ -90,177 +482,46 @@ def parse_xml(
     if not HAS_LXML:
         raise ImportError("lxml is required for XML parsing. Install: pip install lxml")
 
-    parser_obj = BaseParser(xml_path, config, writer, stats, record_stats)
+    parser_obj = BaseParser(xml_path, config, writer, stats, record_stats, run_stats)
     total_processed = 0
 
     # Wrap XML parsing logic to catch file-level failures
     try:
         parser = etree.XMLParser(recover=True, huge_tree=True, remove_blank_text=True)
-        tree = etree.parse(str(xml_path), parser)
 
-        # Check for fatal parsing errors
-        if parser.error_log:
-            fatal_errors = [e for e in parser.error_log if 'FATAL' in str(e)]
+        if config.get("xml_multi_document", False):
+            with open(xml_path, "rb") as f:
+                for doc_num, document in enumerate(iter_xml_documents(f), start=1):
+                    try:
+                        root = etree.fromstring(document, parser)
+                        fatal_errors = _fatal_errors(parser)
+                        if root is None or fatal_errors:
+                            error_details = '; '.join(str(e) for e in fatal_errors[:3]) or "no root element"
+                            raise ValueError(f"XML parsing errors in document {doc_num}: {error_details}")
+                    except (etree.XMLSyntaxError, ValueError) as doc_error:
+                        if not parser_obj.continue_on_error:
+                            raise
+                        logger.error(f"Skipping document {doc_num}: {doc_error}")
+                        parser_obj.count_skipped_document()
+                        continue
+
+                    ns = _build_namespace_map(root, config, announce=doc_num == 1)
+                    total_processed += _extract_document(root, ns, config, parser_obj)
+                    parser_obj.log_progress("XML", doc_num, total_processed)
+        else:
+            tree = etree.parse(str(xml_path), parser)
+
+            # Check for fatal parsing errors
+            fatal_errors = _fatal_errors(parser)
             if fatal_errors:
                 error_details = '; '.join(str(e) for e in fatal_errors[:3])  # First 3 errors
                 raise ValueError(f"XML parsing errors: {error_details}")
 
-        root = tree.getroot()
-
-        ns = {}
-        default_ns_uri = root.nsmap.get(None)
-
-        if not default_ns_uri:
-            for elem in root.iter():
-                uri = elem.nsmap.get(None)
-                if uri:
-                    default_ns_uri = uri
-                    break
-
-        for elem in root.iter():
-            for prefix, uri in elem.nsmap.items():
-                if prefix:
-                    ns[prefix] = uri
-
-        config_namespaces = config.get("namespaces", {})
-        ns.update(config_namespaces)
-
-        if default_ns_uri:
-            if default_ns_uri not in ns.values():
-                if 'ns0' not in ns:
-                    ns['ns0'] = default_ns_uri
-                    logger.info(f"Detected default XML namespace URI={default_ns_uri}; auto-mapped to prefix 'ns0'. "
-                               f"Use 'ns0:' in XPath or provide namespaces in config to override.")
-                else:
-                    logger.warning(f"Default namespace detected (URI={default_ns_uri}), but 'ns0' is already mapped "
-                                  f"in config to a different URI. Provide an explicit prefix mapping for the default "
-                                  f"namespace in config (namespaces: {{\"yourprefix\": \"{default_ns_uri}\"}}) to use it in XPath.")
-
-        for record in config["records"]:
-            select_expr = normalize_xpath(record["select"])
-
-            # Convert namespaces dict to tuple for caching
-            ns_tuple = tuple(sorted(ns.items())) if ns else ()
-
-            # Use cached compiled XPath for better performance
-            try:
-                compiled_select = compile_xpath(select_expr, ns_tuple)
-                nodes = compiled_select(root)
-            except etree.XPathSyntaxError:
-                # Fallback to direct xpath if compilation fails
-                logger.warning(f"Failed to compile XPath '{select_expr}', using fallback")
-                nodes = root.xpath(select_expr, namespaces=ns)
-
-            if not isinstance(nodes, list):
-                nodes = [nodes] if nodes else []
-
-            columns = parser_obj.get_columns(record)
-            field_defs = parser_obj.build_field_defs(record)
-
-            for node in nodes:
-                if not isinstance(node, etree._Element):
-                    continue
-
-                # Wrap row processing in try-except if continueOnError is enabled
-                try:
-                    row = {}
-
-                    # Extract context
-                    for ctx in record.get("context", []):
-                        if ctx.get("value") is not None:
-                            row[ctx["name"]] = ctx["value"]
-                        elif ctx.get("from") or ctx.get("from_expr"):
-                            expr_raw = ctx.get("from") or ctx.get("from_expr")
-                            expr = normalize_xpath(expr_raw)
-
-                            # Use cached compiled XPath
-                            try:
-                                compiled_expr = compile_xpath(expr, ns_tuple)
-                                if expr.startswith("/"):
-                                    val = compiled_expr(root)
-                                else:
-                                    val = compiled_expr(node)
-                            except etree.XPathSyntaxError:
-                                # Fallback for dynamic/invalid expressions
-                                if expr.startswith("/"):
-                                    val = root.xpath(expr, namespaces=ns)
-                                else:
-                                    val = node.xpath(expr, namespaces=ns)
-
-                            val = val[0] if isinstance(val, list) and val else val
-                            row[ctx["name"]] = cast_value(val, "string", parser_obj.safe_mode)
-                        else:
-                            row[ctx["name"]] = None
-
-                    # Extract fields
-                    for fld in record.get("fields", []):
-                        if fld.get("type") == "computed":
-                            row[fld["name"]] = None
-                            continue
-
-                        if not fld.get("path"):
-                            logger.debug(f"Field '{fld['name']}' in record '{record['name']}' has no path configured")
-                            row[fld["name"]] = None
-                            continue
+            root = tree.getroot()
+            ns = _build_namespace_map(root, config)
+            total_processed += _extract_document(root, ns, config, parser_obj)
+            parser_obj.log_progress("XML", total_processed, total_processed)
 
-                        expr = normalize_xpath(fld["path"])
-
-                        # Use cached compiled XPath
-                        try:
-                            compiled_expr = compile_xpath(expr, ns_tuple)
-                            val = compiled_expr(node)
-                        except etree.XPathSyntaxError:
-                            # Fallback for dynamic/invalid expressions
-                            val = node.xpath(expr, namespaces=ns)
-
-                        field_type = fld.get("type", "string").lower()
-
-                        # Handle JSON field type (variant/complex fields)
-                        if field_type == "json":
-                            try:
-                                # val is already a list or single element from xpath
-                                row[fld["name"]] = xml_element_to_json(val)
-                            except ImportError as e:
-                                logger.error(f"Cannot use JSON field type: {e}")
-                                row[fld["name"]] = None
-                            except Exception as e:
-                                logger.warning(f"Failed to convert field '{fld['name']}' to JSON: {e}")
-                                row[fld["name"]] = None
-                        # Handle XML field type (stores raw XML string)
-                        elif field_type == "xml":
-                            val = val[0] if isinstance(val, list) and val else val
-                            if isinstance(val, etree._Element):
-                                row[fld["name"]] = etree.tostring(val, encoding="unicode", with_tail=False)
-                            else:
-                                row[fld["name"]] = cast_value(val, "string", parser_obj.safe_mode)
-                        # Handle all other field types
-                        else:
-                            val = val[0] if isinstance(val, list) and val else val
-                            row[fld["name"]] = cast_value(val, field_type, parser_obj.safe_mode)
-
-                    # Compute fields
-                    for fld in record.get("fields", []):
-                        if fld.get("type") == "computed" and fld.get("computed_field"):
-                            comp = parser_obj.computed_fields.get(fld["computed_field"])
-                            if comp:
-                                formula = comp.get("formula", "")
-                                row[fld["name"]] = format_formula(formula, row) if formula else None
-                            else:
-                                logger.warning(f"Computed field '{fld['computed_field']}' referenced but not defined in computed_fields")
-                                row[fld["name"]] = None
-
-                    # Validate and write row
-                    record_name = record["name"]
-                    record_stats[record_name].total_rows += 1
-                    parser_obj.validate_and_write_row(record_name, row, columns, field_defs)
-
-                except Exception as row_error:
-                    parser_obj.handle_row_error(record["name"], row_error)
-                    continue
-
-            # Log progress periodically
-            total_processed += len(nodes)
-            parser_obj.log_progress(record["name"], total_processed, total_processed)
         # Success - return status tuple
         parser_obj.finalize_stats()
         return (True, None)
@@ -1,19 +1,35 @@
 """
-Streaming parser for processing huge files without loading them entirely into memory.
+Batch-streaming parsers for processing huge files with bounded memory.
 
-This module provides streaming parsers that process files incrementally,
-making it possible to handle files larger than available RAM.
+Every format plugs into the same pipeline::
+
+    reader -> batch of raw records -> compiled plan -> sink
+
+The reader yields lists of at most ``streaming_batch_size`` raw records
+(CSV rows, fixed-width lines, XML elements, JSON values), the plan built by
+the format's parser module turns a batch into row results, and the sink
+(:meth:`BaseParser.apply_row_results`) writes them and updates stats. The
+plans are the ones the regular parsers use, so output is identical.
+
+Enable with ``"streaming": true`` in the config. Configurations a format
+cannot stream (see each ``parse_*_streaming`` function) fall back to the
+regular parser.
 """
 
 import csv
+import itertools
+import json
 import logging
+import re
 from pathlib import Path
-from typing import Any, Dict, Iterator, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from multi_format_parser.casting import cast_value
 from multi_format_parser.csv_writer import CSVWriter
+from multi_format_parser.json_utils import scan_json_records
 from multi_format_parser.models import ParsingStats
-from multi_format_parser.parsers.base_parser import BaseParser
+from multi_format_parser.parsers import csv_parser, fixed_width_parser, json_parser, xml_parser
+from multi_format_parser.parsers.base_parser import BaseParser, RowResult
+from multi_format_parser.xpath_utils import normalize_xpath
 
 try:
     from lxml import etree
@@ -23,219 +39,122 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BATCH_SIZE = 10000
+
+
+def get_batch_size(config: dict) -> int:
+    """Return the configured raw records per batch (``streaming_batch_size``)."""
+    batch_size = config.get("streaming_batch_size", DEFAULT_BATCH_SIZE)
+    if not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size <= 0:
+        raise ValueError(f"streaming_batch_size must be a positive integer, got {batch_size!r}")
+    return batch_size
+
+
+def iter_batches(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """Group an iterable into lists of at most ``batch_size`` items."""
+    iterator = iter(items)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def run_pipeline(batches: Iterable[List[Any]], plan: Callable[[List[Any]], Iterable[RowResult]],
+                 parser_obj: BaseParser, columns_by_record: Dict[str, List[str]], label: str) -> int:
+    """Feed reader batches through a plan into the parser's writer.
 
-def stream_csv_records(
-    file_path: Path,
-    config: dict,
-    chunk_size: int = 10000
-) -> Iterator[Dict[str, Any]]:
-    """Stream CSV records in chunks without loading entire file.
-    
     Args:
-        file_path: Path to CSV file
-        config: Parser configuration
-        chunk_size: Number of records to yield per chunk
-        
-    Yields:
-        Dictionary containing parsed records
+        batches: Reader output, lists of raw records
+        plan: Turns one batch into row results numbered from 1 within the batch
+        parser_obj: Sink (writer, stats, error policy)
+        columns_by_record: Output columns per record name
+        label: Format name for progress logging
+
+    Returns:
+        Number of raw records read
     """
-    encoding = config.get("encoding", "utf-8")
-    delimiter = config.get("delimiter", ",")
-    has_header = config.get("has_header", True)
-
-    with open(file_path, encoding=encoding) as f:
-        reader = csv.DictReader(f, delimiter=delimiter) if has_header else csv.reader(f, delimiter=delimiter)
-
-        chunk = []
-        for row in reader:
-            if isinstance(row, dict):
-                chunk.append(row)
-            else:
-                # Handle case where no header
-                chunk.append({f"col_{i}": val for i, val in enumerate(row)})
-
-            if len(chunk) >= chunk_size:
-                yield {"records": chunk}
-                chunk = []
-
-        # Yield remaining records
-        if chunk:
-            yield {"records": chunk}
-
-
-def stream_json_records(
-    file_path: Path,
-    config: dict,
-    selector: str = "$"
-) -> Iterator[Dict[str, Any]]:
-    """Stream JSON records using incremental parsing.
-    
-    This uses ijson for true streaming JSON parsing, which is useful
-    for very large JSON files.
-    
-    Args:
-        file_path: Path to JSON file
-        config: Parser configuration
-        selector: JSON path selector
-        
-    Yields:
-        Individual records from the JSON file
-        
-    Requires:
-        pip install ijson
+    records_read = 0
+    interval = parser_obj.progress_interval
+    for batch in batches:
+        parser_obj.apply_row_results(plan(batch), columns_by_record, records_read)
+        previous = records_read
+        records_read += len(batch)
+        if interval > 0 and records_read // interval > previous // interval:
+            logger.info(f"[{label}] Streamed {records_read:,} records")
+    return records_read
+
+
+def parse_csv_streaming(csv_path: Path, config: dict, writer: Optional[CSVWriter], stats: dict,
+                        record_stats: Dict[str, ParsingStats], run_stats: Optional[dict] = None) -> Tuple[bool, Optional[str]]:
+    """Parse a CSV file in streaming batches.
+
+    Uses the stdlib reader (``csv_engine`` and ``parallel_workers`` do not
+    apply) with the same record plans and routing as :func:`parse_csv`.
+
+    Returns:
+        Tuple[bool, Optional[str]]: (success, error_message)
     """
+    parser_obj = BaseParser(csv_path, config, writer, stats, record_stats, run_stats)
+
     try:
-        import ijson
-    except ImportError:
-        raise ImportError(
-            "ijson is required for streaming JSON parsing. "
-            "Install with: pip install ijson"
-        )
+        reader_args = csv_parser.csv_reader_args(config)
 
-    encoding = config.get("json_encoding", "utf-8")
+        with open(csv_path, encoding=config.get("csv_encoding", "utf-8"), newline='') as f:
+            for _ in range(config.get("csv_skip_rows", 0)):
+                next(f, None)
 
-    # Convert selector to ijson path format
-    # Simple conversions: $.users -> users.item, $.data.items -> data.items.item
-    ijson_path = selector.lstrip('$').lstrip('.')
+            header = None
+            header_idx = {}
+            if config.get("csv_has_header", True):
+                header = next(csv.reader(f, **reader_args), None)
+                if header:
+                    header_idx = {name: i for i, name in enumerate(header)}
 
-    if not ijson_path:
-        ijson_path = "item"
-    else:
-        ijson_path = f"{ijson_path}.item"
+            plans = csv_parser.build_record_plans(config, parser_obj, header_idx, bool(header))
+            router = csv_parser.build_record_router(plans, config.get("csv_fan_out", False))
+            rows = csv_parser.iter_csv_rows(f, reader_args, csv_parser.projected_max_column(plans))
 
-    with open(file_path, encoding=encoding) as f:
-        parser = ijson.items(f, ijson_path)
+            def plan(batch):
+                return csv_parser.iter_row_results(iter(batch), router, parser_obj, progress=False)
 
-        for record in parser:
-            yield record
+            columns_by_record = {p["record"]["name"]: p["columns"] for p in plans}
+            run_pipeline(iter_batches(rows, get_batch_size(config)), plan, parser_obj, columns_by_record, "CSV")
 
+        parser_obj.finalize_stats()
+        return (True, None)
+
+    except Exception as e:
+        return parser_obj.handle_file_error(e)
+
+
+def parse_fixed_width_streaming(file_path: Path, config: dict, writer: Optional[CSVWriter], stats: dict,
+                                record_stats: Dict[str, ParsingStats], run_stats: Optional[dict] = None) -> Tuple[bool, Optional[str]]:
+    """Parse a fixed-width file in streaming batches of lines (or fixed-length records).
 
-def stream_xml_records(
-    file_path: Path,
-    config: dict,
-    record_tag: str
-) -> Iterator[Any]:
-    """Stream XML records using iterparse for memory efficiency.
-    
-    This uses lxml's iterparse which processes the XML file incrementally,
-    only keeping the current element in memory.
-    
-    Args:
-        file_path: Path to XML file
-        config: Parser configuration
-        record_tag: XML tag name to treat as record boundary
-        
-    Yields:
-        XML element objects
-        
-    Example:
-        >>> for record in stream_xml_records(Path("huge.xml"), config, "Record"):
-        ...     # Process record
-        ...     pass
-    """
-    if not HAS_LXML:
-        raise ImportError("lxml is required for XML streaming. Install: pip install lxml")
-
-    # Parse XML incrementally
-    context = etree.iterparse(str(file_path), events=('end',), tag=record_tag, huge_tree=True)
-
-    for event, elem in context:
-        # Yield the element
-        yield elem
-
-        # Clear the element and its ancestors to free memory
-        elem.clear()
-
-        # Also eliminate now-empty references from the root node
-        while elem.getprevious() is not None:
-            del elem.getparent()[0]
-
-    # Clean up
-    del context
-
-
-def parse_csv_streaming(
-    csv_path: Path,
-    config: dict,
-    writer: Optional[CSVWriter],
-    stats: dict,
-    record_stats: Dict[str, ParsingStats],
-    chunk_size: int = 10000
-) -> Tuple[bool, Optional[str]]:
-    """Parse CSV file in streaming mode.
-    
-    Processes the CSV file in chunks to minimize memory usage.
-    Ideal for files > 1GB.
-    
-    Args:
-        csv_path: Path to CSV file
-        config: Parser configuration
-        writer: CSV writer for output
-        stats: Statistics dictionary
-        record_stats: Per-record statistics
-        chunk_size: Records per chunk
-        
     Returns:
         Tuple[bool, Optional[str]]: (success, error_message)
     """
-    parser_obj = BaseParser(csv_path, config, writer, stats, record_stats)
+    parser_obj = BaseParser(file_path, config, writer, stats, record_stats, run_stats)
 
     try:
-        encoding = config.get("encoding", "utf-8")
-        delimiter = config.get("delimiter", ",")
-        has_header = config.get("has_header", True)
-
-        with open(csv_path, encoding=encoding) as f:
-            reader = csv.DictReader(f, delimiter=delimiter) if has_header else csv.reader(f, delimiter=delimiter)
-
-            for record_config in config["records"]:
-                record_name = record_config["name"]
-                columns = parser_obj.get_columns(record_config)
-                field_defs = parser_obj.build_field_defs(record_config)
-
-                row_count = 0
-
-                for row in reader:
-                    row_count += 1
-
-                    # Convert list to dict if no header
-                    if isinstance(row, list):
-                        row_dict = {f"col_{i}": val for i, val in enumerate(row)}
-                    else:
-                        row_dict = row
-
-                    # Process row
-                    try:
-                        processed_row = {}
-
-                        for fld in record_config.get("fields", []):
-                            field_name = fld["name"]
-                            source_name = fld.get("path", field_name)
-
-                            value = row_dict.get(source_name)
-                            processed_row[field_name] = cast_value(
-                                value,
-                                fld.get("type", "string"),
-                                parser_obj.safe_mode
-                            )
-
-                        # Validate and write
-                        record_stats[record_name].total_rows += 1
-                        parser_obj.validate_and_write_row(
-                            record_name,
-                            processed_row,
-                            columns,
-                            field_defs
-                        )
-
-                    except Exception as e:
-                        parser_obj.handle_row_error(record_name, e)
-
-                    # Log progress periodically
-                    if row_count % 10000 == 0:
-                        parser_obj.log_progress(record_name, row_count, row_count)
-
-                logger.info(f"Streaming parse complete: {row_count} records processed")
+        record_specs = fixed_width_parser.build_record_specs(config, parser_obj)
+        index = fixed_width_parser.build_record_index(record_specs)
+        bytes_encoding = fixed_width_parser.get_bytes_encoding(config, file_path.name)
+        if bytes_encoding:
+            fixed_width_parser.compile_bytes_extractors(record_specs, bytes_encoding, parser_obj.safe_mode)
+        terminated = not fixed_width_parser.get_record_length(config)
+        rolling = {}  # from_record context carries over batch boundaries
+
+        def plan(batch):
+            return fixed_width_parser.iter_line_results(batch, index, parser_obj, progress=False,
+                                                        encoding=bytes_encoding, terminated=terminated,
+                                                        rolling=rolling)
+
+        lines = fixed_width_parser.iter_input_lines(file_path, config, bytes_encoding)
+        columns_by_record = {info["record"]["name"]: info["columns"] for info in record_specs}
+        run_pipeline(iter_batches(lines, get_batch_size(config)), plan, parser_obj, columns_by_record,
+                     "Fixed-Width")
 
         parser_obj.finalize_stats()
         return (True, None)
@@ -244,94 +163,278 @@ def parse_csv_streaming(
         return parser_obj.handle_file_error(e)
 
 
-def parse_xml_streaming(
-    xml_path: Path,
-    config: dict,
-    writer: Optional[CSVWriter],
-    stats: dict,
-    record_stats: Dict[str, ParsingStats]
-) -> Tuple[bool, Optional[str]]:
-    """Parse XML file in streaming mode.
-    
-    Uses iterparse to process XML incrementally, clearing processed
-    elements from memory. Ideal for files > 1GB.
-    
-    Args:
-        xml_path: Path to XML file
-        config: Parser configuration
-        writer: CSV writer for output
-        stats: Statistics dictionary
-        record_stats: Per-record statistics
-        
+# --- XML ---------------------------------------------------------------------
+
+_XML_NAME = r"[A-Za-z_][\w.\-]*(?::[A-Za-z_][\w.\-]*)?"
+_XML_STEP = rf"(?:\*|{_XML_NAME})"
+_SIMPLE_SELECT = re.compile(rf"^(//|/|\.//|\./)?({_XML_STEP}(?:/{_XML_STEP})*)$")
+# Absolute location paths inside an expression (start of string or after an operator/paren)
+_ABSOLUTE_PATH = re.compile(r"(?:^|[\s(,|=<>+])(//?)([^\s,()|=<>+]*)")
+_UNSTREAMABLE_AXES = ("preceding", "following")
+_UPWARD_AXES = ("..", "ancestor", "parent::")
+
+
+def _compile_select(select: str) -> Optional[Tuple[str, List[str]]]:
+    """Parse a simple select path into ``(mode, steps)``; None if not streamable.
+
+    Modes: ``abs`` (full path from the document root) and ``desc`` (path may
+    start at any depth). A relative select is evaluated from the root element
+    by :func:`parse_xml`, so it becomes ``abs`` under a wildcard root step.
+    """
+    match = _SIMPLE_SELECT.match(normalize_xpath(select))
+    if not match:
+        return None
+    lead, path = match.groups()
+    steps = path.split("/")
+    if lead in ("//", ".//"):
+        return ("desc", steps)
+    if lead == "/":
+        return ("abs", steps)
+    return ("abs", ["*"] + steps)
+
+
+def _absolute_prefixes(expr: str) -> Optional[List[List[str]]]:
+    """Return element steps of absolute paths in ``expr``; None if one starts with ``//``."""
+    prefixes = []
+    for slashes, path in _ABSOLUTE_PATH.findall(normalize_xpath(expr)):
+        if slashes == "//":
+            return None
+        steps = []
+        for step in path.split("/"):
+            name = step.split("[", 1)[0]
+            if not re.fullmatch(_XML_STEP, name):
+                break
+            steps.append(name)
+            if name != step:
+                break  # Predicate: keep every element with this name
+        if steps:
+            prefixes.append(steps)
+    return prefixes
+
+
+def _resolve_step(step: str, ns: Dict[str, str]) -> Optional[str]:
+    """Resolve a QName step to lxml's Clark notation ('*' stays a wildcard)."""
+    if step == "*":
+        return step
+    if ":" in step:
+        prefix, local = step.split(":", 1)
+        uri = ns.get(prefix)
+        return f"{{{uri}}}{local}" if uri else None
+    return step
+
+
+def _steps_match(steps: List[Optional[str]], tags: List[str]) -> bool:
+    return all(step == "*" or step == tag for step, tag in zip(steps, tags))
+
+
+def _xml_stream_plan(config: dict) -> Optional[dict]:
+    """Check that every record can be streamed and collect the matching rules.
+
+    Returns:
+        Dict with per-record ``selects``, ``references`` (absolute paths whose
+        targets must be retained) and ``upward`` (an expression climbs out of
+        its record), or None to fall back to :func:`parse_xml`
+    """
+    if config.get("xml_multi_document", False):
+        return None
+
+    selects = []
+    references = []
+    upward = False
+    for record in config["records"]:
+        select = _compile_select(record.get("select", ""))
+        if select is None:
+            logger.info(f"Record '{record['name']}' select '{record.get('select')}' is not a simple path")
+            return None
+        selects.append(select)
+
+        expressions = [ctx.get("from") or ctx.get("from_expr") for ctx in record.get("context", [])
+                       if ctx.get("value") is None]
+        expressions += [fld.get("path") for fld in record.get("fields", [])]
+        for expr in filter(None, expressions):
+            if any(axis in expr for axis in _UNSTREAMABLE_AXES):
+                logger.info(f"Record '{record['name']}' path '{expr}' uses sibling axes")
+                return None
+            prefixes = _absolute_prefixes(expr)
+            if prefixes is None:
+                logger.info(f"Record '{record['name']}' path '{expr}' searches the whole document")
+                return None
+            references.extend(prefixes)
+            upward = upward or any(axis in expr for axis in _UPWARD_AXES)
+
+    return {"selects": selects, "references": references, "upward": upward}
+
+
+def _stream_namespace_map(declared: Dict[str, str], default_uri: Optional[str], config: dict) -> Dict[str, str]:
+    """Build the XPath namespace map like :func:`xml_parser._build_namespace_map`."""
+    ns = dict(declared)
+    ns.update(config.get("namespaces", {}))
+    if default_uri and default_uri not in ns.values() and 'ns0' not in ns:
+        ns['ns0'] = default_uri
+    return ns
+
+
+def iter_xml_batches(xml_path: Path, config: dict, stream_plan: dict, batch_size: int,
+                     state: dict) -> Iterator[List[Tuple[dict, Any]]]:
+    """Read an XML file with iterparse and yield batches of ``(record, element)``.
+
+    The outermost element matching any record select is a unit: once it ends,
+    its subtree is complete and every match inside it (in document order) is
+    queued. Units are removed from the tree after their batch was processed,
+    unless an absolute path points into them; elements outside units are
+    removed once complete when no path climbs out of its record. Ancestors
+    stay in the tree, so absolute and ``ancestor::`` paths resolve against
+    everything read so far.
+
+    ``state`` receives ``root``, ``ns`` and ``ns_tuple`` for the plan.
+    """
+    records = config["records"]
+    declared: Dict[str, str] = {}
+    default_uri = None
+    resolved: List[Tuple[str, List[Optional[str]]]] = []
+    references: List[List[Optional[str]]] = []
+
+    def resolve():
+        ns = _stream_namespace_map(declared, default_uri, config)
+        state["ns"] = ns
+        state["ns_tuple"] = tuple(sorted(ns.items())) if ns else ()
+        resolved[:] = [(mode, [_resolve_step(s, ns) for s in steps]) for mode, steps in stream_plan["selects"]]
+        references[:] = [[_resolve_step(s, ns) for s in steps] for steps in stream_plan["references"]]
+
+    def matching_records(tags):
+        matched = []
+        for record, (mode, steps) in zip(records, resolved):
+            if None in steps:
+                continue
+            if mode == "abs":
+                if len(steps) == len(tags) and _steps_match(steps, tags):
+                    matched.append(record)
+            elif len(steps) <= len(tags) and _steps_match(steps, tags[-len(steps):]):
+                matched.append(record)
+        return matched
+
+    def referenced(tags):
+        return any(_steps_match(ref, tags) for ref in references)
+
+    def dispose(elem):
+        parent = elem.getparent()
+        elem.clear(keep_tail=True)
+        if parent is not None:
+            parent.remove(elem)
+
+    resolve()
+    tags: List[str] = []
+    open_matches: List[Tuple[int, List[dict]]] = []  # (document order, records) per open element
+    units_open = 0
+    order = 0
+    unit_matches: List[Tuple[int, dict, Any]] = []
+    batch: List[Tuple[dict, Any]] = []
+    batch_units: List[Any] = []
+
+    context = etree.iterparse(str(xml_path), events=("start", "end", "start-ns"),
+                              recover=True, huge_tree=True, remove_blank_text=True)
+    for event, item in context:
+        if event == "start-ns":
+            prefix, uri = item
+            if prefix:
+                declared[prefix] = uri
+            elif default_uri is None:
+                default_uri = uri
+            resolve()
+            continue
+
+        if event == "start":
+            if state.get("root") is None:
+                state["root"] = item
+            tags.append(item.tag)
+            matched = matching_records(tags)
+            open_matches.append((order, matched))
+            order += 1
+            units_open += bool(matched)
+            continue
+
+        # End event: the element and its subtree are complete
+        doc_order, matched = open_matches.pop()
+        if matched:
+            unit_matches.extend((doc_order, record, item) for record in matched)
+            units_open -= 1
+            if units_open == 0:
+                unit_matches.sort(key=lambda m: m[0])
+                batch.extend((record, elem) for _, record, elem in unit_matches)
+                unit_matches = []
+                if not referenced(tags):
+                    batch_units.append(item)
+        elif units_open == 0 and len(tags) > 1 and not stream_plan["upward"] and not referenced(tags):
+            if batch:
+                # Queued units may live inside this element
+                yield batch
+                batch = []
+                for unit in batch_units:
+                    dispose(unit)
+                batch_units = []
+            dispose(item)
+        tags.pop()
+
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+            for unit in batch_units:
+                dispose(unit)
+            batch_units = []
+
+    if batch:
+        yield batch
+
+    fatal_errors = xml_parser._fatal_errors(context)
+    if fatal_errors:
+        error_details = '; '.join(str(e) for e in fatal_errors[:3])
+        raise ValueError(f"XML parsing errors: {error_details}")
+
+
+def parse_xml_streaming(xml_path: Path, config: dict, writer: Optional[CSVWriter], stats: dict,
+                        record_stats: Dict[str, ParsingStats], run_stats: Optional[dict] = None) -> Tuple[bool, Optional[str]]:
+    """Parse an XML file with iterparse, releasing records once processed.
+
+    Requires simple select paths (``/a/b``, ``//b``, ``a/b``). Context and
+    field paths may be relative, absolute (``/a/header/x``) or climb to
+    ancestors; elements they reach outside the record must come before it in
+    the document. Sibling axes, ``//`` inside context/field paths and
+    ``xml_multi_document`` fall back to :func:`parse_xml`. Fatal XML errors
+    are reported after the rows read before them were written.
+
     Returns:
         Tuple[bool, Optional[str]]: (success, error_message)
     """
     if not HAS_LXML:
         raise ImportError("lxml is required for XML parsing. Install: pip install lxml")
 
-    parser_obj = BaseParser(xml_path, config, writer, stats, record_stats)
+    stream_plan = _xml_stream_plan(config)
+    if stream_plan is None:
+        logger.info(f"Streaming not supported for this XML config; parsing {xml_path.name} in memory")
+        return xml_parser.parse_xml(xml_path, config, writer, stats, record_stats, run_stats)
 
-    try:
-        for record_config in config["records"]:
-            record_name = record_config["name"]
-            columns = parser_obj.get_columns(record_config)
-            field_defs = parser_obj.build_field_defs(record_config)
-
-            # Extract tag name from select XPath (simplified)
-            select_expr = record_config["select"]
-            # Handle simple cases like "//Record" or ".//Item"
-            tag_name = select_expr.split('/')[-1].split('[')[0].split(':')[-1]
-
-            if not tag_name or tag_name == '*':
-                logger.error(f"Cannot determine tag name from selector '{select_expr}' for streaming")
-                continue
-
-            logger.info(f"Streaming XML records with tag '{tag_name}'")
-
-            row_count = 0
-
-            # Stream records
-            for elem in stream_xml_records(xml_path, config, tag_name):
-                row_count += 1
+    parser_obj = BaseParser(xml_path, config, writer, stats, record_stats, run_stats)
 
+    try:
+        field_defs = {record["name"]: parser_obj.build_field_defs(record) for record in config["records"]}
+        columns_by_record = {record["name"]: parser_obj.get_columns(record) for record in config["records"]}
+        state: Dict[str, Any] = {"root": None}
+
+        def plan(batch):
+            for index, (record, elem) in enumerate(batch, start=1):
+                record_name = record["name"]
+                row = None
                 try:
-                    row = {}
-
-                    # Extract fields
-                    for fld in record_config.get("fields", []):
-                        if fld.get("type") == "computed":
-                            row[fld["name"]] = None
-                            continue
-
-                        path = fld.get("path", "")
-                        if path:
-                            # Simplified path extraction for streaming
-                            val = elem.findtext(path.lstrip('./'))
-                            row[fld["name"]] = cast_value(
-                                val,
-                                fld.get("type", "string"),
-                                parser_obj.safe_mode
-                            )
-                        else:
-                            row[fld["name"]] = None
-
-                    # Validate and write
-                    record_stats[record_name].total_rows += 1
-                    parser_obj.validate_and_write_row(
-                        record_name,
-                        row,
-                        columns,
-                        field_defs
-                    )
-
-                except Exception as e:
-                    parser_obj.handle_row_error(record_name, e)
-
-                # Log progress
-                if row_count % 10000 == 0:
-                    parser_obj.log_progress(record_name, row_count, row_count)
-
-            logger.info(f"Streaming parse complete: {row_count} records processed")
+                    row = xml_parser.build_xml_row(elem, state["root"], record, state["ns"], state["ns_tuple"],
+                                                   parser_obj)
+                    validation_errors = parser_obj.validate_row(row, field_defs[record_name])
+                except Exception as row_error:
+                    yield (index, record_name, row, None, row_error)
+                    continue
+                yield (index, record_name, row, validation_errors, None)
+
+        batches = iter_xml_batches(xml_path, config, stream_plan, get_batch_size(config), state)
+        run_pipeline(batches, plan, parser_obj, columns_by_record, "XML")
 
         parser_obj.finalize_stats()
         return (True, None)
@@ -340,92 +443,68 @@ def parse_xml_streaming(
         return parser_obj.handle_file_error(e)
 
 
-def parse_json_streaming(
-    json_path: Path,
-    config: dict,
-    writer: Optional[CSVWriter],
-    stats: dict,
-    record_stats: Dict[str, ParsingStats]
-) -> Tuple[bool, Optional[str]]:
-    """Parse JSON file in streaming mode.
-    
-    Uses ijson for incremental parsing. Ideal for files > 1GB.
-    
-    Args:
-        json_path: Path to JSON file
-        config: Parser configuration
-        writer: CSV writer for output
-        stats: Statistics dictionary
-        record_stats: Per-record statistics
-        
-    Returns:
-        Tuple[bool, Optional[str]]: (success, error_message)
-        
-    Requires:
-        pip install ijson
-    """
-    try:
-        import ijson
-    except ImportError:
-        raise ImportError(
-            "ijson is required for streaming JSON parsing. "
-            "Install with: pip install ijson"
-        )
+# --- JSON --------------------------------------------------------------------
 
-    parser_obj = BaseParser(json_path, config, writer, stats, record_stats)
+def scan_json_file(json_path: Path, keys: List[str], encoding: str, decode_plan: Optional[tuple] = None) -> Iterator[Any]:
+    """Yield selected values with the built-in scanner (see :func:`scan_json_records`)."""
+    with open(json_path, encoding=encoding) as f:
+        try:
+            yield from scan_json_records(f, keys, plan=decode_plan)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in file {json_path}: {e}")
 
-    try:
-        for record_config in config["records"]:
-            record_name = record_config["name"]
-            selector = record_config.get("select", "$")
 
-            columns = parser_obj.get_columns(record_config)
-            field_defs = parser_obj.build_field_defs(record_config)
+def parse_json_streaming(json_path: Path, config: dict, writer: Optional[CSVWriter], stats: dict,
+                         record_stats: Dict[str, ParsingStats], run_stats: Optional[dict] = None) -> Tuple[bool, Optional[str]]:
+    """Parse a JSON file incrementally with the built-in scanner.
+
+    Records sharing a selector head are filled in one pass, ``[*]``
+    wildcards and filters being applied per streamed element. Selectors
+    with array indexes, ``$``-rooted context/field paths and schema
+    validation of the whole document need the whole document and fall back
+    to :func:`parse_json`; with ``json_schema_mode`` "element" each
+    streamed element is validated instead. Values are read with
+    :func:`~multi_format_parser.json_utils.scan_json_records`, which decodes
+    like :func:`parse_json` (last of duplicate keys, escaped keys, ``NaN``,
+    integers of any size) and can skip values or copy json-typed fields
+    from the text (see :func:`~multi_format_parser.parsers.json_parser.json_decode_plan`).
 
-            row_count = 0
+    Returns:
+        Tuple[bool, Optional[str]]: (success, error_message)
+    """
+    if config.get("json_lines"):
+        # Already read line by line
+        return json_parser.parse_json(json_path, config, writer, stats, record_stats, run_stats)
+    groups = json_parser.incremental_json_groups(config)
+    if groups is None:
+        logger.info(f"Streaming not available (config needs the whole document); parsing {json_path.name} in memory")
+        return json_parser.parse_json(json_path, config, writer, stats, record_stats, run_stats)
+    encoding = config.get("json_encoding", "utf-8")
 
-            # Stream records
-            for record_data in stream_json_records(json_path, config, selector):
-                row_count += 1
+    parser_obj = BaseParser(json_path, config, writer, stats, record_stats, run_stats)
 
-                try:
-                    row = {}
-
-                    # Extract fields
-                    for fld in record_config.get("fields", []):
-                        if fld.get("type") == "computed":
-                            row[fld["name"]] = None
-                            continue
-
-                        path = fld.get("path", "")
-                        if path:
-                            # Simple path extraction
-                            val = record_data.get(path) if isinstance(record_data, dict) else None
-                            row[fld["name"]] = cast_value(
-                                val,
-                                fld.get("type", "string"),
-                                parser_obj.safe_mode
-                            )
-                        else:
-                            row[fld["name"]] = None
-
-                    # Validate and write
-                    record_stats[record_name].total_rows += 1
-                    parser_obj.validate_and_write_row(
-                        record_name,
-                        row,
-                        columns,
-                        field_defs
-                    )
-
-                except Exception as e:
-                    parser_obj.handle_row_error(record_name, e)
-
-                # Log progress
-                if row_count % 10000 == 0:
-                    parser_obj.log_progress(record_name, row_count, row_count)
-
-            logger.info(f"Streaming parse complete: {row_count} records processed")
+    try:
+        columns_by_record = {record["name"]: parser_obj.get_columns(record) for record in config["records"]}
+        field_defs = {record["name"]: parser_obj.build_field_defs(record) for record in config["records"]}
+        validator = json_parser.load_element_validator(config, json_path)
+
+        for keys, records in groups.items():
+            selectors = json_parser.compile_json_selectors(records)
+            root_values = {record["name"]: {} for record in records}
+
+            def plan(batch, selectors=selectors, root_values=root_values):
+                for index, element in enumerate(batch, start=1):
+                    yield from json_parser.iter_json_element_rows(selectors, element, None, root_values, parser_obj,
+                                                                  field_defs, index, validator)
+
+            decode_plan = json_parser.json_decode_plan(config, records)
+            values = parser_obj.json_codec.iter_decoded(scan_json_file(json_path, list(keys), encoding, decode_plan),
+                                                        "scanner")
+            read = run_pipeline(iter_batches(values, get_batch_size(config)), plan, parser_obj,
+                                columns_by_record, "JSON")
+            if not read:
+                for record in records:
+                    logger.warning(f"No records found for '{record['name']}' with selector '{record.get('select', '')}'")
 
         parser_obj.finalize_stats()
         return (True, None)
@@ -434,52 +513,22 @@ def parse_json_streaming(
         return parser_obj.handle_file_error(e)
 
 
-# Convenience function to auto-select streaming or regular parsing
-def parse_file_auto_stream(
-    file_path: Path,
-    config: dict,
-    writer: Optional[CSVWriter],
-    stats: dict,
-    record_stats: Dict[str, ParsingStats],
-    size_threshold_mb: int = 500
-) -> Tuple[bool, Optional[str]]:
-    """Automatically choose streaming or regular parsing based on file size.
-    
-    Args:
-        file_path: Path to input file
-        config: Parser configuration
-        writer: CSV writer for output
-        stats: Statistics dictionary
-        record_stats: Per-record statistics
-        size_threshold_mb: File size threshold in MB for streaming mode
-        
+_STREAMING_PARSERS = {
+    "csv": parse_csv_streaming,
+    "fixed_width": parse_fixed_width_streaming,
+    "json": parse_json_streaming,
+    "xml": parse_xml_streaming,
+}
+
+
+def parse_file_streaming(file_path: Path, config: dict, writer: Optional[CSVWriter], stats: dict,
+                         record_stats: Dict[str, ParsingStats], run_stats: Optional[dict] = None) -> Tuple[bool, Optional[str]]:
+    """Parse a file with the streaming parser for ``config['format_type']``.
+
     Returns:
         Tuple[bool, Optional[str]]: (success, error_message)
     """
-    file_size_mb = file_path.stat().st_size / (1024 * 1024)
-    use_streaming = file_size_mb > size_threshold_mb
-
-    if use_streaming:
-        logger.info(f"File size {file_size_mb:.1f} MB exceeds threshold {size_threshold_mb} MB, using streaming mode")
-
-    format_type = config.get("format", "").lower()
-
-    if use_streaming:
-        if format_type == "csv":
-            return parse_csv_streaming(file_path, config, writer, stats, record_stats)
-        elif format_type == "xml":
-            return parse_xml_streaming(file_path, config, writer, stats, record_stats)
-        elif format_type == "json":
-            return parse_json_streaming(file_path, config, writer, stats, record_stats)
-
-    # Fall back to regular parsing
-    from multi_format_parser.parsers import parse_csv, parse_json, parse_xml
-
-    if format_type == "csv":
-        return parse_csv(file_path, config, writer, stats, record_stats)
-    elif format_type == "xml":
-        return parse_xml(file_path, config, writer, stats, record_stats)
-    elif format_type == "json":
-        return parse_json(file_path, config, writer, stats, record_stats)
-    else:
+    format_type = config.get("format_type", "").lower()
+    if format_type not in _STREAMING_PARSERS:
         raise ValueError(f"Unsupported format: {format_type}")
+    return _STREAMING_PARSERS[format_type](file_path, config, writer, stats, record_stats, run_stats)
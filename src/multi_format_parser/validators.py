@@ -6,6 +6,8 @@ import re
 from collections import Counter
 from typing import Any, List, Optional, Tuple
 
+from multi_format_parser.binary_fields import BINARY_TYPES
+from multi_format_parser.json_utils import split_wildcard_selector
 from multi_format_parser.models import FieldDef
 
 
@@ -65,6 +67,12 @@ def validate_config(config: dict) -> List[str]:
             if "name" in comp:
                 computed_field_names.add(comp["name"])
 
+        # Output columns per record, for from_record context references
+        record_fields = {
+            record.get("name"): {c.get("name") for c in record.get("context", []) + record.get("fields", [])}
+            for record in config["records"] if isinstance(record, dict)
+        }
+
         # Validate each record
         for idx, record in enumerate(config["records"]):
             record_name = record.get("name", f"<unnamed-{idx}>")
@@ -78,6 +86,23 @@ def validate_config(config: dict) -> List[str]:
             elif format_type == "json":
                 if "select" not in record or not record["select"]:
                     errors.append(f"Record '{record_name}': JSON records must have a non-empty 'select' field")
+                else:
+                    try:
+                        split_wildcard_selector(record["select"])
+                    except ValueError as e:
+                        errors.append(f"Record '{record_name}': {e}")
+
+            for ctx in record.get("context", []):
+                source = ctx.get("from_record")
+                if source is None:
+                    continue
+                ctx_name = ctx.get("name", "<unnamed>")
+                if format_type != "fixed_width":
+                    errors.append(f"Record '{record_name}', context '{ctx_name}': 'from_record' is only supported for fixed-width files")
+                elif source not in record_fields:
+                    errors.append(f"Record '{record_name}', context '{ctx_name}': from_record '{source}' is not a configured record")
+                elif ctx.get("field", ctx_name) not in record_fields[source]:
+                    errors.append(f"Record '{record_name}', context '{ctx_name}': record '{source}' has no field '{ctx.get('field', ctx_name)}'")
 
             if "fields" not in record:
                 errors.append(f"Record {idx}: missing 'fields' field")
@@ -144,6 +169,15 @@ def validate_config(config: dict) -> List[str]:
                                         except (ValueError, TypeError):
                                             errors.append(f"Record '{record_name}', field '{field_name}': CSV without headers requires 'path' to be an integer index, got '{path_val}'")
 
+                    if field_type in BINARY_TYPES and format_type != "fixed_width":
+                        errors.append(f"Record '{record_name}', field '{field_name}': type '{field_type}' is only supported for fixed-width files")
+                    elif field_type in ("comp3", "binary_int") and config.get("fixed_width_record_length") is None:
+                        errors.append(f"Record '{record_name}', field '{field_name}': type '{field_type}' needs 'fixed_width_record_length' (packed and binary values may contain line-break bytes)")
+                    if "scale" in fld and (not isinstance(fld["scale"], int) or fld["scale"] < 0):
+                        errors.append(f"Record '{record_name}', field '{field_name}': 'scale' must be a non-negative integer")
+                    if fld.get("byteorder", "big") not in ("big", "little"):
+                        errors.append(f"Record '{record_name}', field '{field_name}': 'byteorder' must be 'big' or 'little'")
+
                     if "regex" in fld and fld["regex"]:
                         try:
                             re.compile(fld["regex"])
@@ -5,10 +5,11 @@ This module provides helper functions for working with XPath expressions
 in the multi-format parser, including XML to JSON conversion for variant fields.
 """
 
-import json
 import logging
 import re
-from typing import Any
+from typing import Any, Optional
+
+from multi_format_parser.json_codec import JsonCodec
 
 try:
     from lxml import etree
@@ -49,7 +50,8 @@ def normalize_xpath(expr: str) -> str:
 def xml_element_to_json(
     element: Any,
     clean_namespaces: bool = True,
-    force_list: bool = False
+    force_list: bool = False,
+    codec: Optional[JsonCodec] = None
 ) -> str:
     """Convert XML element(s) to JSON string for variant fields.
     
@@ -64,6 +66,7 @@ def xml_element_to_json(
         element: lxml Element, list of Elements, or None
         clean_namespaces: Remove @xmlns:* attributes from output (default: True)
         force_list: Always return array even for single element (default: False)
+        codec: JSON codec to encode with (default: the fastest installed)
         
     Returns:
         JSON string representation or None if element is None/empty
@@ -130,7 +133,7 @@ def xml_element_to_json(
 
     # Serialize to JSON
     try:
-        json_str = json.dumps(result, ensure_ascii=False)
+        json_str = (codec or JsonCodec()).dumps(result, ensure_ascii=False)
 
         # Check size and warn if large
         size = len(json_str)
@@ -0,0 +1,118 @@
+"""Tests for binary (mainframe) field decoding."""
+
+from decimal import Decimal
+
+import pytest
+
+from multi_format_parser.binary_fields import (
+    decode_binary_int,
+    decode_comp3,
+    decode_zoned,
+    make_column_decoder,
+    make_field_decoder,
+)
+
+
+@pytest.mark.parametrize("raw,scale,expected", [
+    (b"\x12\x34\x5c", 2, Decimal("123.45")),
+    (b"\x12\x34\x5d", 2, Decimal("-123.45")),
+    (b"\x00\x0f", 0, Decimal("0")),
+    (b"\x99\x9b", 1, Decimal("-99.9")),
+])
+def test_decode_comp3(raw, scale, expected):
+    """Test packed decimal digits, sign nibbles and implied scale."""
+    assert decode_comp3(raw, scale) == expected
+
+
+def test_decode_comp3_rejects_bad_nibbles():
+    """Test non-digit and missing sign nibbles are errors."""
+    with pytest.raises(ValueError):
+        decode_comp3(b"\x1a\x2c")
+    with pytest.raises(ValueError):
+        decode_comp3(b"\x12\x34")
+
+
+@pytest.mark.parametrize("raw,encoding,expected", [
+    (b"\xf0\xf1\xf2\xc5", "cp037", Decimal("1.25")),    # EBCDIC, positive zone
+    (b"\xf0\xf1\xf2\xd5", "cp037", Decimal("-1.25")),   # EBCDIC, negative zone
+    (b"0012E", "latin-1", Decimal("1.25")),            # ASCII overpunch
+    (b"0012}", "latin-1", Decimal("-1.20")),
+    (b"-0125", "latin-1", Decimal("-1.25")),
+])
+def test_decode_zoned(raw, encoding, expected):
+    """Test zoned decimals with overpunched and explicit signs."""
+    assert decode_zoned(raw.decode(encoding), 2) == expected
+
+
+def test_decode_binary_int():
+    """Test signedness, byte order and scale of binary integers."""
+    assert decode_binary_int(b"\xff\xfe") == -2
+    assert decode_binary_int(b"\xff\xfe", signed=False) == 65534
+    assert decode_binary_int(b"\x01\x00", byteorder="little") == 1
+    assert decode_binary_int(b"\x00\x00\x30\x39", scale=2) == Decimal("123.45")
+
+
+def test_field_decoder_blank_and_errors():
+    """Test blank fields are None and invalid data follows the cast mode."""
+    comp3 = {"type": "comp3", "scale": 2}
+    assert make_field_decoder(comp3, "cp037")(b"\x40\x40\x40") is None
+    assert make_field_decoder(comp3, "cp037")(b"\x00\x00\x00") is None
+    assert make_field_decoder(comp3, "cp037")(b"\x12\x34") is None
+    with pytest.raises(ValueError, match="comp3"):
+        make_field_decoder(comp3, "cp037", safe_mode=False)(b"\x12\x34")
+    assert make_field_decoder({"type": "binary_int"}, "cp037")(b"\x00\x00") == 0
+
+
+def _column_slices(field_type, width, encoding):
+    """Raw slices covering valid, blank, low-value, explicitly signed and invalid data."""
+    if field_type == "comp3":
+        digits = "9" * (2 * width - 1)
+        slices = [bytes.fromhex(f"{n:0{2 * width - 1}d}{sign}") for n in (0, 5, 1234, int(digits))
+                  for sign in "abcdef"] + [b"\x1a" * width, b"\x12" * width]
+    elif field_type == "zoned":
+        slices = [f"{n:0{width}d}".encode(encoding) for n in (0, 7, 10 ** width - 1)]
+        slices += [(f"{n:0{width - 1}d}" + over).encode(encoding) for n in (0, 12) for over in "{A}Rpy"]
+        slices += [("-" + "1" * (width - 1)).encode(encoding), ("1" * (width - 1) + "+").encode(encoding),
+                   (" " + "2" * (width - 1)).encode(encoding), ("x" * width).encode(encoding)]
+    else:
+        slices = [n.to_bytes(width, "big", signed=True) for n in (0, 1, -1, 2 ** (8 * width - 1) - 1)]
+        slices += [b"\xff" * width, b"\x80" + b"\x00" * (width - 1)]
+    slices += [" ".encode(encoding) * width, b"\x00" * width]
+    return [raw for raw in slices if len(raw) == width]
+
+
+@pytest.mark.parametrize("fld", [
+    {"type": "comp3", "scale": 2, "width": 3},
+    {"type": "comp3", "width": 9},
+    {"type": "comp3", "width": 10},                       # Too wide for int64: per value
+    {"type": "zoned", "scale": 1, "width": 5},
+    {"type": "zoned", "width": 1},
+    {"type": "zoned", "width": 18},
+    {"type": "zoned", "width": 19, "encoding": "latin-1"},
+    {"type": "binary_int", "width": 2},
+    {"type": "binary_int", "width": 3, "byteorder": "little", "scale": 2},
+    {"type": "binary_int", "width": 8, "signed": False},
+    {"type": "binary_int", "width": 9},
+])
+@pytest.mark.parametrize("safe_mode", [True, False])
+def test_column_decoder_matches_field_decoder(fld, safe_mode):
+    """Test NumPy column decoding gives the per-value decoder's values and errors."""
+    np = pytest.importorskip("numpy")
+    encoding = fld.get("encoding", "cp037")
+    decode_field = make_field_decoder(fld, "cp037", safe_mode)
+    decode_column = make_column_decoder(fld, "cp037", decode_field)
+    slices = _column_slices(fld["type"], fld["width"], encoding)
+
+    errors = {}
+    values = decode_column(np.frombuffer(b"".join(slices), np.uint8).reshape(len(slices), fld["width"]), errors)
+
+    expected, expected_errors = [], {}
+    for i, raw in enumerate(slices):
+        try:
+            expected.append(decode_field(raw))
+        except ValueError as e:
+            expected_errors[i] = str(e)
+            expected.append(None)
+    assert [(type(v), str(v)) for v in values] == [(type(v), str(v)) for v in expected]
+    assert {i: str(e) for i, e in errors.items()} == expected_errors
+    assert bool(expected_errors) == (not safe_mode and fld["type"] != "binary_int")
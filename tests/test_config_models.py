@@ -69,6 +69,16 @@ class TestConfigValidation:
         errors = str(exc_info.value)
         assert "select" in errors.lower()
 
+    @pytest.mark.parametrize("select", ["$.messages[?(@.type == 'Sale']", "$[?(@.type = 'Sale')]"])
+    def test_json_invalid_filter(self, select):
+        """Test that malformed JSON filter selectors are rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            ParserConfig.from_dict({
+                "format_type": "json",
+                "records": [{"name": "test", "select": select, "fields": [{"name": "field1", "path": "id"}]}]
+            })
+        assert "filter" in str(exc_info.value).lower()
+
     def test_valid_csv_config(self):
         """Test that valid CSV config validates successfully."""
         config = ParserConfig.from_dict({
@@ -139,3 +139,322 @@ another@valid.com,15
     assert record_stats["Users"].total_rows == 3
     assert record_stats["Users"].success_rows == 1
     assert record_stats["Users"].failed_rows == 2
+
+
+def test_csv_parser_projection_with_quoted_lines(tmp_path, temp_output_dir):
+    """Test projected columns from a wide file mixing plain and quoted lines."""
+    header = ",".join(f"c{i}" for i in range(20))
+    plain = ",".join(f"v{i}" for i in range(20))
+    quoted = 'q0,"multi\nline, value",q2,' + ",".join(f"q{i}" for i in range(3, 20))
+    blank = "," * 19
+    csv_file = tmp_path / "wide.csv"
+    csv_file.write_text("\n".join([header, plain, quoted, blank, plain]) + "\n")
+
+    import json
+    config = {
+        "format_type": "csv",
+        "records": [{
+            "name": "Wide",
+            "fields": [
+                {"name": "First", "path": "c0", "type": "string"},
+                {"name": "Second", "path": "c1", "type": "string"},
+                {"name": "Third", "path": "c2", "type": "string"}
+            ]
+        }]
+    }
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(config))
+
+    stats, record_stats, file_errors = parse_files(config_file, [csv_file], temp_output_dir)
+
+    assert len(file_errors) == 0
+    assert record_stats["Wide"].total_rows == 3
+
+    with open(temp_output_dir / "Wide.csv", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["First"] for r in rows] == ["v0", "q0", "v0"]
+    assert rows[1]["Second"] == "multi\nline, value"
+    assert rows[1]["Third"] == "q2"
+    assert rows[2]["Third"] == "v2"
+
+
+def _write_routing_config(tmp_path, fan_out=False):
+    import json
+    config = {
+        "format_type": "csv",
+        "csv_has_header": False,
+        "csv_fan_out": fan_out,
+        "records": [
+            {
+                "name": "Header",
+                "record_type_field": "Type",
+                "record_type_value": "H",
+                "fields": [
+                    {"name": "Type", "path": "0", "type": "string"},
+                    {"name": "BatchId", "path": "1", "type": "string"}
+                ]
+            },
+            {
+                "name": "Detail",
+                "record_type_field": "Type",
+                "record_type_value": "D",
+                "fields": [
+                    {"name": "Type", "path": "0", "type": "string"},
+                    {"name": "Amount", "path": "2", "type": "decimal"}
+                ]
+            },
+            {
+                "name": "Trailer",
+                "record_type_field": "0",
+                "record_type_value": "T",
+                "fields": [{"name": "Count", "path": "1", "type": "int"}]
+            },
+            {
+                "name": "AllRows",
+                "fields": [{"name": "Type", "path": "0", "type": "string"}]
+            }
+        ]
+    }
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(config))
+    return config_file
+
+
+def test_csv_parser_record_type_routing(tmp_path, temp_output_dir):
+    """Test header/detail/trailer rows routed by discriminator column."""
+    csv_file = tmp_path / "batch.csv"
+    csv_file.write_text("H,B1,\nD,x,1.50\nD,y,2.25\nX,z,9\nT,2,\n")
+    config_file = _write_routing_config(tmp_path)
+
+    stats, record_stats, file_errors = parse_files(config_file, [csv_file], temp_output_dir)
+
+    assert len(file_errors) == 0
+    assert record_stats["Header"].total_rows == 1
+    assert record_stats["Detail"].total_rows == 2
+    assert record_stats["Trailer"].total_rows == 1
+    # Unknown types fall through to the record without a discriminator
+    assert record_stats["AllRows"].total_rows == 1
+    assert stats["unmatched_rows"] == 0
+
+    with open(temp_output_dir / "Detail.csv", newline="") as f:
+        assert [r["Amount"] for r in csv.DictReader(f)] == ["1.50", "2.25"]
+
+
+def test_csv_parser_record_type_fan_out(tmp_path, temp_output_dir):
+    """Test csv_fan_out emits rows into every matching record."""
+    csv_file = tmp_path / "batch.csv"
+    csv_file.write_text("H,B1,\nD,x,1.50\nT,1,\n")
+    config_file = _write_routing_config(tmp_path, fan_out=True)
+
+    stats, record_stats, file_errors = parse_files(config_file, [csv_file], temp_output_dir)
+
+    assert len(file_errors) == 0
+    assert record_stats["Header"].total_rows == 1
+    assert record_stats["Detail"].total_rows == 1
+    assert record_stats["Trailer"].total_rows == 1
+    assert record_stats["AllRows"].total_rows == 3
+
+
+def test_csv_parser_parallel_matches_sequential(tmp_path):
+    """Test parallel byte-range parsing produces the same output as in-process parsing."""
+    import json
+    lines = ["id,name,amount"]
+    for i in range(200):
+        if i % 7 == 0:
+            lines.append(f'{i},"name, with\nnewline {i}",{i}.5')
+        elif i % 11 == 0:
+            lines.append(f"{i},bad,not-a-number")
+        else:
+            lines.append(f"{i},name{i},{i}.25")
+    csv_file = tmp_path / "big.csv"
+    csv_file.write_text("\n".join(lines) + "\n")
+
+    config = {
+        "format_type": "csv",
+        "continueOnError": True,
+        "normalization": {"cast_mode": "strict"},
+        "records": [{
+            "name": "Rows",
+            "fields": [
+                {"name": "Id", "path": "id", "type": "int"},
+                {"name": "Name", "path": "name", "type": "string"},
+                {"name": "Amount", "path": "amount", "type": "decimal"}
+            ]
+        }]
+    }
+
+    outputs = {}
+    for workers in (1, 2):
+        config_file = tmp_path / f"config_{workers}.json"
+        config_file.write_text(json.dumps({**config, "parallel_workers": workers, "parallel_chunk_bytes": 256}))
+        out_dir = tmp_path / f"out_{workers}"
+        stats, record_stats, file_errors = parse_files(config_file, [csv_file], out_dir)
+        assert len(file_errors) == 0
+        outputs[workers] = ((out_dir / "Rows.csv").read_text(), record_stats["Rows"])
+
+    assert outputs[2][0] == outputs[1][0]
+    assert outputs[2][1].success_rows == outputs[1][1].success_rows == 184
+    assert outputs[2][1].skipped_rows == outputs[1][1].skipped_rows == 16
+
+
+@pytest.mark.parametrize("content,options", [
+    ('id,name,amount\n1,"multi\nline, name",1.50\n\n,,\n2, padded ,2\n', {}),
+    ("# comment\nid;name;amount\n1;a\\;b;3\n2;c;4\n", {"csv_delimiter": ";", "csv_escapechar": "\\", "csv_skip_rows": 1}),
+    ("1,a,1\n2,b\n3,c,3\n", {"csv_has_header": False}),  # ragged rows: Arrow falls back
+    ("\n1,a,1\n2,b,2\n3,c,3\n", {"csv_has_header": False}),  # blank first line
+    ("id,name,amount,note\n1,a,1,\n,,,kept\n, , ,\n2,b,2,x\n", {}),  # only an unreferenced column set
+])
+def test_csv_parser_arrow_engine_matches_stdlib(tmp_path, content, options):
+    """Test the Arrow engine writes the same output as the stdlib reader."""
+    pytest.importorskip("pyarrow")
+    import json
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text(content)
+
+    has_header = options.get("csv_has_header", True)
+    paths = ["id", "name", "amount"] if has_header else ["0", "1", "2"]
+    config = {
+        "format_type": "csv",
+        **options,
+        "records": [{
+            "name": "Rows",
+            "fields": [
+                {"name": "Id", "path": paths[0], "type": "int"},
+                {"name": "Name", "path": paths[1], "type": "string"},
+                {"name": "Amount", "path": paths[2], "type": "decimal"}
+            ]
+        }]
+    }
+
+    outputs = {}
+    for engine in ("python", "arrow"):
+        config_file = tmp_path / f"config_{engine}.json"
+        config_file.write_text(json.dumps({**config, "csv_engine": engine}))
+        out_dir = tmp_path / engine
+        stats, record_stats, file_errors = parse_files(config_file, [csv_file], out_dir)
+        assert len(file_errors) == 0
+        outputs[engine] = ((out_dir / "Rows.csv").read_text(), record_stats["Rows"].total_rows)
+
+    assert outputs["arrow"] == outputs["python"]
+    assert outputs["arrow"][1] > 0
+
+
+@pytest.mark.parametrize("cast_mode", ["safe", "strict"])
+@pytest.mark.parametrize("fan_out", [False, True])
+def test_csv_parser_arrow_engine_columnar_cast_matches_stdlib(tmp_path, caplog, cast_mode, fan_out):
+    """Test bulk casting and validation in the Arrow engine give the stdlib rows, stats and errors."""
+    pytest.importorskip("pyarrow")
+    import json
+    values = ["1", "-0", " 7 ", "+5", "1.9", "1e3", "1_000", "0x10", "x", "", "99999999999999999999", "inf",
+              "-2.50", ".5", "5.", "1E-2", "nan", "١٢"]
+    lines = ["kind,id,rate,amount,flag,name,extra"]
+    for i, value in enumerate(values * 3):
+        kind = "AB"[i % 2] if i % 5 else "C"
+        name = ["Anna", "bob", " ", "Zoë"][i % 4]
+        lines.append(f"{kind},{value},{values[-i % len(values)]},{value},{['yes', 'n', 'maybe'][i % 3]},{name},e{i}")
+    lines.insert(10, ",,,,,,")
+    lines.insert(20, ",,,,,,note only")
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    config = {
+        "format_type": "csv",
+        "continueOnError": True,
+        "csv_fan_out": fan_out,
+        "normalization": {"cast_mode": cast_mode},
+        "computed_fields": [{"name": "Label", "formula": "{Name}-{Id}"}],
+        "records": [
+            {"name": "A", "record_type_field": "Kind", "record_type_value": "A",
+             "context": [{"name": "Source", "value": "pos"}, {"name": "Extra", "from": "extra"}],
+             "fields": [{"name": "Kind", "path": "kind"},
+                        {"name": "Id", "path": "id", "type": "int", "nullable": False, "min_value": 0},
+                        {"name": "Rate", "path": "rate", "type": "float", "max_value": 100},
+                        {"name": "Label", "type": "computed", "computed_field": "Label", "regex": "[A-Za-z]+-.*"}]},
+            {"name": "Any",
+             "fields": [{"name": "Amount", "path": "amount", "type": "decimal", "min_value": -1, "max_value": 1000},
+                        {"name": "Flag", "path": "flag", "type": "boolean"},
+                        {"name": "Name", "path": "name", "nullable": False, "regex": "[A-Z].*"}]},
+            {"name": "B", "record_type_field": "kind", "record_type_value": "B",
+             "fields": [{"name": "Id", "path": "id", "type": "float", "min_value": 0.5}]},
+        ]
+    }
+
+    results = {}
+    for engine in ("python", "arrow"):
+        config_file = tmp_path / f"config_{engine}.json"
+        config_file.write_text(json.dumps({**config, "csv_engine": engine}))
+        out_dir = tmp_path / engine
+        caplog.clear()
+        stats, record_stats, file_errors = parse_files(config_file, [csv_file], out_dir)
+        assert len(file_errors) == 0
+        outputs = {p.name: p.read_text(encoding="utf-8") for p in sorted(out_dir.glob("*.csv"))}
+        counts = {name: (s.total_rows, s.success_rows, s.failed_rows, s.skipped_rows, s.validation_errors)
+                  for name, s in record_stats.items()}
+        errors = [r.getMessage() for r in caplog.records if r.levelname == "ERROR"]
+        results[engine] = (outputs, counts, stats["unmatched_rows"], errors)
+
+    assert results["arrow"] == results["python"]
+    assert results["arrow"][1]["A"][2] > 0 and results["arrow"][1]["Any"][2] > 0
+
+
+def test_csv_writer_writes_value_sequences(tmp_path):
+    """Test CSVWriter writes rows in column order, formats decimals and checks each table's schema."""
+    from decimal import Decimal
+
+    from multi_format_parser.csv_writer import CSVWriter
+
+    columns = ["Id", "Amount", "Note"]
+    with CSVWriter(tmp_path, flush_every=2, buffer_size=64) as writer:
+        writer.write_row("Orders", {"Note": "a, \"b\"", "Id": 1, "Amount": Decimal("1E+2")}, columns)
+        writer.write_values("Orders", [2, None, "x"], list(columns))  # Equal columns in another list
+        writer.write_rejected_row("Orders", {"Id": 3, "Amount": Decimal("-0.50")}, "bad amount", columns)
+        with pytest.raises(RuntimeError, match="Schema mismatch for table 'Orders'"):
+            writer.write_row("Orders", {}, ["Id"])
+        assert writer.get_row_count("Orders") == 2
+    with pytest.raises(RuntimeError, match="closed"):
+        writer.write_row("Orders", {}, columns)
+
+    with open(tmp_path / "Orders.csv", newline="", encoding="utf-8") as f:
+        assert list(csv.reader(f)) == [columns, ["1", "100", 'a, "b"'], ["2", "", "x"]]
+    with open(tmp_path / "Orders_rejected.csv", newline="", encoding="utf-8") as f:
+        assert list(csv.reader(f)) == [columns + ["_error_reason"], ["3", "-0.50", "", "bad amount"]]
+
+
+def test_async_csv_writer_orders_rows_and_raises_errors(tmp_path):
+    """Test output.async_writer writes the same files and surfaces writer thread errors."""
+    import json
+
+    from multi_format_parser.csv_writer import AsyncCSVWriter
+
+    rows = "".join(f"{i},{'bad' if i % 7 == 0 else i * 2}\n" for i in range(1, 501))
+    (tmp_path / "data.csv").write_text("id,qty\n" + rows)
+    for async_writer in (False, True):
+        config = {"format_type": "csv", "csv_has_header": True,
+                  "output": {"async_writer": async_writer, "flush_every": 3},
+                  "records": [{"name": "Items", "fields": [{"name": "Id", "path": "id", "type": "int"},
+                                                           {"name": "Qty", "path": "qty", "type": "int",
+                                                            "nullable": False}]}]}
+        (tmp_path / "config.json").write_text(json.dumps(config))
+        stats, record_stats, file_errors = parse_files(tmp_path / "config.json", [tmp_path / "data.csv"],
+                                                       tmp_path / str(async_writer))
+        assert file_errors == {}
+    for name in ("Items.csv", "Items_rejected.csv"):
+        assert (tmp_path / "True" / name).read_text() == (tmp_path / "False" / name).read_text()
+
+    # Small batches and queue: writes wait for the thread, tables keep their order
+    with AsyncCSVWriter(tmp_path / "small", batch_rows=2, queue_batches=1) as writer:
+        for i in range(50):
+            writer.write_row("A" if i % 3 else "B", {"n": i}, ["n"])
+    assert (tmp_path / "small" / "A.csv").read_text().split() == ["n"] + [str(i) for i in range(50) if i % 3]
+    assert (tmp_path / "small" / "B.csv").read_text().split() == ["n"] + [str(i) for i in range(0, 50, 3)]
+
+    (tmp_path / "broken" / "A.csv").mkdir(parents=True)  # The thread cannot open the table's file
+    writer = AsyncCSVWriter(tmp_path / "broken", batch_rows=1)
+    writer.write_row("A", {"n": 1}, ["n"])
+    with pytest.raises(RuntimeError, match="CSV writer thread failed") as excinfo:
+        writer.drain()
+    assert isinstance(excinfo.value.__cause__, IsADirectoryError)
+    with pytest.raises(RuntimeError, match="CSV writer thread failed"):
+        writer.write_row("A", {"n": 2}, ["n"])
+    with pytest.raises(RuntimeError, match="CSV writer thread failed"):
+        writer.close()
@@ -95,3 +95,481 @@ DEF   67890  PQR
     assert len(file_errors) == 0
     assert record_stats["Records"].total_rows == 2
     assert record_stats["Records"].success_rows == 2
+
+
+def test_fixed_width_record_type_dispatch(tmp_path, temp_output_dir):
+    """Test lines route by record type slice and unmatched lines are counted."""
+    content = "H19991231\nD0001Alice\nXjunk\nT  2\nD0002Bob\n99\n"
+    fw_file = tmp_path / "typed.txt"
+    fw_file.write_text(content)
+
+    config = {
+        "format_type": "fixed_width",
+        "records": [
+            {"name": "Header", "record_type_field": "Type", "record_type_value": "H",
+             "fields": [{"name": "Type", "start": 0, "width": 1},
+                        {"name": "Date", "start": 1, "width": 8}]},
+            {"name": "Detail", "record_type_field": "Type", "record_type_value": "D",
+             "fields": [{"name": "Type", "start": 0, "width": 1},
+                        {"name": "Id", "start": 1, "width": 4, "type": "int"},
+                        {"name": "Name", "start": 5, "width": 5}]},
+            {"name": "Trailer", "record_type_field": "Code", "record_type_value": "2",
+             "fields": [{"name": "Code", "start": 3, "width": 1},
+                        {"name": "Type", "start": 0, "width": 1}]}
+        ]
+    }
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(config))
+
+    stats, record_stats, file_errors = parse_files(config_file, [fw_file], temp_output_dir)
+
+    assert len(file_errors) == 0
+    assert record_stats["Header"].success_rows == 1
+    assert record_stats["Detail"].success_rows == 2
+    assert record_stats["Trailer"].success_rows == 1
+    # "Xjunk" and "99" match no record type ("99" is too short for the Code slice)
+    assert stats["unmatched_rows"] == 2
+
+    with open(temp_output_dir / "Detail.csv") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["Name"] for row in rows] == ["Alice", "Bob"]
+
+
+def test_fixed_width_unmatched_count_apart_from_record_counts(tmp_path, temp_output_dir):
+    """Test a record named like a run counter does not add to that counter."""
+    fw_file = tmp_path / "typed.txt"
+    fw_file.write_text("U1\nX2\nU3\n")
+    config = {
+        "format_type": "fixed_width",
+        "records": [{"name": "unmatched_rows", "record_type_field": "Type", "record_type_value": "U",
+                     "fields": [{"name": "Type", "start": 0, "width": 1},
+                                {"name": "Id", "start": 1, "width": 1, "type": "int"}]}]
+    }
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(config))
+
+    stats, record_stats, file_errors = parse_files(config_file, [fw_file], temp_output_dir)
+
+    assert record_stats["unmatched_rows"].success_rows == 2
+    assert stats["unmatched_rows"] == 1
+
+
+def test_fixed_width_bytes_engine_matches_line_engine(tmp_path):
+    """Test the bytes engine produces the same output as text lines, short lines included."""
+    content = ("H19991231\r\n"
+               "D0001Ælfrida 12.50\n"
+               "D0002Bob\xa0\xa0\xa0   x\n"    # Non-breaking spaces strip like str.strip()
+               "D0003Eve\n"                    # Short line: clamped and missing fields
+               "\xa0\n"                        # Blank after decoding
+               "Zjunk\n")
+    fw_file = tmp_path / "latin1.txt"
+    fw_file.write_bytes(content.encode("latin-1"))
+
+    config = {
+        "format_type": "fixed_width",
+        "fixed_width_encoding": "latin-1",
+        "computed_fields": [{"name": "Label", "formula": "{Id}-{Name}"}],
+        "records": [
+            {"name": "Header", "record_type_field": "Type", "record_type_value": "H",
+             "fields": [{"name": "Type", "start": 0, "width": 1},
+                        {"name": "Date", "start": 1, "width": 8}]},
+            {"name": "Detail", "record_type_field": "Type", "record_type_value": "D",
+             "context": [{"name": "Source", "value": "pos"},
+                         {"name": "Kind", "from": "Type"}],
+             "fields": [{"name": "Type", "start": 0, "width": 1},
+                        {"name": "Id", "start": 1, "width": 4, "type": "int"},
+                        {"name": "Name", "start": 5, "width": 8, "nullable": False},
+                        {"name": "Amount", "start": 13, "width": 6, "type": "decimal"},
+                        {"name": "Label", "type": "computed", "computed_field": "Label"}]}
+        ]
+    }
+
+    outputs = {}
+    for engine in ("line", "bytes"):
+        config_file = tmp_path / f"config_{engine}.json"
+        config_file.write_text(json.dumps({**config, "fixed_width_engine": engine}))
+        out_dir = tmp_path / engine
+        stats, record_stats, file_errors = parse_files(config_file, [fw_file], out_dir)
+        assert len(file_errors) == 0
+        assert stats["unmatched_rows"] == 1
+        outputs[engine] = {p.name: p.read_bytes() for p in sorted(out_dir.glob("*.csv"))}
+
+    assert outputs["bytes"] == outputs["line"]
+    detail = outputs["bytes"]["Detail.csv"].decode("utf-8")
+    assert "pos,D,D,1,Ælfrida,12.50,1-Ælfrida" in detail
+    assert "pos,D,D,3,Eve,,3-Eve" in detail
+
+
+@pytest.mark.parametrize("engine", ["line", "bytes"])
+def test_fixed_width_parallel_matches_sequential(tmp_path, engine, caplog):
+    """Test parallel byte ranges give the same output, stats and line numbers."""
+    lines = ["SKIPPED HEADER"]
+    for i in range(1, 201):
+        if i % 50 == 0:
+            lines.append("")
+        elif i % 13 == 0:
+            lines.append(f"D{i:04d}{'BAD':>6}")  # Not an int: rejected in strict mode
+        elif i % 17 == 0:
+            lines.append(f"X{i:04d}")  # Unmatched type
+        else:
+            lines.append(f"D{i:04d}{i * 3:>6}")
+    fw_file = tmp_path / "big.txt"
+    fw_file.write_text("\r\n".join(lines) + "\r\n", encoding="latin-1")
+
+    config = {
+        "format_type": "fixed_width",
+        "fixed_width_encoding": "latin-1",
+        "fixed_width_skip_rows": 1,
+        "fixed_width_engine": engine,
+        "parallel_chunk_bytes": 256,
+        "continueOnError": True,
+        "normalization": {"cast_mode": "strict"},
+        "records": [{
+            "name": "Detail", "record_type_field": "Type", "record_type_value": "D",
+            "fields": [{"name": "Type", "start": 0, "width": 1},
+                       {"name": "Id", "start": 1, "width": 4, "type": "int"},
+                       {"name": "Amount", "start": 5, "width": 6, "type": "int"}]
+        }]
+    }
+
+    results = {}
+    for workers in (1, 2):
+        config_file = tmp_path / f"config_{workers}.json"
+        config_file.write_text(json.dumps({**config, "parallel_workers": workers}))
+        out_dir = tmp_path / f"out_{workers}"
+        caplog.clear()
+        stats, record_stats, file_errors = parse_files(config_file, [fw_file], out_dir)
+        assert len(file_errors) == 0
+        errors = sorted(r.getMessage() for r in caplog.records if r.levelname == "ERROR")
+        outputs = {p.name: p.read_text() for p in sorted(out_dir.glob("*.csv"))}
+        results[workers] = (outputs, stats["unmatched_rows"], record_stats["Detail"].success_rows,
+                            record_stats["Detail"].skipped_rows, errors)
+
+    assert results[2] == results[1]
+    assert results[2][1] == 11
+    assert results[2][3] == 15
+    # Line numbers count from the first line after the skipped rows
+    assert any("at row 13:" in message for message in results[2][4])
+
+
+@pytest.mark.parametrize("engine", ["line", "bytes"])
+def test_fixed_width_record_length(tmp_path, engine):
+    """Test files of fixed-length records without line terminators."""
+    records = ["H19991231 ", "D0001Alice", "          ", "D0002Bob  ", "X0003Junk ", "D0003Eve  "]
+    fw_file = tmp_path / "mainframe.dat"
+    fw_file.write_bytes(("SKIPREC000" + "".join(records) + "D0004").encode("latin-1"))
+
+    config = {
+        "format_type": "fixed_width",
+        "fixed_width_encoding": "latin-1",
+        "fixed_width_engine": engine,
+        "fixed_width_record_length": 10,
+        "fixed_width_skip_rows": 1,
+        "records": [
+            {"name": "Header", "record_type_field": "Type", "record_type_value": "H",
+             "fields": [{"name": "Type", "start": 0, "width": 1},
+                        {"name": "Date", "start": 1, "width": 8}]},
+            {"name": "Detail", "record_type_field": "Type", "record_type_value": "D",
+             "fields": [{"name": "Type", "start": 0, "width": 1},
+                        {"name": "Id", "start": 1, "width": 4, "type": "int"},
+                        {"name": "Name", "start": 5, "width": 5}]}
+        ]
+    }
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(config))
+
+    for workers in (1, 2):
+        config_file.write_text(json.dumps({**config, "parallel_workers": workers, "parallel_chunk_bytes": 25}))
+        out_dir = tmp_path / f"out_{workers}"
+        stats, record_stats, file_errors = parse_files(config_file, [fw_file], out_dir)
+
+        assert len(file_errors) == 0
+        assert record_stats["Header"].success_rows == 1
+        assert stats["unmatched_rows"] == 1
+        with open(out_dir / "Detail.csv") as f:
+            rows = list(csv.DictReader(f))
+        # The truncated trailing record is kept with its missing field empty
+        assert [(row["Id"], row["Name"]) for row in rows] == [
+            ("1", "Alice"), ("2", "Bob"), ("3", "Eve"), ("4", "")]
+
+
+def test_fixed_width_ebcdic_binary_fields(tmp_path, temp_output_dir):
+    """Test cp037 records with packed, zoned and binary fields decoded in place."""
+    def record(store, amount, qty, count, note):
+        return (store.encode("cp037") + amount + qty.encode("cp037") + count + note.encode("latin-1"))
+
+    content = (record("S01", b"\x00\x12\x34\x5c", "0010J", b"\x00\x03", "café ")
+               + record("S02", b"\x00\x00\x05\x0d", "0002}", b"\xff\xff", "n/a  ")
+               + record("S03", b"\x40\x40\x40\x40", "00000", b"\x00\x00", "     "))
+    fw_file = tmp_path / "tlog.dat"
+    fw_file.write_bytes(content)
+
+    config = {
+        "format_type": "fixed_width",
+        "fixed_width_encoding": "cp037",
+        "fixed_width_record_length": 19,
+        "records": [{
+            "name": "Sales",
+            "fields": [
+                {"name": "Store", "start": 0, "width": 3},
+                {"name": "Amount", "start": 3, "width": 4, "type": "comp3", "scale": 2},
+                {"name": "Qty", "start": 7, "width": 5, "type": "zoned", "scale": 1},
+                {"name": "Count", "start": 12, "width": 2, "type": "binary_int"},
+                {"name": "Note", "start": 14, "width": 5, "encoding": "latin-1"}
+            ]
+        }]
+    }
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(config))
+
+    stats, record_stats, file_errors = parse_files(config_file, [fw_file], temp_output_dir)
+
+    assert len(file_errors) == 0
+    assert record_stats["Sales"].success_rows == 3
+    with open(temp_output_dir / "Sales.csv", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [(r["Store"], r["Amount"], r["Qty"], r["Count"], r["Note"]) for r in rows] == [
+        ("S01", "123.45", "-10.1", "3", "café"),
+        ("S02", "-0.50", "-2.0", "-1", "n/a"),
+        ("S03", "", "0.0", "0", ""),
+    ]
+
+
+def test_fixed_width_binary_fields_need_single_byte_encoding(tmp_path, temp_output_dir):
+    """Test binary fields are refused when the file cannot be read as bytes."""
+    fw_file = tmp_path / "input.txt"
+    fw_file.write_text("001")
+    config = {
+        "format_type": "fixed_width",
+        "fixed_width_record_length": 3,
+        "records": [{"name": "R", "fields": [{"name": "Amount", "start": 0, "width": 3, "type": "comp3"}]}]
+    }
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(config))
+
+    stats, record_stats, file_errors = parse_files(config_file, [fw_file], temp_output_dir)
+
+    assert "single-byte encoding" in file_errors[str(fw_file)]
+
+
+def test_fixed_width_record_length_needs_single_byte_encoding(tmp_path, temp_output_dir):
+    """Test fixed-length records are refused for a multibyte encoding."""
+    fw_file = tmp_path / "input.dat"
+    fw_file.write_bytes("abcé12".encode("utf-8"))  # "é" straddles the first two 4-byte records
+    config = {
+        "format_type": "fixed_width",
+        "fixed_width_encoding": "utf-8",
+        "fixed_width_record_length": 4,
+        "records": [{"name": "R", "fields": [{"name": "Text", "start": 0, "width": 4}]}]
+    }
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(config))
+
+    stats, record_stats, file_errors = parse_files(config_file, [fw_file], temp_output_dir)
+
+    assert "needs a single-byte encoding, not 'utf-8'" in file_errors[str(fw_file)]
+
+
+def test_fixed_width_packed_fields_need_record_length(tmp_path, temp_output_dir):
+    """Test packed values ending in line-break bytes survive and truncated ones fail."""
+    # -0.10 packs to 01 0D: as the last bytes of a line the 0D would pass for a CR
+    fw_file = tmp_path / "tlog.dat"
+    fw_file.write_bytes("A1".encode("cp037") + b"\x01\x0d")
+    config = {
+        "format_type": "fixed_width",
+        "fixed_width_encoding": "cp037",
+        "normalization": {"cast_mode": "strict"},
+        "records": [{"name": "R", "fields": [
+            {"name": "Id", "start": 0, "width": 2},
+            {"name": "Amount", "start": 2, "width": 2, "type": "comp3", "scale": 2}]}]
+    }
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(config))
+    with pytest.raises(ValueError, match="Configuration validation failed"):
+        parse_files(config_file, [fw_file], temp_output_dir)
+
+    config["fixed_width_record_length"] = 4
+    config_file.write_text(json.dumps(config))
+    stats, record_stats, file_errors = parse_files(config_file, [fw_file], temp_output_dir)
+
+    assert len(file_errors) == 0
+    with open(temp_output_dir / "R.csv", encoding="utf-8") as f:
+        assert [(r["Id"], r["Amount"]) for r in csv.DictReader(f)] == [("A1", "-0.10")]
+
+    truncated = tmp_path / "truncated.dat"
+    truncated.write_bytes(fw_file.read_bytes() + "A2".encode("cp037") + b"\x01")
+    stats, record_stats, file_errors = parse_files(config_file, [truncated], tmp_path / "out")
+
+    assert "binary field 'Amount' truncated" in file_errors[str(truncated)]
+
+
+@pytest.mark.parametrize("mode", [{}, {"fixed_width_engine": "bytes", "fixed_width_encoding": "latin-1"},
+                                  {"streaming": True, "streaming_batch_size": 2}])
+def test_fixed_width_from_record_context(tmp_path, mode):
+    """Test detail and trailer lines carry values of the latest header line."""
+    content = ("D0000orphan\n"
+               "HS01R1T001\n"
+               "D0001apple\n"
+               "D0002pear\n"
+               "T0002\n"
+               "HS02R4T002\n"
+               "D0003plum\n")
+    fw_file = tmp_path / "tlog.txt"
+    fw_file.write_text(content)
+
+    header_context = [{"name": "StoreID", "from_record": "Header"},
+                      {"name": "Txn", "from_record": "Header", "field": "TransactionNumber"}]
+    config = {
+        "format_type": "fixed_width",
+        "parallel_workers": 2,
+        "parallel_chunk_bytes": 16,
+        "computed_fields": [{"name": "Key", "formula": "{StoreID}-{Txn}-{Line}"}],
+        "records": [
+            {"name": "Header", "record_type_field": "Type", "record_type_value": "H",
+             "fields": [{"name": "Type", "start": 0, "width": 1},
+                        {"name": "StoreID", "start": 1, "width": 3},
+                        {"name": "Register", "start": 4, "width": 2},
+                        {"name": "TransactionNumber", "start": 6, "width": 4}]},
+            {"name": "Detail", "record_type_field": "Type", "record_type_value": "D",
+             "context": header_context,
+             "fields": [{"name": "Type", "start": 0, "width": 1},
+                        {"name": "Line", "start": 1, "width": 4, "type": "int"},
+                        {"name": "Item", "start": 5, "width": 6},
+                        {"name": "Key", "type": "computed", "computed_field": "Key"}]},
+            {"name": "Trailer", "record_type_field": "Type", "record_type_value": "T",
+             "context": header_context,
+             "fields": [{"name": "Type", "start": 0, "width": 1},
+                        {"name": "Count", "start": 1, "width": 4, "type": "int"}]}
+        ]
+    }
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({**config, **mode}))
+    out_dir = tmp_path / "out"
+
+    stats, record_stats, file_errors = parse_files(config_file, [fw_file], out_dir)
+
+    assert len(file_errors) == 0
+    with open(out_dir / "Detail.csv") as f:
+        details = [(r["StoreID"], r["Txn"], r["Item"], r["Key"]) for r in csv.DictReader(f)]
+    assert details == [
+        ("", "", "orphan", "--0"),
+        ("S01", "T001", "apple", "S01-T001-1"),
+        ("S01", "T001", "pear", "S01-T001-2"),
+        ("S02", "T002", "plum", "S02-T002-3"),
+    ]
+    with open(out_dir / "Trailer.csv") as f:
+        assert [(r["StoreID"], r["Txn"], r["Count"]) for r in csv.DictReader(f)] == [("S01", "T001", "2")]
+
+
+def _numpy_config(**overrides):
+    config = {
+        "format_type": "fixed_width",
+        "fixed_width_encoding": "latin-1",
+        "continueOnError": True,
+        "computed_fields": [{"name": "Label", "formula": "{Id}:{Name}"}],
+        "records": [{
+            "name": "Detail", "record_type_field": "Type", "record_type_value": "D",
+            "context": [{"name": "Source", "value": "pos"}, {"name": "Kind", "from": "Type"}],
+            "fields": [{"name": "Type", "start": 0, "width": 1},
+                       {"name": "Id", "start": 1, "width": 4, "type": "int", "nullable": False},
+                       {"name": "Name", "start": 5, "width": 6, "regex": "[A-Za-zé]*"},
+                       {"name": "Amount", "start": 11, "width": 7, "type": "decimal", "min_value": 0},
+                       {"name": "Rate", "start": 18, "width": 6, "type": "float", "max_value": 10},
+                       {"name": "Label", "type": "computed", "computed_field": "Label"}]
+        }]
+    }
+    config.update(overrides)
+    return config
+
+
+@pytest.mark.parametrize("cast_mode", ["safe", "strict"])
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+def test_fixed_width_numpy_engine_matches_line_engine(tmp_path, monkeypatch, cast_mode, newline, caplog):
+    """Test the NumPy engine gives the same output, stats and errors as the line engine."""
+    pytest.importorskip("numpy")
+    from multi_format_parser.parsers import fixed_width_parser
+    monkeypatch.setattr(fixed_width_parser, "NUMPY_BLOCK_ROWS", 4)
+
+    nbsp_name = "Ré\xa0"
+    lines = []
+    for i in range(1, 30):
+        if i % 9 == 0:
+            lines.append(" " * 24)                                    # Blank line
+        elif i % 7 == 0:
+            lines.append(f"X{i:04d}{'skip':<6}{'':>7}{'':>6}")       # Unmatched type
+        elif i % 5 == 0:
+            lines.append(f"D{'':>4}{'Bad 1':<6}{'-3.50':>7}{'11':>6}")  # Null id, regex, range
+        elif i % 4 == 0:
+            lines.append(f"D{i:04d}{nbsp_name:<6}{'x':>7}{'1e-2':>6}")  # NBSP, invalid decimal
+        else:
+            lines.append(f"D{i:04d}{'Item':<6}{i * 1.25:>7.2f}{i / 4:>6}")
+    lines.append("D9999short")                                       # Mixed length: handed to bytes engine
+    lines.append(f"D{30:04d}{'Tail':<6}{'1.00':>7}{'2.5':>6}")
+    fw_file = tmp_path / "uniform.txt"
+    fw_file.write_bytes((newline.join(lines) + newline).encode("latin-1"))
+
+    results = {}
+    for engine in ("line", "numpy"):
+        config_file = tmp_path / f"config_{engine}.json"
+        config_file.write_text(json.dumps(_numpy_config(fixed_width_engine=engine,
+                                                        normalization={"cast_mode": cast_mode})))
+        out_dir = tmp_path / engine
+        caplog.clear()
+        stats, record_stats, file_errors = parse_files(config_file, [fw_file], out_dir)
+        assert len(file_errors) == 0
+        outputs = {p.name: p.read_bytes() for p in sorted(out_dir.glob("*.csv"))}
+        errors = [r.getMessage() for r in caplog.records if r.levelname == "ERROR"]
+        results[engine] = (outputs, stats["unmatched_rows"], vars(record_stats["Detail"]).copy(), errors)
+        for volatile in ("start_time", "end_time"):
+            results[engine][2].pop(volatile)
+
+    assert results["numpy"] == results["line"]
+    assert results["numpy"][1] == 4
+    assert results["numpy"][2]["failed_rows"] > 0
+
+
+@pytest.mark.parametrize("cast_mode", ["safe", "strict"])
+def test_fixed_width_numpy_engine_binary_records(tmp_path, cast_mode):
+    """Test the NumPy engine on EBCDIC fixed-length records with packed, zoned and binary fields."""
+    pytest.importorskip("numpy")
+
+    def record(i):
+        amount = bytes.fromhex(f"{i * 125:05d}{'d' if i % 3 == 0 else 'c'}")
+        if i == 4:
+            amount = b"\x40\x40\x40"                                 # Blank
+        elif i == 7:
+            amount = b"\x12\x3a\x4c"                                 # Invalid digit
+        qty = f"{i:03d}" + ("}" if i % 2 else "5")
+        return ("D{:03d}".format(i).encode("cp037") + amount + qty.encode("cp037")
+                + (i * 1000 - 5000).to_bytes(4, "big", signed=True))
+
+    records = b"".join(record(i) for i in range(1, 11))
+    fw_file = tmp_path / "tlog.dat"
+    fw_file.write_bytes(records + "D0".encode("cp037"))
+
+    outputs = {}
+    for engine in ("bytes", "numpy"):
+        config = {
+            "format_type": "fixed_width",
+            "fixed_width_encoding": "cp037",
+            "fixed_width_record_length": 15,
+            "fixed_width_engine": engine,
+            "continueOnError": True,
+            "normalization": {"cast_mode": cast_mode},
+            "records": [{"name": "Sales", "fields": [
+                {"name": "Type", "start": 0, "width": 1},
+                {"name": "Id", "start": 1, "width": 3, "type": "int"},
+                {"name": "Amount", "start": 4, "width": 3, "type": "comp3", "scale": 2},
+                {"name": "Qty", "start": 7, "width": 4, "type": "zoned", "scale": 1},
+                {"name": "Delta", "start": 11, "width": 4, "type": "binary_int"}]}]
+        }
+        config_file = tmp_path / f"config_{engine}.json"
+        config_file.write_text(json.dumps(config))
+        out_dir = tmp_path / engine
+        stats, record_stats, file_errors = parse_files(config_file, [fw_file], out_dir)
+        assert len(file_errors) == 0
+        outputs[engine] = ((out_dir / "Sales.csv").read_text(), record_stats["Sales"].skipped_rows)
+
+    assert outputs["numpy"] == outputs["bytes"]
+    assert outputs["numpy"][1] == (1 if cast_mode == "strict" else 0)
+    assert "D,10,12.50,10.5,5000" in outputs["numpy"][0]
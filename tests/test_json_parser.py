@@ -125,3 +125,592 @@ def test_json_parser_malformed_file(tmp_path, temp_output_dir, sample_json_confi
     # Verify file error was captured
     assert len(file_errors) == 1
     assert str(malformed_json) in file_errors
+
+
+SCAN_DOCUMENTS = [
+    '[{"id": 1, "tags": ["a", "b"]}, null, {"id": 2.5e3, "name": "caf\\u00e9 \\"x\\""}, 12345678901234567890]',
+    '{"meta": {"n": [1, 2, 3]}, "users": [{"id": 1}, {"id": 2}], "after": {"deep": [[{}]]}}',
+    '{"users": {"id": 7}}',
+    '{"users": null}',
+    '{"users": []}',
+    '  {"other": 1}  ',
+    '"text"',
+    '[]',
+    # Repeated keys: the last value counts, as with json.loads
+    '{"users": [{"id": 1}], "meta": {"n": [1], "n": 2}, "users": {"id": 2}}',
+    '{"meta": {"n": [1]}, "users": [{"id": 1}], "meta": null, "u\\u0073ers": [{"id": 3}]}',
+]
+
+
+@pytest.mark.parametrize("document", SCAN_DOCUMENTS)
+@pytest.mark.parametrize("selector", ["", "$", "$.users", "users", "$.meta.n"])
+@pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+def test_scan_json_records_matches_select(document, selector, chunk_size):
+    """Test the incremental scanner selects what the in-memory selector does."""
+    import io
+
+    from multi_format_parser.json_utils import scan_json_records, select_json_records, selector_keys
+
+    scanned = list(scan_json_records(io.StringIO(document), selector_keys(selector), chunk_size))
+
+    assert scanned == select_json_records(json.loads(document), selector)
+
+
+@pytest.mark.parametrize("document", ['[{"id": 1},\n {"id": 2},\n {"id" 3}]', '[1, 2,]', '{"a": 1} x', '', '[1, 2'])
+def test_scan_json_records_errors_match_json(document):
+    """Test syntax errors are reported with json's message and position."""
+    import io
+
+    from multi_format_parser.json_utils import scan_json_records
+
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(document)
+    with pytest.raises(json.JSONDecodeError) as scanned:
+        list(scan_json_records(io.StringIO(document), [], chunk_size=4))
+
+    assert (scanned.value.lineno, scanned.value.colno) == (expected.value.lineno, expected.value.colno)
+    assert str(scanned.value) == str(expected.value)
+
+
+def test_json_parser_reads_arrays_incrementally(tmp_path, monkeypatch):
+    """Test simple selectors are read without loading the whole document."""
+    from multi_format_parser.parsers import json_parser
+
+    def fail_select(*args, **kwargs):
+        raise AssertionError("document loaded whole")
+
+    json_file = tmp_path / "messages.json"
+    json_file.write_text(json.dumps({"source": "pos", "messages": [{"id": i, "total": i / 4} for i in range(50)]}))
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({
+        "format_type": "json",
+        "records": [
+            {"name": "Messages", "select": "$.messages",
+             "fields": [{"name": "Id", "path": "id", "type": "int"},
+                        {"name": "Total", "path": "total", "type": "float", "max_value": 10}]},
+            {"name": "Ids", "select": "messages", "fields": [{"name": "Id", "path": "id"}]},
+            {"name": "Missing", "select": "$.nothing", "fields": [{"name": "Id", "path": "id"}]}
+        ]
+    }))
+    monkeypatch.setattr(json_parser, "select_json_records", fail_select)
+
+    stats, record_stats, file_errors = parse_files(config_file, [json_file], tmp_path / "out")
+
+    assert file_errors == {}
+    assert (record_stats["Messages"].success_rows, record_stats["Messages"].failed_rows) == (41, 9)
+    assert record_stats["Ids"].success_rows == 50
+    assert record_stats["Missing"].total_rows == 0
+    rows = list(csv.DictReader(open(tmp_path / "out" / "Messages.csv")))
+    assert rows[1] == {"Id": "1", "Total": "0.25"}
+
+
+def test_json_parser_incremental_syntax_error(tmp_path, sample_json_config, temp_output_dir):
+    """Test a syntax error after the selected array still fails the file."""
+    json_file = tmp_path / "truncated.json"
+    json_file.write_text('{"orders": [{"id": "A1", "amount": 5}], "next": [1, ')
+
+    stats, record_stats, file_errors = parse_files(sample_json_config, [json_file], temp_output_dir)
+
+    assert "Invalid JSON" in file_errors[str(json_file)]
+
+
+@pytest.mark.parametrize("async_writer", [False, True])
+def test_json_parser_incremental_syntax_error_writes_no_rows(tmp_path, async_writer):
+    """Test rows read before a syntax error are rolled back, keeping earlier files' rows."""
+    good = tmp_path / "good.json"
+    good.write_text(json.dumps({"items": [{"id": 1}, {"id": 2}]}))
+    bad = tmp_path / "bad.json"
+    bad.write_text(json.dumps({"items": [{"id": i} for i in range(100)] + [{"id": None}]})[:-2] + ", {]}")
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({
+        "format_type": "json",
+        "ignoreBrokenFiles": True,
+        "output": {"async_writer": async_writer, "flush_every": 10},
+        "records": [{"name": "R", "select": "items",
+                     "fields": [{"name": "Id", "path": "id", "type": "int", "nullable": False}]}]
+    }))
+
+    stats, record_stats, file_errors = parse_files(config_file, [good, bad], tmp_path / "out")
+
+    assert list(file_errors) == [str(bad)]
+    assert (record_stats["R"].total_rows, record_stats["R"].success_rows, record_stats["R"].failed_rows) == (2, 2, 0)
+    with open(tmp_path / "out" / "R.csv", encoding="utf-8") as f:
+        assert [row["Id"] for row in csv.DictReader(f)] == ["1", "2"]
+    assert not (tmp_path / "out" / "R_rejected.csv").exists()
+
+
+def test_json_lines_parallel_matches_sequential(tmp_path, caplog):
+    """Test JSON Lines give the same output in parallel ranges, with line numbers as row numbers."""
+    lines = []
+    for i in range(1, 121):
+        if i % 40 == 0:
+            lines.append("")
+        elif i % 29 == 0:
+            lines.append('{"id": 1, "broken": ')
+        elif i % 11 == 0:
+            lines.append(json.dumps({"kind": "other"}))
+        else:
+            lines.append(json.dumps({"id": i, "total": i - 50, "items": [{"sku": f"S{i}"}, {"sku": None}]}))
+    json_file = tmp_path / "events.ndjson"
+    json_file.write_text("\r\n".join(lines) + "\n")
+
+    config = {
+        "format_type": "json",
+        "json_lines": True,
+        "parallel_chunk_bytes": 300,
+        "continueOnError": True,
+        "records": [
+            {"name": "Events", "select": "$",
+             "fields": [{"name": "Id", "path": "id", "type": "int", "nullable": False},
+                        {"name": "Total", "path": "total", "type": "int", "min_value": 0}]},
+            {"name": "Items", "select": "items",
+             "fields": [{"name": "EventId", "path": "$.id", "type": "int"},
+                        {"name": "Sku", "path": "sku", "nullable": False}]}
+        ]
+    }
+
+    results = {}
+    for workers in (1, 2):
+        config_file = tmp_path / f"config_{workers}.json"
+        config_file.write_text(json.dumps({**config, "parallel_workers": workers}))
+        out_dir = tmp_path / f"out_{workers}"
+        caplog.clear()
+        stats, record_stats, file_errors = parse_files(config_file, [json_file], out_dir)
+        assert file_errors == {}
+        errors = sorted(r.getMessage() for r in caplog.records if r.levelname == "ERROR")
+        outputs = {p.name: p.read_text() for p in sorted(out_dir.glob("*.csv"))}
+        counts = {name: (s.success_rows, s.failed_rows, s.skipped_rows) for name, s in record_stats.items()}
+        results[workers] = (outputs, counts, errors)
+
+    assert results[2] == results[1]
+    assert results[1][1]["Events"] == (60, 53, 4)
+    assert results[1][1]["Items"] == (103, 103, 4)
+    assert any("Events at row 58: Invalid JSON line" in message for message in results[1][2])
+    assert "\n2,S2\n" in results[1][0]["Items.csv"]
+
+
+@pytest.mark.parametrize("path,expected", [
+    ("a.b[1].c", 3),
+    ("a.b.1.c", 3),
+    ("a.b[0]", 1),
+    ("a.b[2]", None),
+    ("a.b[-1]", None),
+    ("a.b[x]", None),
+    ("a.b.c", None),
+    ("a.0", "zero"),
+    ("list.1", "y"),
+    ("list[0]", "x"),
+    ("a.b[1].c.d", None),
+    ("missing.x", None),
+])
+def test_compiled_json_paths(path, expected):
+    """Test compiled path steps follow keys and indexes like the dot notation."""
+    from multi_format_parser.json_utils import extract_json_path
+
+    data = {"a": {"b": [1, {"c": 3}], "0": "zero"}, "list": ["x", "y"]}
+
+    assert extract_json_path(data, path) == expected
+
+
+def test_json_root_paths_resolved_once(tmp_path, monkeypatch):
+    """Test $-rooted paths are resolved once per file, not per row."""
+    from multi_format_parser.parsers import json_parser
+
+    calls = []
+    resolve = json_parser.resolve_root_values
+    monkeypatch.setattr(json_parser, "resolve_root_values", lambda plan, root: calls.append(1) or resolve(plan, root))
+    json_file = tmp_path / "orders.json"
+    json_file.write_text(json.dumps({"store": {"id": "S1"}, "orders": [{"id": i} for i in range(20)]}))
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({
+        "format_type": "json",
+        "records": [{"name": "Orders", "select": "orders",
+                     "context": [{"name": "Store", "from": "$.store.id"}],
+                     "fields": [{"name": "Id", "path": "id", "type": "int"}]}]
+    }))
+
+    stats, record_stats, file_errors = parse_files(config_file, [json_file], tmp_path / "out")
+
+    assert record_stats["Orders"].success_rows == 20
+    assert len(calls) == 1
+    assert "S1,19" in (tmp_path / "out" / "Orders.csv").read_text()
+
+
+def test_json_records_sharing_selector(tmp_path, monkeypatch):
+    """Test records with the same selector are filled in one pass with shared path lookups."""
+    from multi_format_parser import json_utils
+    from multi_format_parser.parsers import json_parser
+
+    selections = []
+    select = json_parser.select_json_records
+    monkeypatch.setattr(json_parser, "select_json_records",
+                        lambda data, selector: selections.append(selector) or select(data, selector))
+    json_file = tmp_path / "messages.json"
+    json_file.write_text(json.dumps([
+        {"messageId": 1, "source": "pos", "data": [{"header": {"number": "T1", "total": {"net": "1.50"}}}]},
+        {"messageId": 2, "source": "pos", "data": []},
+    ]))
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({
+        "format_type": "json",
+        "records": [
+            {"name": "Log", "select": "$",
+             "context": [{"name": "FirstId", "from": "$[0].messageId"}],  # Needs the whole document
+             "fields": [{"name": "MessageId", "path": "messageId", "type": "int"},
+                        {"name": "Source", "path": "source"}]},
+            {"name": "Headers", "select": "$.",
+             "fields": [{"name": "MessageId", "path": "messageId", "type": "int"},
+                        {"name": "Number", "path": "data[0].header.number"},
+                        {"name": "Net", "path": "data[0].header.total.net", "type": "decimal"}]}
+        ]
+    }))
+
+    stats, record_stats, file_errors = parse_files(config_file, [json_file], tmp_path / "out")
+
+    assert file_errors == {}
+    assert len(selections) == 1
+    assert (tmp_path / "out" / "Log.csv").read_text().splitlines() == ["FirstId,MessageId,Source", "1,1,pos", "1,2,pos"]
+    assert (tmp_path / "out" / "Headers.csv").read_text().splitlines() == ["MessageId,Number,Net", "1,T1,1.50", "2,,"]
+
+    # Shared prefixes are single tree nodes
+    tree = json_utils.compile_path_tree(json_utils.compile_json_path(path) for path in
+                                        ["messageId", "data[0].header.number", "data[0].header.total.net"])
+    assert len(tree) == 2
+
+
+@pytest.mark.parametrize("json_lines", [False, True])
+def test_json_wildcard_selector_with_parent(tmp_path, json_lines):
+    """Test [*] selectors explode nested arrays and parent paths reach enclosing elements."""
+    messages = [
+        {"messageId": 1, "parent": {"id": "P"}, "data": [{"transaction": {"number": "T1"}}, {"transaction": {"number": "T2"}}]},
+        {"messageId": 2, "parent": {"id": "Q"}, "data": [{"transaction": {"number": "T3"}}]},
+    ]
+    json_file = tmp_path / "messages.json"
+    if json_lines:
+        json_file.write_text("".join(json.dumps(message) + "\n" for message in messages))
+        select, message_id = "data[*].transaction", "$.messageId"  # The line document is the root
+    else:
+        json_file.write_text(json.dumps({"file": "F1", "messages": messages}))
+        select, message_id = "$.messages[*].data[*].transaction", "parent.parent.messageId"
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({
+        "format_type": "json",
+        "json_lines": json_lines,
+        "records": [
+            {"name": "Transactions", "select": select,
+             "fields": [{"name": "File", "path": "$.file"},
+                        {"name": "MessageId", "path": message_id, "type": "int"},
+                        {"name": "Number", "path": "number"},
+                        {"name": "Self", "path": "$parent.transaction.number"}]},
+            {"name": "Parents", "select": "messages" if not json_lines else "$",
+             "fields": [{"name": "ParentId", "path": "parent.id"}]}  # Plain key without a wildcard
+        ]
+    }))
+
+    stats, record_stats, file_errors = parse_files(config_file, [json_file], tmp_path / "out")
+
+    assert file_errors == {}
+    file_value = "" if json_lines else "F1"
+    rows = (tmp_path / "out" / "Transactions.csv").read_text().splitlines()
+    assert rows[1:] == [f"{file_value},1,T1,T1", f"{file_value},1,T2,T2", f"{file_value},2,T3,T3"]
+    assert (tmp_path / "out" / "Parents.csv").read_text().splitlines()[1:] == ["P", "Q"]
+
+
+@pytest.mark.parametrize("json_lines", [False, True])
+def test_json_filter_selectors_route_rows(tmp_path, json_lines):
+    """Test [?(...)] selectors route elements by content in one pass."""
+    messages = [
+        {"messageId": 1, "transaction": {"type": "Sale", "total": 12.5, "lines": [{"sku": "a", "qty": 1}, {"sku": "b", "qty": 3}]}},
+        {"messageId": 2, "transaction": {"type": "Logon", "cashier": "C1"}},
+        {"messageId": 3, "transaction": {"type": "Sale", "total": 4, "voided": True, "lines": [{"sku": "c", "qty": 2}]}},
+        {"messageId": 4, "transaction": {"type": "Logoff", "cashier": "C1"}},
+        {"messageId": 5, "transaction": {"type": "Refund", "total": "n/a"}},
+    ]
+    json_file = tmp_path / "messages.json"
+    if json_lines:
+        json_file.write_text("".join(json.dumps(message) + "\n" for message in messages))
+        root = "$"
+    else:
+        json_file.write_text(json.dumps({"messages": messages}))
+        root = "$.messages"
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({
+        "format_type": "json",
+        "json_lines": json_lines,
+        "records": [
+            {"name": "Sales", "select": f"{root}[?(@.transaction.type == 'Sale' && !@.transaction.voided)]",
+             "fields": [{"name": "MessageId", "path": "messageId", "type": "int"},
+                        {"name": "Total", "path": "transaction.total", "type": "decimal"}]},
+            {"name": "Sessions", "select": f"{root}[?(@.transaction.type in ['Logon', 'Logoff'])].transaction",
+             "fields": [{"name": "Type", "path": "type"},
+                        {"name": "MessageId", "path": "parent.messageId", "type": "int"}]},
+            {"name": "Large", "select": f"{root}[?(@.transaction.total >= 10)]",
+             "fields": [{"name": "MessageId", "path": "messageId", "type": "int"}]},
+            {"name": "Lines", "select": f"{root}[*].transaction.lines[?(@.qty > 1)]",
+             "fields": [{"name": "MessageId", "path": "parent.messageId", "type": "int"},
+                        {"name": "Sku", "path": "sku"}]}
+        ]
+    }))
+
+    stats, record_stats, file_errors = parse_files(config_file, [json_file], tmp_path / "out")
+
+    assert file_errors == {}
+    out = tmp_path / "out"
+    assert (out / "Sales.csv").read_text().splitlines()[1:] == ["1,12.5"]
+    assert (out / "Sessions.csv").read_text().splitlines()[1:] == ["Logon,2", "Logoff,4"]
+    assert (out / "Large.csv").read_text().splitlines()[1:] == ["1"]  # "n/a" is not compared with a number
+    assert (out / "Lines.csv").read_text().splitlines()[1:] == ["1,b", "3,c"]
+    if json_lines:
+        assert stats["unmatched_rows"] == 1  # The refund matches no record
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_json_codec_backends(tmp_path, backend):
+    """Test both codecs decode alike, encode JSON fields like json.dumps and report their timings in run stats."""
+    from multi_format_parser.json_codec import HAS_ORJSON, JsonCodec
+
+    if backend == "orjson" and not HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    codec = JsonCodec(backend)
+    document = '{"big": 123456789012345678901234567890, "nan": NaN, "text": "\\u00e9"}'
+    decoded = codec.loads(document)
+    assert decoded["big"] == 123456789012345678901234567890 and decoded["text"] == "é"
+    assert codec.dumps({"a": [1, 2.5, None], 1: "é"}) == json.dumps({"a": [1, 2.5, None], 1: "é"})
+    assert JsonCodec(backend, compact=True).dumps({"a": [1, 2.5, None], 1: "é"}) == '{"a":[1,2.5,null],"1":"é"}'
+    with pytest.raises(json.JSONDecodeError, match="Expecting value: line 1 column 7"):
+        codec.loads('{"a": }')
+
+    json_file = tmp_path / "data.json"
+    json_file.write_text(json.dumps({"items": [{"id": 1, "tags": ["a", "é"]}, {"id": 2, "tags": []}]}))
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({
+        "format_type": "json",
+        "json_codec": backend,
+        "records": [{"name": "Items", "select": "items",
+                     "context": [{"name": "Count", "from": "$.items[1].id"}],  # Needs the whole document
+                     "fields": [{"name": "Id", "path": "id", "type": "int"},
+                                {"name": "Tags", "path": "tags", "type": "json"}]}]
+    }))
+
+    stats, record_stats, file_errors = parse_files(config_file, [json_file], tmp_path / "out")
+
+    assert file_errors == {}
+    with open(tmp_path / "out" / "Items.csv", newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [json.loads(row["Tags"]) for row in rows] == [["a", "é"], []]
+    assert rows[0]["Tags"] == '["a", "\\u00e9"]'  # Same text as json.dumps with either backend
+    diagnostics = stats["diagnostics"]
+    assert diagnostics["json_backend"] == backend
+    assert set(diagnostics["json_decoders"]) == {backend} and set(diagnostics["json_encoders"]) == {"json"}
+    assert diagnostics["json_decode_seconds"] > 0
+
+    # Time spent on a failed file is reported too, apart from the record counts
+    json_file.write_text(json.dumps({"items": [{"id": "x", "tags": []}]}))
+    config = json.loads(config_file.read_text())
+    config_file.write_text(json.dumps({**config, "normalization": {"cast_mode": "strict"}, "records": [
+        {**config["records"][0], "name": "json_backend"}]}))
+    stats, record_stats, file_errors = parse_files(config_file, [json_file], tmp_path / "failed")
+
+    assert len(file_errors) == 1
+    assert stats["diagnostics"]["json_backend"] == backend and stats["diagnostics"]["json_decode_seconds"] > 0
+
+
+def test_json_codec_reports_implementations_used():
+    """Test timings are labelled by the decoder and encoder that handled each call."""
+    from multi_format_parser.json_codec import HAS_ORJSON, JsonCodec
+    from multi_format_parser.json_utils import compile_decode_plan
+
+    if not HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    codec = JsonCodec("orjson")
+    codec.loads('{"a": 1}')
+    codec.loads('{"a": NaN}')                                  # orjson cannot: the stdlib decodes it
+    codec.loads('{"a": [1], "b": 2}', compile_decode_plan([(("a",), None)], skip=True))
+    list(codec.iter_decoded(iter([1, 2]), "scanner"))
+    codec.dumps([1])                                           # json.dumps text by default
+    diagnostics = {}
+    codec.report(diagnostics)
+
+    assert diagnostics["json_backend"] == "orjson"
+    assert set(diagnostics["json_decoders"]) == {"orjson", "json", "planned", "scanner"}
+    assert set(diagnostics["json_encoders"]) == {"json"}
+    assert diagnostics["json_decode_seconds"] == diagnostics["json_decoders"]["orjson"]
+    assert diagnostics["json_encode_seconds"] == 0.0
+
+    compact = JsonCodec("orjson", compact=True)
+    compact.dumps([1])
+    compact.dumps({1: "a"})                                    # Non-string key: the stdlib encodes it
+    compact.report(diagnostics)
+    assert set(diagnostics["json_encoders"]) == {"json", "orjson"}
+    assert diagnostics["json_encode_seconds"] == diagnostics["json_encoders"]["orjson"] > 0
+
+
+@pytest.mark.parametrize("field_text", ["raw", "minify"])
+@pytest.mark.parametrize("mode", ["incremental", "streaming", "json_lines"])
+def test_json_field_text_copies_source(tmp_path, mode, field_text):
+    """Test json_field_text copies json fields from the input unless another path reads them."""
+    from multi_format_parser.parsers import json_parser
+
+    payload = '{ "a": [1,  2], "s": "x \\"y\\" \u00e9" }'
+    items = [f'{{"id": 1, "payload": {payload}, "tags": ["t", "u"], "lines": [{{"sku": "A", "meta": {{ "k" : 1 }}}}]}}',
+             '{"id": 2, "payload": null, "tags": [], "lines": [{"sku": "B", "meta": [ ]}]}']
+    json_file = tmp_path / "items.json"
+    if mode == "json_lines":
+        json_file.write_text("".join(item + "\n" for item in items), encoding="utf-8")
+    else:
+        json_file.write_text('{"items": [\n' + ",\n".join(items) + "\n]}", encoding="utf-8")
+    prefix = "$" if mode == "json_lines" else "items"
+    records = [
+        {"name": "Items", "select": prefix,
+         "fields": [{"name": "Id", "path": "id", "type": "int"},
+                    {"name": "Payload", "path": "payload", "type": "json"},
+                    {"name": "Tags", "path": "tags", "type": "json"},
+                    {"name": "FirstTag", "path": "tags[0]"}]},  # Tags are read, so encoded
+        {"name": "Lines", "select": f"{prefix}[?(@.id > 0)].lines[*]",
+         "fields": [{"name": "Sku", "path": "sku"},
+                    {"name": "Meta", "path": "meta", "type": "json"},
+                    {"name": "Payload", "path": "$parent.payload", "type": "json"}]},
+    ]
+    config = {"format_type": "json", "json_lines": mode == "json_lines", "streaming": mode == "streaming",
+              "json_codec": "json", "json_field_text": field_text, "records": records}
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(config))
+
+    stats, record_stats, file_errors = parse_files(config_file, [json_file], tmp_path / "out")
+
+    assert file_errors == {}
+    expected_payload = payload if field_text == "raw" else '{"a":[1,2],"s":"x \\"y\\" \u00e9"}'
+    with open(tmp_path / "out" / "Items.csv", newline="", encoding="utf-8") as f:
+        assert [(row["Payload"], row["Tags"], row["FirstTag"]) for row in csv.DictReader(f)] == [
+            (expected_payload, '["t", "u"]', "t"), ("", "[]", "")]
+    with open(tmp_path / "out" / "Lines.csv", newline="", encoding="utf-8") as f:
+        assert [(row["Meta"], row["Payload"]) for row in csv.DictReader(f)] == [
+            ('{ "k" : 1 }' if field_text == "raw" else '{"k":1}', expected_payload), ("[ ]" if field_text == "raw" else "[]", "")]
+
+    # Values read by a filter stay decoded; encoding (the default) needs no plan
+    filtered = {"name": "Filtered", "select": "items[?(@.payload != null)]",
+                "fields": [{"name": "Payload", "path": "payload", "type": "json"}]}
+    assert json_parser.json_decode_plan(config, [filtered]) is None
+    assert json_parser.json_decode_plan({**config, "json_field_text": "encode"}, records) is None
+
+
+@pytest.mark.parametrize("mode", ["memory", "incremental", "streaming", "json_lines"])
+def test_json_selective_decode_skips_unread_keys(tmp_path, mode):
+    """Test json_decode 'selective' writes the same rows while skipping keys no path reads."""
+    from multi_format_parser.json_utils import SKIPPED, decode_json_planned, skip_json_value
+    from multi_format_parser.parsers import json_parser
+
+    messages = [{"type": "Sale", "id": i, "total": i * 2.5, "customer": {"tier": "gold", "visits": [1, 2]},
+                 "detail": [{"sku": f"S{j}", "text": "a \"quoted\" ]} value", "tags": [[j], {"k": [j]}]}
+                            for j in range(3)],
+                 "telemetry": {"samples": [0.5, -1e3, True, None], "device": {"fw": "1.2"}}}
+                for i in range(1, 4)]
+    messages[1]["type"] = "Refund"
+    json_file = tmp_path / "pos.json"
+    if mode == "json_lines":
+        json_file.write_text("".join(json.dumps(message) + "\n" for message in messages))
+        select = "$[?(@.type == 'Sale')]"
+    else:
+        json_file.write_text(json.dumps({"header": {"store": "S1", "audit": list(range(50))}, "messages": messages}))
+        select = "messages[?(@.type == 'Sale')]"
+    record = {"name": "Sales", "select": select,
+              "fields": [{"name": "Id", "path": "id", "type": "int"},
+                         {"name": "Total", "path": "total", "type": "float"},
+                         {"name": "Tier", "path": "customer.tier"},
+                         {"name": "Missing", "path": "customer.missing"}]}
+    if mode == "memory":
+        record["context"] = [{"name": "Store", "from": "$.header.store"}]  # Needs the whole document
+
+    outputs = {}
+    for decode in ("full", "selective"):
+        config = {"format_type": "json", "json_lines": mode == "json_lines", "streaming": mode == "streaming",
+                  "json_decode": decode, "records": [record]}
+        config_file = tmp_path / f"config_{decode}.json"
+        config_file.write_text(json.dumps(config))
+        stats, record_stats, file_errors = parse_files(config_file, [json_file], tmp_path / decode)
+        assert file_errors == {}
+        outputs[decode] = (tmp_path / decode / "Sales.csv").read_text()
+    assert outputs["selective"] == outputs["full"]
+    assert outputs["full"].splitlines()[1].endswith("1,2.5,gold,")
+
+    plan = json_parser.json_decode_plan(config, [record], from_root=mode in ("memory", "json_lines"))
+    element_plan = ({"type": None, "id": None, "total": None, "customer": ({"tier": None, "missing": None}, SKIPPED)},
+                    SKIPPED)
+    if mode == "memory":
+        assert plan == ({"header": ({"store": None}, SKIPPED), "messages": element_plan}, SKIPPED)
+    else:
+        assert plan == element_plan
+    assert decode_json_planned(json.dumps(messages[0]), 0, element_plan)[0] == {
+        "type": "Sale", "id": 1, "total": 2.5, "customer": {"tier": "gold"}}
+
+    text = '{"a": [1, {"b": "]}"}], "c": null}'
+    assert skip_json_value(text + " ", 0) == len(text)
+    for bad in ('{"a": [1}', '{"a": "x', '[[1]'):
+        with pytest.raises(json.JSONDecodeError):
+            skip_json_value(bad, 0)
+
+
+@pytest.mark.parametrize("mode", ["memory", "incremental", "streaming", "json_lines"])
+def test_json_schema_per_element(tmp_path, mode):
+    """Test json_schema_mode 'element' rejects the rows of invalid elements instead of failing the file."""
+    pytest.importorskip("jsonschema")
+    items = [{"id": 1, "qty": 2}, {"id": "two", "qty": 1}, {"id": 3}, {"id": 4, "qty": -1}]
+    json_file = tmp_path / "items.json"
+    if mode == "json_lines":
+        json_file.write_text("".join(json.dumps(item) + "\n" for item in items))
+    else:
+        json_file.write_text(json.dumps({"count": 4, "items": items}))
+    schema_file = tmp_path / "item.schema.json"
+    schema_file.write_text(json.dumps({
+        "type": "object", "required": ["id", "qty"],
+        "properties": {"id": {"type": "integer"}, "qty": {"type": "integer", "minimum": 0}}
+    }))
+    record = {"name": "Items", "select": "$" if mode == "json_lines" else "items",
+              "fields": [{"name": "Id", "path": "id"}, {"name": "Qty", "path": "qty", "type": "int"}]}
+    if mode == "memory":
+        record["context"] = [{"name": "Count", "from": "$.count"}]  # Needs the whole document
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({
+        "format_type": "json",
+        "json_lines": mode == "json_lines",
+        "streaming": mode == "streaming",
+        "json_schema_path": schema_file.name,
+        "json_schema_mode": "element",
+        "records": [record]
+    }))
+
+    stats, record_stats, file_errors = parse_files(config_file, [json_file], tmp_path / "out")
+
+    assert file_errors == {}
+    assert [row.split(",")[-2:] if mode == "memory" else row.split(",")
+            for row in (tmp_path / "out" / "Items.csv").read_text().splitlines()[1:]] == [["1", "2"]]
+    with open(tmp_path / "out" / "Items_rejected.csv", newline="") as f:
+        rejected = list(csv.DictReader(f))
+    assert [row["Id"] for row in rejected] == ["two", "3", "4"]
+    assert "JSON schema validation failed: id: 'two' is not of type 'integer'" in rejected[0]["_error_reason"]
+    assert "'qty' is a required property" in rejected[1]["_error_reason"]
+    assert (record_stats["Items"].success_rows, record_stats["Items"].failed_rows) == (1, 3)
+
+
+def test_json_schema_validators_and_files_cached(tmp_path):
+    """Test schemas compile once across files and schema files are re-read only when changed."""
+    import os
+
+    from multi_format_parser.parsers import json_parser
+
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(json.dumps({"type": "object"}))
+    config = {"json_schema_path": str(schema_file)}
+    first = json_parser.load_json_schema(config, tmp_path / "a.json")
+    assert json_parser.load_json_schema(config, tmp_path / "b.json") is first
+
+    schema_file.write_text(json.dumps({"type": "array"}))
+    stat = schema_file.stat()
+    os.utime(schema_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert json_parser.load_json_schema(config, tmp_path / "a.json") == {"type": "array"}
+
+    pytest.importorskip("jsonschema")
+    validator = json_parser.get_schema_validator({"type": "object", "required": ["a"]})
+    assert json_parser.get_schema_validator({"required": ["a"], "type": "object"}) is validator
+    assert json_parser.validate_json_schema({"b": 1}, {"type": "object", "required": ["a"]}) == (
+        False, "root: 'a' is a required property")
@@ -0,0 +1,241 @@
+"""Tests for streaming mode (output must match the in-memory parsers)."""
+
+import json
+
+import pytest
+
+from multi_format_parser.orchestrator import parse_files
+
+
+def _run_both_modes(tmp_path, config, input_file):
+    """Parse with and without streaming; return {mode: (outputs, record_stats)}."""
+    results = {}
+    for streaming in (False, True):
+        config_file = tmp_path / f"config_{streaming}.json"
+        config_file.write_text(json.dumps({**config, "streaming": streaming, "streaming_batch_size": 2}))
+        out_dir = tmp_path / f"out_{streaming}"
+        stats, record_stats, file_errors = parse_files(config_file, [input_file], out_dir)
+        assert file_errors == {}
+        outputs = {p.name: p.read_text() for p in sorted(out_dir.glob("*.csv"))}
+        counts = {name: (s.total_rows, s.success_rows, s.failed_rows) for name, s in record_stats.items()}
+        results[streaming] = (outputs, counts)
+    return results
+
+
+def test_streaming_csv_all_records_get_rows(tmp_path):
+    """Test every configured record receives rows (old streaming exhausted the reader)."""
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("kind;id;amount\nA;1;1.5\nB;2;x\n\nA;3;3\nB;4;4\nA;5;5\n")
+    config = {
+        "format_type": "csv",
+        "csv_delimiter": ";",
+        "records": [
+            {"name": "TypeA", "record_type_field": "kind", "record_type_value": "A",
+             "fields": [{"name": "Id", "path": "id", "type": "int"},
+                        {"name": "Amount", "path": "amount", "type": "decimal"}]},
+            {"name": "TypeB", "record_type_field": "kind", "record_type_value": "B",
+             "fields": [{"name": "Id", "path": "id", "type": "int"},
+                        {"name": "Amount", "path": "amount", "type": "decimal", "nullable": False}]}
+        ]
+    }
+
+    results = _run_both_modes(tmp_path, config, csv_file)
+
+    assert results[True] == results[False]
+    assert results[True][1]["TypeA"] == (3, 3, 0)
+    assert results[True][1]["TypeB"] == (2, 1, 1)
+
+
+def test_streaming_fixed_width(tmp_path):
+    """Test fixed-width streaming matches across batch boundaries."""
+    fw_file = tmp_path / "input.txt"
+    fw_file.write_text("H20240101\nD0001Alice\nD0002Bob  \n\nD0003Carol\n")
+    config = {
+        "format_type": "fixed_width",
+        "records": [
+            {"name": "Header", "record_type_field": "Type", "record_type_value": "H",
+             "fields": [{"name": "Type", "start": 0, "width": 1},
+                        {"name": "Date", "start": 1, "width": 8}]},
+            {"name": "Detail", "record_type_field": "Type", "record_type_value": "D",
+             "fields": [{"name": "Type", "start": 0, "width": 1},
+                        {"name": "Id", "start": 1, "width": 4, "type": "int"},
+                        {"name": "Name", "start": 5, "width": 5}]}
+        ]
+    }
+
+    results = _run_both_modes(tmp_path, config, fw_file)
+
+    assert results[True] == results[False]
+    assert results[True][1]["Detail"] == (3, 3, 0)
+
+
+def test_streaming_json(tmp_path):
+    """Test JSON streaming with shared selectors and an object selector."""
+    json_file = tmp_path / "input.json"
+    json_file.write_text(json.dumps({
+        "meta": {"source": "pos", "version": 2},
+        "users": [
+            {"id": 1, "name": "Alice", "score": 1.25, "tags": ["a", "b"]},
+            None,
+            {"id": 2, "name": "Bob", "score": 1e-7, "tags": []},
+            {"id": "bad", "name": "Carol", "score": 3}
+        ]
+    }))
+    config = {
+        "format_type": "json",
+        "continueOnError": True,
+        "normalization": {"cast_mode": "strict"},
+        "records": [
+            {"name": "Users", "select": "$.users",
+             "fields": [{"name": "Id", "path": "id", "type": "int"},
+                        {"name": "Score", "path": "score", "type": "float"},
+                        {"name": "Tags", "path": "tags", "type": "json"}]},
+            {"name": "UserNames", "select": "users",
+             "fields": [{"name": "Name", "path": "name", "type": "string"}]},
+            {"name": "Meta", "select": "$.meta",
+             "fields": [{"name": "Source", "path": "source", "type": "string"},
+                        {"name": "Version", "path": "version", "type": "int"}]}
+        ]
+    }
+
+    results = _run_both_modes(tmp_path, config, json_file)
+
+    assert results[True][0] == results[False][0]
+    assert results[True][1] == results[False][1]
+    assert results[True][1]["UserNames"] == (3, 3, 0)
+    assert results[True][1]["Meta"] == (1, 1, 0)
+
+
+@pytest.mark.parametrize("text,expected", [
+    # Duplicate keys: only the last "users" is read, and a selected element's last "id"
+    ('{"users": [{"id": 9}], "users": [{"id": 1, "id": 2}, {"id": 3}]}', ["2", "3"]),
+    # An escaped key is the same key as its decoded name
+    ('{"users": [{"id": 9}], "u\\u0073ers": [{"id": 1}]}', ["1"]),
+    # NaN and Infinity as Python's json module reads them
+    ('{"users": [{"id": 1, "score": NaN}, {"id": 2, "score": -Infinity}]}', ["1,nan", "2,-inf"]),
+    # Integers wider than 64 bits
+    ('{"users": [{"id": 123456789012345678901234567890}]}', ["123456789012345678901234567890"]),
+])
+def test_streaming_json_decodes_like_parse_json(tmp_path, text, expected):
+    """Test streamed JSON values decode exactly as the in-memory parser reads them."""
+    json_file = tmp_path / "input.json"
+    json_file.write_text(text)
+    fields = [{"name": "Id", "path": "id"}]
+    if "score" in text:
+        fields.append({"name": "Score", "path": "score", "type": "float"})
+    config = {"format_type": "json", "records": [{"name": "Users", "select": "users", "fields": fields}]}
+
+    results = _run_both_modes(tmp_path, config, json_file)
+
+    assert results[True] == results[False]
+    assert results[True][0]["Users.csv"].splitlines()[1:] == expected
+
+
+def test_streaming_json_wildcard_selectors(tmp_path):
+    """Test [*] and filter selectors with parent paths give the same rows when streamed."""
+    json_file = tmp_path / "messages.json"
+    json_file.write_text(json.dumps([
+        {"messageId": 1, "data": [{"store": "S1", "transaction": {"number": "T1", "lines": [{"sku": "a"}, {"sku": "b"}]}},
+                                  {"store": "S2", "transaction": {"number": "T2", "lines": []}}]},
+        {"messageId": 2, "data": []},
+        {"messageId": 3, "data": [{"store": "S3", "transaction": {"number": "T3", "lines": [{"sku": "c"}]}}]}
+    ]))
+    config = {
+        "format_type": "json",
+        "records": [
+            {"name": "Messages", "select": "$", "fields": [{"name": "MessageId", "path": "messageId", "type": "int"}]},
+            {"name": "Transactions", "select": "$[*].data[*].transaction",
+             "fields": [{"name": "MessageId", "path": "parent.parent.messageId", "type": "int"},
+                        {"name": "Store", "path": "$parent.store"},
+                        {"name": "Number", "path": "number"}]},
+            {"name": "Lines", "select": "$[*].data[*].transaction.lines[*]",
+             "fields": [{"name": "Number", "path": "parent.transaction.number"},
+                        {"name": "Sku", "path": "sku"}]},
+            {"name": "Filtered", "select": "$[?(@.messageId != 2)].data[?(@.store in ['S1', 'S3'])].transaction.lines[?(@.sku != 'b')]",
+             "fields": [{"name": "Store", "path": "parent.store"}, {"name": "Sku", "path": "sku"}]}
+        ]
+    }
+
+    results = _run_both_modes(tmp_path, config, json_file)
+
+    assert results[True] == results[False]
+    assert results[True][0]["Transactions.csv"].splitlines()[1:] == ["1,S1,T1", "1,S2,T2", "3,S3,T3"]
+    assert results[True][0]["Lines.csv"].splitlines()[1:] == ["T1,a", "T1,b", "T3,c"]
+    assert results[True][0]["Filtered.csv"].splitlines()[1:] == ["S1,a", "S3,c"]
+
+
+NAXML = """<?xml version="1.0"?>
+<nax:Journal xmlns:nax="http://example.com/naxml">
+  <nax:Header><nax:StoreID>S1</nax:StoreID></nax:Header>
+  <nax:Report>
+    <nax:ReportHeader><nax:Period>2</nax:Period></nax:ReportHeader>
+    <nax:Sale>
+      <nax:TransactionID>T1</nax:TransactionID>
+      <nax:Lines>
+        <nax:Line><nax:Item>apple</nax:Item><nax:Qty>1</nax:Qty></nax:Line>
+        <nax:Line><nax:Item>pear</nax:Item><nax:Qty>2</nax:Qty></nax:Line>
+      </nax:Lines>
+    </nax:Sale>
+    <nax:Note>ignored</nax:Note>
+    <nax:Sale>
+      <nax:TransactionID>T2</nax:TransactionID>
+      <nax:Lines>
+        <nax:Line><nax:Item>plum</nax:Item><nax:Qty>3</nax:Qty></nax:Line>
+      </nax:Lines>
+    </nax:Sale>
+    <nax:Sale>
+      <nax:TransactionID>T3</nax:TransactionID>
+    </nax:Sale>
+  </nax:Report>
+</nax:Journal>
+"""
+
+
+def test_streaming_xml_nested_records_with_header_context(tmp_path):
+    """Test XML streaming with absolute header context and ancestor paths."""
+    xml_file = tmp_path / "journal.xml"
+    xml_file.write_text(NAXML)
+    config = {
+        "format_type": "xml",
+        "records": [
+            {"name": "Header", "select": "/nax:Journal/nax:Header",
+             "fields": [{"name": "StoreID", "path": "nax:StoreID"}]},
+            {"name": "Sale", "select": "/nax:Journal/nax:Report/nax:Sale",
+             "context": [{"name": "StoreID", "from": "/nax:Journal/nax:Header/nax:StoreID"},
+                         {"name": "Period", "from": "/nax:Journal/nax:Report/nax:ReportHeader/nax:Period"}],
+             "fields": [{"name": "TransactionID", "path": "nax:TransactionID"},
+                        {"name": "LineCount", "path": "count(nax:Lines/nax:Line)", "type": "int"}]},
+            {"name": "Line", "select": "//nax:Line",
+             "context": [{"name": "StoreID", "from": "/nax:Journal/nax:Header/nax:StoreID"}],
+             "fields": [{"name": "TransactionID", "path": "ancestor::nax:Sale[1]/nax:TransactionID"},
+                        {"name": "Item", "path": "nax:Item"},
+                        {"name": "Qty", "path": "nax:Qty", "type": "int"},
+                        {"name": "Raw", "path": ".", "type": "xml"}]}
+        ]
+    }
+
+    results = _run_both_modes(tmp_path, config, xml_file)
+
+    assert results[True] == results[False]
+    assert results[True][1]["Sale"] == (3, 3, 0)
+    assert results[True][1]["Line"] == (3, 3, 0)
+    assert "S1,2,T2,1" in results[True][0]["Sale.csv"]
+
+
+def test_streaming_xml_sibling_axes_fall_back(tmp_path):
+    """Test configs using sibling axes are parsed in memory instead."""
+    xml_file = tmp_path / "journal.xml"
+    xml_file.write_text(NAXML)
+    config = {
+        "format_type": "xml",
+        "records": [
+            {"name": "Sale", "select": "//nax:Sale",
+             "fields": [{"name": "TransactionID", "path": "nax:TransactionID"},
+                        {"name": "Previous", "path": "preceding-sibling::nax:Sale[1]/nax:TransactionID"}]}
+        ]
+    }
+
+    results = _run_both_modes(tmp_path, config, xml_file)
+
+    assert results[True] == results[False]
+    assert "T3,T2" in results[True][0]["Sale.csv"]
@@ -176,3 +176,45 @@ def test_computed_field_reference():
     errors = validate_config(config)
     assert len(errors) > 0
     assert any("computed" in err.lower() for err in errors)
+
+
+def test_from_record_context_validation():
+    """Test from_record context must reference a fixed-width record and field."""
+    config = {
+        "format_type": "fixed_width",
+        "records": [
+            {"name": "Header", "fields": [{"name": "StoreID", "start": 0, "width": 3}]},
+            {"name": "Detail",
+             "context": [{"name": "StoreID", "from_record": "Header"},
+                         {"name": "Register", "from_record": "Header"},
+                         {"name": "Txn", "from_record": "Hdr", "field": "StoreID"}],
+             "fields": [{"name": "Item", "start": 3, "width": 5}]}
+        ]
+    }
+    errors = validate_config(config)
+    assert len(errors) == 2
+    assert any("has no field 'Register'" in e for e in errors)
+    assert any("from_record 'Hdr' is not a configured record" in e for e in errors)
+
+    config["format_type"] = "csv"
+    assert any("only supported for fixed-width" in e for e in validate_config(config))
+
+
+@pytest.mark.parametrize("select", ["items[?(@.a == )]", "items[?(@.a = 2)]", "items[?(@.a == 2)"])
+def test_json_invalid_filter(select):
+    """Test that malformed JSON selector filters are caught."""
+    config = {
+        "format_type": "json",
+        "records": [{
+            "name": "Items",
+            "select": select,
+            "fields": [{"name": "ID", "path": "id"}]
+        }]
+    }
+    errors = validate_config(config)
+    assert len(errors) == 1
+    assert errors[0].startswith("Record 'Items': ")
+    assert "filter" in errors[0]
+
+    config["records"][0]["select"] = "items[?(@.a == 2)]"
+    assert validate_config(config) == []
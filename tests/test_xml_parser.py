@@ -384,3 +384,143 @@ def test_xml_namespace_undefined_prefix(tmp_path, temp_output_dir):
     
     # File should have failed to process
     assert stats["failed"] == 1
+
+
+def test_xml_multi_document_stream(tmp_path, temp_output_dir):
+    """Test parsing a file of concatenated XML documents."""
+    xml_content = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n<?xml-stylesheet type="text/xsl" href="tx.xsl"?>\n'
+        '<Transaction xmlns="http://example.com"><ID>TX001</ID><Amount>10.00</Amount></Transaction>\n'
+        '<Transaction xmlns="http://example.com"><ID>TX002</ID><Amount>20.00</Amount></Transaction>'
+        '<?xml version="1.0"?><Transaction xmlns="http://example.com">'
+        '<!-- </Transaction> --><ID note="a>b">TX003</ID><Amount>30.00</Amount></Transaction>\n'
+        '<!-- end of batch -->\n'
+    )
+    xml_file = tmp_path / "stream.xml"
+    xml_file.write_text(xml_content)
+
+    import json
+    config = {
+        "format_type": "xml",
+        "xml_multi_document": True,
+        "namespaces": {"ns": "http://example.com"},
+        "records": [{
+            "name": "Transactions",
+            "select": "/ns:Transaction",
+            "fields": [
+                {"name": "ID", "path": "ns:ID", "type": "string"},
+                {"name": "Amount", "path": "ns:Amount", "type": "decimal"}
+            ]
+        }]
+    }
+    config_file = tmp_path / "stream_config.json"
+    config_file.write_text(json.dumps(config))
+
+    stats, record_stats, file_errors = parse_files(
+        config_file,
+        [xml_file],
+        temp_output_dir
+    )
+
+    assert len(file_errors) == 0
+    assert record_stats["Transactions"].total_rows == 3
+    assert record_stats["Transactions"].success_rows == 3
+
+    with open(temp_output_dir / "Transactions.csv") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["ID"] for r in rows] == ["TX001", "TX002", "TX003"]
+    assert rows[2]["Amount"] == "30.00"
+
+
+def test_xml_multi_document_chunk_boundaries():
+    """Test document splitting is independent of read chunk size."""
+    import io
+
+    from multi_format_parser.parsers.xml_parser import iter_xml_documents
+
+    data = (
+        b'<?xml version="1.0"?><a x=">"><b/><![CDATA[</a>]]></a>\n'
+        b'<a><b>1</b></a><a/>  <!DOCTYPE r [<!ELEMENT r ANY>]><r>t</r>'
+    )
+    expected = [
+        b'<?xml version="1.0"?><a x=">"><b/><![CDATA[</a>]]></a>',
+        b'<a><b>1</b></a>',
+        b'<a/>',
+        b'<!DOCTYPE r [<!ELEMENT r ANY>]><r>t</r>',
+    ]
+    for chunk_size in (1, 5, 64, 4096):
+        assert list(iter_xml_documents(io.BytesIO(data), chunk_size)) == expected
+
+
+def test_xml_multi_document_unclosed_root_resync():
+    """Test an unclosed root is cut at the next declaration or root-named tag, keeping later documents."""
+    import io
+
+    from multi_format_parser.parsers.xml_parser import iter_xml_documents
+
+    data = (
+        b'<T><ID>1</ID></T>\n'
+        b'<T><ID>2</T>\n'                      # Mismatched end tag: root stays open
+        b'<T><ID>3</ID><T kind="nested"/></T>\n'
+        b'<T><ID>4</ID>\n'                     # Root never closes
+        b'<?xml version="1.0"?><T><ID>5</ID></T>\n'
+        b'<T><ID>6</ID></T>'
+    )
+    expected = [
+        b'<T><ID>1</ID></T>',
+        b'<T><ID>2</T>',
+        b'<T><ID>3</ID><T kind="nested"/></T>',  # A root may hold elements of its own name
+        b'<T><ID>4</ID>',
+        b'<?xml version="1.0"?><T><ID>5</ID></T>',
+        b'<T><ID>6</ID></T>',
+    ]
+    for chunk_size in (1, 5, 64, 4096):
+        assert list(iter_xml_documents(io.BytesIO(data), chunk_size)) == expected
+
+
+def test_xml_multi_document_bad_document_skipped(tmp_path, temp_output_dir):
+    """Test a broken document in the middle of a stream is skipped and counted, and later ones are read."""
+    import json
+
+    xml_file = tmp_path / "stream.xml"
+    xml_file.write_text(
+        '<Transaction><ID>TX001</ID></Transaction>\n'
+        '<Transaction><ID>TX002</ID></Transaction>\n'
+        '<Transaction><ID>TX003</Transaction>\n'
+        '<Transaction><ID>TX004</ID></Transaction>\n'
+        '<Transaction><ID>TX005</ID></Transaction>\n'
+    )
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({
+        "format_type": "xml",
+        "xml_multi_document": True,
+        "continueOnError": True,
+        "records": [{"name": "Transactions", "select": "/Transaction",
+                     "fields": [{"name": "ID", "path": "ID"}]}]
+    }))
+
+    stats, record_stats, file_errors = parse_files(config_file, [xml_file], temp_output_dir)
+
+    assert len(file_errors) == 0
+    assert stats["skipped_documents"] == 1
+    with open(temp_output_dir / "Transactions.csv") as f:
+        assert [r["ID"] for r in csv.DictReader(f)] == ["TX001", "TX002", "TX004", "TX005"]
+
+
+def test_xml_multi_document_top_level_misc():
+    """Test comments and PIs between roots stay with a neighbouring document."""
+    import io
+
+    from multi_format_parser.parsers.xml_parser import iter_xml_documents
+
+    data = (
+        b'<?xml version="1.0"?><?xml-stylesheet href="s.xsl"?><a/><!-- end --><?pi x?>\n'
+        b'<?xml version="1.0"?><b/> <!-- c --><c/><!-- tail -->\n'
+    )
+    expected = [
+        b'<?xml version="1.0"?><?xml-stylesheet href="s.xsl"?><a/><!-- end --><?pi x?>',  # Trailing misc
+        b'<?xml version="1.0"?><b/>',
+        b'<!-- c --><c/><!-- tail -->',  # Prolog of the next document, then trailing at the end
+    ]
+    for chunk_size in (1, 5, 64, 4096):
+        assert list(iter_xml_documents(io.BytesIO(data), chunk_size)) == expected